@@ -0,0 +1,73 @@
+r"""Benchmark for writing and reading ASCII tables with
+yggdrasil.serialize.array_to_table and yggdrasil.serialize.table_to_array.
+The column based implementations are timed against reference versions of
+the previous implementations that format each row with format_message and
+parse tables with numpy.genfromtxt.
+
+Usage:
+    python scripts/benchmark_ascii_table.py [nrow]
+
+    nrow is the number of rows in the benchmark tables (default 100000).
+"""
+import io
+import sys
+import time
+import numpy as np
+from yggdrasil import serialize, tools
+
+
+def array_to_table_per_row(arrs, fmt_str):
+    r"""Reference version of array_to_table that formats each row
+    separately."""
+    dtype = serialize.cformat2nptype(fmt_str)
+    if len(dtype) == 0:
+        dtype = np.dtype([('f0', dtype)])
+    info = serialize.format2table(fmt_str)
+    comment = info.get('comment', None)
+    if comment is not None:
+        fmt_str = fmt_str.split(comment, 1)[-1]
+    arr1 = serialize.consolidate_array(arrs, dtype=dtype)
+    fmt_str = tools.str2bytes(fmt_str)
+    return b''.join([serialize.format_message(ele.tolist(), fmt_str)
+                     for ele in arr1])
+
+
+def table_to_array_genfromtxt(msg, fmt_str):
+    r"""Reference version of table_to_array that parses the table with
+    numpy.genfromtxt."""
+    dtype = serialize.cformat2nptype(fmt_str)
+    info = serialize.format2table(fmt_str)
+    np_kws = dict()
+    if info.get('delimiter', None) is not None:
+        np_kws['delimiter'] = info['delimiter']
+    if info.get('comment', None) is not None:
+        np_kws['comments'] = info['comment']
+    np_kws = tools.bytes2str(np_kws, recurse=True)
+    np_kws.update(autostrip=True, dtype=None, encoding='bytes',
+                  names=tools.bytes2str(dtype.names, recurse=True))
+    return np.genfromtxt(io.BytesIO(msg), **np_kws).astype(dtype)
+
+
+def rate(func, nrow, *args):
+    r"""Call a function and return the result and the number of rows
+    processed per second."""
+    t0 = time.perf_counter()
+    out = func(*args)
+    return out, nrow / (time.perf_counter() - t0)
+
+
+nrow = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+fmts = ['# %5s\t%ld\t%lf\t%g%+gj\n', '# %g\t%g\t%g\n', '%.1lf\t%.1lf\n']
+print('%-28s %-6s %14s %14s' % ('format', '', 'per-row', 'column'))
+for f in fmts:
+    dtype = serialize.cformat2nptype(f)
+    arr = np.ones(nrow, dtype)
+    tab_ref, write_ref = rate(array_to_table_per_row, nrow, arr, f)
+    tab, write_new = rate(serialize.array_to_table, nrow, arr, f)
+    assert tab == tab_ref
+    out_ref, read_ref = rate(table_to_array_genfromtxt, nrow, tab, f)
+    out, read_new = rate(serialize.table_to_array, nrow, tab, f)
+    np.testing.assert_array_equal(out_ref, arr)
+    np.testing.assert_array_equal(out, arr)
+    print('%-28r %-6s %10.0f r/s %10.0f r/s' % (f, 'write', write_ref, write_new))
+    print('%-28s %-6s %10.0f r/s %10.0f r/s' % ('', 'read', read_ref, read_new))
@@ -0,0 +1,473 @@
+import os
+import re
+import json
+import uuid
+import shutil
+import hashlib
+import logging
+import threading
+
+
+logger = logging.getLogger(__name__)
+_default_cache_size = 1024  # MB
+_default_cache_dir = os.path.join(os.path.expanduser('~'),
+                                  '.yggdrasil_build_cache')
+_manifest_file = 'manifest.json'
+_text_exts = ('.c', '.h', '.cc', '.cpp', '.cxx', '.c++', '.hh', '.hpp',
+              '.hxx', '.h++', '.tpp', '.ipp', '.inc', '.f', '.for', '.f77',
+              '.f90', '.f95', '.f03', '.f08', '.fi')
+_include_regex = re.compile(
+    r'^[ \t]*(?:(?:#[ \t]*include[ \t]*[<"](?P<c>[^>"]+)[>"])'
+    r'|(?:include[ \t]*[\'"](?P<f>[^\'"]+)[\'"])'
+    r'|(?:use(?:(?:[ \t]*,[ \t]*\w+[ \t]*::)|[ \t]+)[ \t]*(?P<mod>\w+)))',
+    re.MULTILINE | re.IGNORECASE)
+_file_digests = {}
+_file_digests_lock = threading.Lock()
+_build_caches = {}
+
+
+def file_digest(fname):
+    r"""Get the hash of a file's contents. Results are cached for each
+    file path, modification time, and size so that files shared between
+    compilation calls (e.g. headers) are only read once.
+
+    Args:
+        fname (str): Full path to the file.
+
+    Returns:
+        str: Hex digest of the file contents.
+
+    """
+    st = os.stat(fname)
+    key = (fname, st.st_mtime_ns, st.st_size)
+    with _file_digests_lock:
+        out = _file_digests.get(key, None)
+    if out is None:
+        h = hashlib.sha256()
+        with open(fname, 'rb') as fd:
+            for chunk in iter(lambda: fd.read(1 << 20), b''):
+                h.update(chunk)
+        out = h.hexdigest()
+        with _file_digests_lock:
+            _file_digests[key] = out
+    return out
+
+
+def file_stamp(fname):
+    r"""Get a string identifying a version of a file from its location,
+    size and modification time without reading it.
+
+    Args:
+        fname (str): Full path to the file.
+
+    Returns:
+        str: File stamp.
+
+    """
+    st = os.stat(fname)
+    return '%s:%d:%d' % (fname, st.st_size, st.st_mtime_ns)
+
+
+def parse_search_dirs(cmd, working_dir=None):
+    r"""Get the include/module and library directories from a command.
+
+    Args:
+        cmd (list): Command line arguments.
+        working_dir (str, optional): Directory that relative paths should
+            be resolved against. Defaults to None and the current working
+            directory is used.
+
+    Returns:
+        tuple(list, list, list): Include directories, library directories
+            and library names passed via -l.
+
+    """
+    if working_dir is None:
+        working_dir = os.getcwd()
+    flags = {'include': ('-I', '/I', '-J', '-isystem', '-iquote'),
+             'library': ('-L', '/LIBPATH:'),
+             'libname': ('-l',)}
+    out = {k: [] for k in flags.keys()}
+    nxt = None
+    for x in cmd:
+        if nxt is not None:
+            out[nxt].append(x)
+            nxt = None
+            continue
+        for k, v in flags.items():
+            match = [f for f in v if x.startswith(f)]
+            if match:
+                val = x[len(match[0]):]
+                if val:
+                    out[k].append(val)
+                else:
+                    nxt = k
+                break
+    for k in ['include', 'library']:
+        out[k] = [os.path.normpath(os.path.join(working_dir, x))
+                  for x in out[k]]
+    return out['include'], out['library'], out['libname']
+
+
+def find_includes(fname, include_dirs, found=None):
+    r"""Recursively locate the local files included by a source file.
+    Files that cannot be located in the source directory or one of the
+    include directories (e.g. system headers) are skipped as they are
+    covered by the compiler identity.
+
+    Args:
+        fname (str): Full path to the source file.
+        include_dirs (list): Directories to search for included files.
+        found (list, optional): Existing list that included files should
+            be added to. Defaults to None and a new list is created.
+
+    Returns:
+        list: Full paths to included files.
+
+    """
+    if found is None:
+        found = []
+    if not fname.lower().endswith(_text_exts):
+        return found
+    with open(fname, 'rb') as fd:
+        contents = fd.read().decode('latin-1')
+    search = [os.path.dirname(fname)] + include_dirs
+    for m in _include_regex.finditer(contents):
+        if m.group('mod'):
+            names = [m.group('mod').lower() + '.mod']
+        else:
+            names = [m.group('c') or m.group('f')]
+        for name, d in ((n, d) for n in names for d in search):
+            x = os.path.normpath(os.path.join(d, name))
+            if os.path.isfile(x):
+                if x not in found:
+                    found.append(x)
+                    find_includes(x, include_dirs, found=found)
+                break
+    return found
+
+
+class BuildCache(object):
+    r"""Content addressed cache of compilation products. Entries are keyed
+    by a hash of the compilation command (tool, flags and output path),
+    the compiler executable, and the contents of the sources and any local
+    files they include. Products are stored in a shared directory and the
+    least recently used entries are evicted when the cache grows larger
+    than the maximum size.
+
+    Args:
+        cache_dir (str, optional): Directory where cached products should be
+            stored. Defaults to the 'build_cache_dir' option in the
+            'compilation' section of the yggdrasil config file or
+            ~/.yggdrasil_build_cache if not set.
+        max_size (float, optional): Maximum size of the cache in MB. If 0,
+            caching is disabled. Defaults to the 'build_cache_size' option
+            in the 'compilation' section of the yggdrasil config file or
+            1024 if not set.
+
+    Attributes:
+        cache_dir (str): Directory where cached products are stored.
+        max_size (int): Maximum size of the cache in bytes.
+
+    """
+
+    def __init__(self, cache_dir=None, max_size=None):
+        from yggdrasil.config import ygg_cfg
+        if cache_dir is None:
+            cache_dir = ygg_cfg.get('compilation', 'build_cache_dir',
+                                    _default_cache_dir)
+        if max_size is None:
+            max_size = ygg_cfg.get('compilation', 'build_cache_size',
+                                   _default_cache_size)
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        self.max_size = int(float(max_size) * (1024 ** 2))
+        self.lock = threading.RLock()
+
+    @property
+    def enabled(self):
+        r"""bool: True if products should be cached."""
+        return (self.max_size > 0)
+
+    @property
+    def entries_dir(self):
+        r"""str: Directory containing cached products."""
+        return os.path.join(self.cache_dir, 'entries')
+
+    @property
+    def stamps_dir(self):
+        r"""str: Directory containing keys for built products."""
+        return os.path.join(self.cache_dir, 'stamps')
+
+    def entry_dir(self, key):
+        r"""Get the directory for a cache entry.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            str: Directory containing the products for the entry.
+
+        """
+        return os.path.join(self.entries_dir, key[:2], key)
+
+    def stamp_file(self, out):
+        r"""Get the file recording the cache key that a product was last
+        built or restored with.
+
+        Args:
+            out (str): Full path to the product.
+
+        Returns:
+            str: Full path to the stamp file.
+
+        """
+        name = hashlib.sha256(os.path.abspath(out).encode('utf-8')).hexdigest()
+        return os.path.join(self.stamps_dir, name[:2], name)
+
+    def get_key(self, cmd, sources, executable=None, working_dir=None,
+                suffix='', products=None):
+        r"""Get the cache key for a compilation command.
+
+        Args:
+            cmd (list): Compilation command line arguments.
+            sources (list): Files that are compiled/linked. Files that exist
+                are included in the key via a hash of their contents along
+                with any local files they include.
+            executable (str, optional): Full path to the tool executable.
+                Defaults to None and is ignored.
+            working_dir (str, optional): Directory that the command will
+                be run from. Defaults to None.
+            suffix (str, optional): Suffix identifying the internal library
+                configuration (e.g. the communication type). Defaults to ''.
+            products (list, optional): Files produced by the command. Unless
+                they are also sources, these are not included in the key via
+                their contents even if they are present in the command, so
+                that existing products do not change the key. Defaults to
+                None.
+
+        Returns:
+            str: Cache key.
+
+        """
+        include_dirs, library_dirs, libnames = parse_search_dirs(
+            cmd, working_dir=working_dir)
+        base = working_dir
+        if base is None:
+            base = os.getcwd()
+        exclude = [os.path.normpath(os.path.join(base, x))
+                   for x in (products or [])]
+        files = []
+        for x in list(sources) + list(cmd):
+            if ((isinstance(x, str) and os.path.isfile(x) and (x not in files)
+                 and ((x in sources)
+                      or (os.path.normpath(os.path.join(base, x))
+                          not in exclude)))):
+                files.append(x)
+        for x in list(files):
+            find_includes(x, include_dirs, found=files)
+        libraries = []
+        for name in libnames:
+            for d in library_dirs:
+                for ext in ['.a', '.so', '.dylib', '.lib', '.dll']:
+                    x = os.path.join(d, 'lib%s%s' % (name, ext))
+                    if os.path.isfile(x):
+                        libraries.append(file_stamp(x))
+        if executable and os.path.isfile(executable):
+            executable = file_stamp(executable)
+        data = {'cmd': cmd, 'executable': executable, 'suffix': suffix,
+                'working_dir': working_dir, 'libraries': libraries,
+                'files': [[x, file_digest(x)] for x in files]}
+        return hashlib.sha256(
+            json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def record(self, out, key):
+        r"""Record the key that a product was built or restored with.
+
+        Args:
+            out (str): Full path to the product.
+            key (str): Cache key.
+
+        """
+        fname = self.stamp_file(out)
+        os.makedirs(os.path.dirname(fname), exist_ok=True)
+        tmp = '%s.%s' % (fname, uuid.uuid4())
+        with open(tmp, 'w') as fd:
+            fd.write(key)
+        os.replace(tmp, fname)
+
+    def has_record(self, out):
+        r"""Determine if there is a record of the key that a product was
+        built or restored with.
+
+        Args:
+            out (str): Full path to the product.
+
+        Returns:
+            bool: True if there is a record for the product.
+
+        """
+        return os.path.isfile(self.stamp_file(out))
+
+    def is_stale(self, out, key):
+        r"""Determine if an existing product was built from different
+        inputs than those identified by a key. Products without a record
+        (e.g. those built without the cache) are assumed to be current.
+
+        Args:
+            out (str): Full path to the product.
+            key (str): Cache key for the current inputs.
+
+        Returns:
+            bool: True if the product is out of date, False otherwise.
+
+        """
+        if not self.has_record(out):
+            return False
+        with open(self.stamp_file(out), 'r') as fd:
+            return (fd.read() != key)
+
+    def restore(self, key, out):
+        r"""Copy cached products into place.
+
+        Args:
+            key (str): Cache key.
+            out (str): Full path to the primary product.
+
+        Returns:
+            bool: True if the products were restored, False if there is not
+                an entry for the key.
+
+        """
+        entry = self.entry_dir(key)
+        try:
+            with open(os.path.join(entry, _manifest_file), 'r') as fd:
+                manifest = json.load(fd)
+            out_dir = os.path.dirname(out)
+            for i, x in enumerate(manifest):
+                dst = os.path.join(out_dir, x)
+                tmp = '%s.%s' % (dst, uuid.uuid4())
+                shutil.copy(os.path.join(entry, str(i)), tmp)
+                os.replace(tmp, dst)
+            os.utime(entry)
+        except (OSError, ValueError):
+            return False
+        logger.debug("Restored %s from build cache entry %s", out, key)
+        self.record(out, key)
+        return True
+
+    def store(self, key, out, products=None):
+        r"""Add products to the cache.
+
+        Args:
+            key (str): Cache key.
+            out (str): Full path to the primary product.
+            products (list, optional): Additional products produced alongside
+                the primary product that should be cached if they exist and
+                are located in the same directory tree. Defaults to None.
+
+        """
+        self.record(out, key)
+        entry = self.entry_dir(key)
+        if os.path.isdir(entry):
+            return
+        out_dir = os.path.dirname(out)
+        manifest = []
+        for x in [out] + (products or []):
+            rel = os.path.relpath(x, out_dir)
+            if ((os.path.isfile(x) and (rel not in manifest)
+                 and (not rel.startswith(os.pardir)))):
+                manifest.append(rel)
+        tmp = os.path.join(os.path.dirname(entry), '.%s' % uuid.uuid4())
+        try:
+            os.makedirs(tmp)
+            for i, x in enumerate(manifest):
+                shutil.copy(os.path.join(out_dir, x), os.path.join(tmp, str(i)))
+            with open(os.path.join(tmp, _manifest_file), 'w') as fd:
+                json.dump(manifest, fd)
+            os.rename(tmp, entry)
+        except OSError:  # pragma: debug
+            # Another process added the entry or the cache is not writable
+            shutil.rmtree(tmp, ignore_errors=True)
+            return
+        logger.debug("Added %s to build cache entry %s", out, key)
+        self.evict()
+
+    def entries(self):
+        r"""Get the existing cache entries.
+
+        Returns:
+            list: Tuples of the last access time, size in bytes, and
+                directory for each entry.
+
+        """
+        out = []
+        if not os.path.isdir(self.entries_dir):
+            return out
+        for prefix in os.listdir(self.entries_dir):
+            for name in os.listdir(os.path.join(self.entries_dir, prefix)):
+                if name.startswith('.'):
+                    continue
+                entry = os.path.join(self.entries_dir, prefix, name)
+                try:
+                    size = sum(os.path.getsize(os.path.join(entry, x))
+                               for x in os.listdir(entry))
+                    out.append((os.path.getmtime(entry), size, entry))
+                except OSError:  # pragma: debug
+                    continue
+        return out
+
+    def size(self):
+        r"""int: Total size of cached products in bytes."""
+        return sum(x[1] for x in self.entries())
+
+    def evict(self, max_size=None):
+        r"""Remove the least recently used entries until the cache is no
+        larger than the maximum size.
+
+        Args:
+            max_size (int, optional): Size in bytes that the cache should be
+                reduced to. Defaults to None and max_size is used.
+
+        Returns:
+            int: Number of entries removed.
+
+        """
+        if max_size is None:
+            max_size = self.max_size
+        with self.lock:
+            entries = sorted(self.entries())
+            total = sum(x[1] for x in entries)
+            count = 0
+            for _, size, entry in entries:
+                if total <= max_size:
+                    break
+                shutil.rmtree(entry, ignore_errors=True)
+                total -= size
+                count += 1
+        return count
+
+    def clear(self):
+        r"""Remove all entries and records from the cache."""
+        with self.lock:
+            for x in [self.entries_dir, self.stamps_dir]:
+                shutil.rmtree(x, ignore_errors=True)
+
+
+def get_build_cache(cache_dir=None, max_size=None):
+    r"""Get the build cache for the current configuration.
+
+    Args:
+        cache_dir (str, optional): Directory where cached products should be
+            stored. Defaults to None and is determined from the config.
+        max_size (float, optional): Maximum size of the cache in MB. Defaults
+            to None and is determined from the config.
+
+    Returns:
+        BuildCache: Build cache.
+
+    """
+    cache = BuildCache(cache_dir=cache_dir, max_size=max_size)
+    key = (cache.cache_dir, cache.max_size)
+    if key not in _build_caches:
+        _build_caches[key] = cache
+    return _build_caches[key]
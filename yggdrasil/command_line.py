@@ -259,7 +259,16 @@ class yggrun(SubCommand):
     arguments = [
         (('yamlfile', ),
          {'nargs': '+',
-          'help': "One or more yaml specification files."})]
+          'help': "One or more yaml specification files."}),
+        (('--connection-task-method', ),
+         {'choices': ['thread', 'process', 'loop'], 'default': 'thread',
+          'help': ("Method that should be used to run connections. 'loop' "
+                   "runs all connections on a small number of shared "
+                   "threads (see --connection-loops).")}),
+        (('--connection-loops', ),
+         {'type': int, 'default': 1,
+          'help': ("Number of shared threads that should run connections "
+                   "when --connection-task-method is 'loop'.")})]
 
     @classmethod
     def add_arguments(cls, parser, **kwargs):
@@ -273,7 +282,9 @@ class yggrun(SubCommand):
         prog = sys.argv[0].split(os.path.sep)[-1]
         with config.parser_config(args):
             runner.run(args.yamlfile, ygg_debug_prefix=prog,
-                       production_run=args.production_run)
+                       production_run=args.production_run,
+                       connection_task_method=args.connection_task_method,
+                       connection_loops=args.connection_loops)
 
 
 class ygginfo(SubCommand):
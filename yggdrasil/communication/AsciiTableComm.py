@@ -1,12 +1,111 @@
+import numpy as np
 from yggdrasil.communication.FileComm import FileComm
 
 
 class AsciiTableComm(FileComm):
-    r"""Class for handling I/O from/to a file on disk."""
-    
+    r"""Class for handling I/O from/to a file on disk.
+
+    Args:
+        name (str): The environment variable where communication address is
+            stored.
+        chunk_size (int, optional): Maximum number of rows that should be
+            received in each message when the table is read as an array.
+            Defaults to 0 and the entire table is read at once.
+        chunk_bytes (int, optional): Maximum number of bytes that should be
+            read from the file for each message when the table is read as an
+            array. Lines are never split between messages. Defaults to 0 and
+            the entire table is read at once.
+        **kwargs: Additional keywords arguments are passed to parent class.
+
+    """
+
     _filetype = 'table'
     _schema_subtype_description = ('The file is an ASCII table that will be '
                                    'read/written one row at a time. If '
                                    '``as_array`` is ``True``, the table will '
                                    'be read/written all at once.')
+    _schema_properties = {
+        'chunk_size': {
+            'type': 'integer', 'default': 0,
+            'description': ('Maximum number of rows that should be received '
+                            'in each message when ``as_array`` is ``True``. '
+                            'If 0, the entire table is read at once.')},
+        'chunk_bytes': {
+            'type': 'integer', 'default': 0,
+            'description': ('Maximum number of bytes that should be read '
+                            'for each message when ``as_array`` is ``True``. '
+                            'If 0, the entire table is read at once.')}}
     _default_serializer = 'table'
+    _chunk_header_rows = 0
+
+    def _init_before_open(self, **kwargs):
+        r"""Get absolute path and set attributes."""
+        self._chunk_header = b''
+        super(AsciiTableComm, self)._init_before_open(**kwargs)
+
+    @property
+    def read_in_chunks(self):
+        r"""bool: True if the file contents are received as a series of
+        chunks rather than all at once."""
+        return ((self.direction == 'recv') and (self.read_meth == 'read')
+                and bool(self.chunk_size or self.chunk_bytes))
+
+    @property
+    def chunk_header_rows(self):
+        r"""int: Number of rows at the start of the table (excluding
+        comments) that must be included at the start of every chunk."""
+        return self._chunk_header_rows
+
+    def deserialize(self, *args, **kwargs):
+        r"""Deserialize a message using the associated deserializer. When
+        reading in chunks, chunks containing a single row are returned as
+        1D arrays so that all chunks have the same shape."""
+        obj, header = super(AsciiTableComm, self).deserialize(*args, **kwargs)
+        if self.read_in_chunks and isinstance(obj, list):
+            obj = [x.reshape((1, )) if (isinstance(x, np.ndarray)
+                                        and (x.ndim == 0)) else x
+                   for x in obj]
+        return obj, header
+
+    def _file_recv(self):
+        if self.read_in_chunks:
+            return self._file_recv_chunk()
+        return super(AsciiTableComm, self)._file_recv()
+
+    def _file_recv_chunk(self):
+        r"""Read the next chunk of complete lines from the table.
+
+        Returns:
+            bytes: Lines read from the file preceded by any header rows that
+                are required to parse the chunk. An empty string is returned
+                if the end of the file was reached.
+
+        """
+        nheader = 0
+        if self.file_tell() == 0:
+            self._chunk_header = b''
+            nheader = self.chunk_header_rows
+        comment = self.serializer.comment
+        lines = []
+        nrow = 0
+        nbytes = 0
+        while True:
+            line = self.fd.readline()
+            if not line:
+                break
+            nbytes += len(line)
+            if (comment and line.startswith(comment)) or (not line.strip()):
+                lines.append(line)
+                continue
+            if nheader > 0:
+                self._chunk_header += line
+                nheader -= 1
+                continue
+            lines.append(line)
+            nrow += 1
+            if ((self.chunk_size and (nrow >= self.chunk_size))
+                    or (self.chunk_bytes and (nbytes >= self.chunk_bytes))):
+                break
+        if nrow == 0:
+            return b''
+        return self._chunk_header + b''.join(lines)
@@ -1,4 +1,5 @@
 import uuid
+import collections
 from yggdrasil import multitasking
 from yggdrasil.tools import ProxyObject
 from yggdrasil.components import ComponentBaseUnregistered
@@ -24,11 +25,29 @@ class AsyncComm(ProxyObject, ComponentBaseUnregistered):
             receiving messages into the backlog. Defaults to {}.
         async_send_method (dict, optional): Keyword arguments to pass to calls
             sending message from the backlog. Defaults to {}.
+        max_backlog (int, optional): Maximum number of messages that can be
+            stored in the backlog. Defaults to 0 and the number of messages
+            is not limited.
+        max_backlog_bytes (int, optional): Maximum size (in bytes) of the
+            serialized messages stored in the backlog. Defaults to 0 and the
+            size is not limited. A message is always accepted if the backlog
+            is empty, even if it exceeds this size.
+        backlog_block (bool, optional): If True, sends will wait for space
+            in a full backlog. If False, a TemporaryCommunicationError is
+            raised when the backlog is full. Defaults to True.
         **kwargs: Additional keyword arguments are passed to CommBase.
         
     Attributes:
         backlog_ready (multitasking.Event): Event set when there is a
             message in the recv backlog.
+        backlog_space (multitasking.Event): Event set when there is space
+            in the backlog for another message.
+        recv_listeners (list): Events that should be set when a message
+            is added to the recv backlog.
+        backlog_high_water (int): Largest number of messages that have been
+            stored in the backlog at once.
+        backlog_high_water_bytes (int): Largest size (in bytes) of the
+            messages that have been stored in the backlog at once.
         
     """
 
@@ -37,18 +56,33 @@ class AsyncComm(ProxyObject, ComponentBaseUnregistered):
                  '_backlog_received_eof', '_used', '_closed',
                  'async_recv_method', 'async_send_method',
                  'async_recv_kwargs', 'async_send_kwargs',
-                 '_error_registry']
+                 '_error_registry', 'recv_listeners',
+                 'max_backlog', 'max_backlog_bytes', 'backlog_block',
+                 'backlog_space', '_backlog_nbytes',
+                 'backlog_high_water', 'backlog_high_water_bytes']
     __overrides__ = ['_input_args', '_input_kwargs']
-    _disconnect_attr = ['backlog_ready', '_backlog_thread', '_wrapped']
+    _disconnect_attr = ['backlog_ready', 'backlog_space',
+                        '_backlog_thread', '_wrapped']
     _async_kws = ['async_recv_method', 'async_send_method',
-                  'async_recv_kwargs', 'async_send_kwargs']
+                  'async_recv_kwargs', 'async_send_kwargs',
+                  'max_backlog', 'max_backlog_bytes', 'backlog_block']
 
     def __init__(self, wrapped,
                  async_recv_method='recv', async_send_method='send_message',
-                 async_recv_kwargs=None, async_send_kwargs=None):
-        self._backlog_buffer = []
+                 async_recv_kwargs=None, async_send_kwargs=None,
+                 max_backlog=0, max_backlog_bytes=0, backlog_block=True):
+        self._backlog_buffer = collections.deque()
+        self._backlog_nbytes = 0
         self._backlog_thread = None
         self.backlog_ready = multitasking.Event()
+        self.backlog_space = multitasking.Event()
+        self.backlog_space.set()
+        self.recv_listeners = []
+        self.max_backlog = max_backlog
+        self.max_backlog_bytes = max_backlog_bytes
+        self.backlog_block = backlog_block
+        self.backlog_high_water = 0
+        self.backlog_high_water_bytes = 0
         self._used_direct = False
         self.close_on_eof_recv = wrapped.close_on_eof_recv
         self._used = False
@@ -93,6 +127,10 @@ class AsyncComm(ProxyObject, ComponentBaseUnregistered):
         else:
             lines.append(
                 '%-15s: %s' % ('nrecv (backlog)', self.n_msg_backlog_recv))
+        lines += ['%-15s: %s' % ('high water (backlog)',
+                                 self.backlog_high_water),
+                  '%-15s: %s' % ('high water bytes (backlog)',
+                                 self.backlog_high_water_bytes)]
         kwargs.setdefault('extra_lines_after', [])
         kwargs['extra_lines_after'] += lines
         self._wrapped.printStatus(*args, **kwargs)
@@ -163,6 +201,9 @@ class AsyncComm(ProxyObject, ComponentBaseUnregistered):
         if self._backlog_thread is not None:
             self.backlog_thread.set_break_flag()
         self.backlog_ready.set()
+        self.backlog_space.set()
+        for event in self.recv_listeners:
+            event.set()
         if wait and (self._backlog_thread is not None):
             self.backlog_thread.wait(key=str(uuid.uuid4()))
         if hasattr(self._wrapped, '_close_backlog'):
@@ -267,27 +308,168 @@ class AsyncComm(ProxyObject, ComponentBaseUnregistered):
         if not self._wrapped.is_confirmed_send:
             return False
         return (self.n_msg_send == 0)
+
+    @property
+    def recv_poll_handle(self):
+        r"""None: Messages are received from the backlog, which cannot be
+        polled. Use add_recv_listener instead."""
+        return None
+
+    def add_recv_listener(self, event):
+        r"""Register an event that should be set when a message is added
+        to the recv backlog.
+
+        Args:
+            event (multitasking.Event): Event that should be set.
+
+        Returns:
+            bool: True if the event was registered.
+
+        """
+        with self.backlog_thread.lock:
+            self.recv_listeners.append(event)
+            if self._backlog_buffer:
+                event.set()
+        return True
+
+    def wait_for_recv(self, timeout=None):
+        r"""Wait until there is a message in the recv backlog or the
+        timeout is reached.
+
+        Args:
+            timeout (float, optional): Maximum time (in seconds) to wait.
+                Defaults to sleeptime.
+
+        Returns:
+            bool: True if there is a message available, False otherwise.
+
+        """
+        if timeout is None:
+            timeout = self.sleeptime
+        return self.backlog_ready.wait(timeout)
         
     @property
     def backlog_buffer(self):
-        r"""list: Messages that have been received."""
+        r"""collections.deque: Messages that have been received."""
         with self.backlog_thread.lock:
             return self._backlog_buffer
 
-    def add_backlog(self, payload):
+    @staticmethod
+    def backlog_item_size(payload):
+        r"""Determine the size of a serialized message in the backlog.
+
+        Args:
+            payload (tuple, CommMessage): Arguments and keyword arguments for
+                send or message from receive.
+
+        Returns:
+            int: Size of the serialized message in bytes.
+
+        """
+        msg = payload
+        if isinstance(msg, tuple):
+            msg = msg[0][0] if msg[0] else None
+        if isinstance(msg, CommBase.CommMessage):
+            msg = msg.msg
+        if isinstance(msg, bytes):
+            return len(msg)
+        elif isinstance(msg, list):
+            return sum([memoryview(x).nbytes for x in msg
+                        if isinstance(x, (bytes, memoryview))])
+        return 0
+
+    def is_backlog_full(self, nbytes=0):
+        r"""Determine if there is space in the backlog for another
+        message.
+
+        Args:
+            nbytes (int, optional): Size of the message that will be added.
+                Defaults to 0.
+
+        Returns:
+            bool: True if the backlog is full, False otherwise.
+
+        """
+        if not (self.max_backlog or self.max_backlog_bytes):
+            return False
+        with self.backlog_thread.lock:
+            nmsg = len(self._backlog_buffer)
+            if nmsg == 0:
+                return False
+            if self.max_backlog and (nmsg >= self.max_backlog):
+                return True
+            if ((self.max_backlog_bytes
+                 and ((self._backlog_nbytes + nbytes)
+                      > self.max_backlog_bytes))):
+                return True
+            return False
+
+    def wait_for_backlog_space(self, nbytes=0):
+        r"""Wait for there to be space in the backlog for another message.
+
+        Args:
+            nbytes (int, optional): Size of the message that will be added.
+                Defaults to 0.
+
+        Raises:
+            TemporaryCommunicationError: If backlog_block is False and the
+                backlog is full.
+
+        """
+        while self.is_backlog_full(nbytes):
+            if not self.backlog_block:
+                raise TemporaryCommunicationError(
+                    "Backlog is full (%d messages, %d bytes)."
+                    % (self.n_msg_backlog, self._backlog_nbytes))
+            if self._closed or not self.is_open_backlog:  # pragma: debug
+                break
+            self.periodic_debug('wait_for_backlog_space', period=1000)(
+                "Waiting for space in the backlog")
+            self.backlog_space.wait(self.sleeptime)
+
+    def add_backlog(self, payload, wait_for_space=False):
         r"""Add a message to the backlog of messages.
 
         Args:
             payload (tuple): Arguments and keyword argumetns for send
                 or data from receive.
+            wait_for_space (bool, optional): If True, the message is only
+                added once there is space for it in the backlog. The check
+                and the addition are performed while holding the backlog
+                lock so that concurrent senders cannot exceed the limit.
+                Defaults to False.
+
+        Raises:
+            TemporaryCommunicationError: If wait_for_space is True,
+                backlog_block is False, and the backlog is full.
 
         """
-        with self.backlog_thread.lock:
-            self.debug("Added message to %s backlog.",
-                       self.direction)
-            if not self._closed:
-                self._backlog_buffer.append(payload)
-                self.backlog_ready.set()
+        nbytes = self.backlog_item_size(payload)
+        while True:
+            with self.backlog_thread.lock:
+                if not (wait_for_space and self.is_backlog_full(nbytes)):
+                    self.debug("Added message to %s backlog.",
+                               self.direction)
+                    if not self._closed:
+                        self._backlog_buffer.append(payload)
+                        self._backlog_nbytes += nbytes
+                        self.backlog_high_water = max(
+                            self.backlog_high_water,
+                            len(self._backlog_buffer))
+                        self.backlog_high_water_bytes = max(
+                            self.backlog_high_water_bytes,
+                            self._backlog_nbytes)
+                        if self.is_backlog_full():
+                            self.backlog_space.clear()
+                        self.backlog_ready.set()
+                        if self.direction == 'recv':
+                            for event in self.recv_listeners:
+                                event.set()
+                    return
+            # Wait without holding the lock so that messages can be removed
+            self.wait_for_backlog_space(nbytes)
+            if self._closed or not self.is_open_backlog:  # pragma: debug
+                wait_for_space = False
 
     def pop_backlog(self):
         r"""Pop a message from the front of the backlog.
@@ -298,22 +480,34 @@ class AsyncComm(ProxyObject, ComponentBaseUnregistered):
 
         """
         with self.backlog_thread.lock:
-            out = self._backlog_buffer.pop(0)
+            out = self._backlog_buffer.popleft()
+            self._backlog_nbytes -= self.backlog_item_size(out)
             self.debug("Removed message from backlog.")
             if len(self._backlog_buffer) == 0:
                 self.backlog_ready.clear()
+            if not self.is_backlog_full():
+                self.backlog_space.set()
         return out
 
     def run_backlog_send(self):
         r"""Continue trying to send buffered messages."""
+        nprev = len(self.backlog_buffer)
         if not self.send_backlog():  # pragma: debug
             self.debug("Stopping because send_backlog failed")
             self._close_backlog()
             return
+        nback = len(self.backlog_buffer)
+        if nback and (nback < nprev):
+            # Continue immediately while messages are being sent
+            return
         self.periodic_debug('run_backlog_send', period=1000)(
             "Sleeping (is_confirmed_send=%s, n_msg_send=%d)",
             str(self.is_confirmed_send), self.n_msg_backlog_send)
-        self.sleep()
+        if nback:
+            self.sleep()
+        else:
+            # Wake as soon as a message is added to the backlog
+            self.backlog_ready.wait(self.sleeptime)
 
     def run_backlog_recv(self):
         r"""Continue buffering received messages."""
@@ -328,7 +522,13 @@ class AsyncComm(ProxyObject, ComponentBaseUnregistered):
         self.periodic_debug('run_backlog_recv', period=1000)(
             "Sleeping (is_confirmed_recv=%s)",
             str(self.is_confirmed_recv))
-        self.sleep()
+        if self._backlog_received_eof and self.close_on_eof_recv:
+            self.sleep()
+        elif self.is_backlog_full():
+            self.backlog_space.wait(self.sleeptime)
+        else:
+            # Wake as soon as a message arrives in the wrapped comm
+            self._wrapped.wait_for_recv(self.sleeptime)
 
     def send_direct(self, *args, **kwargs):
         r"""Send a message directly to the underlying comm."""
@@ -400,6 +600,9 @@ class AsyncComm(ProxyObject, ComponentBaseUnregistered):
             # Don't keep receiving, but don't close so that this thread
             # can continue confirmation until the EOF is actually received
             flag = True
+        elif self.is_backlog_full():
+            # Leave messages in the wrapped comm until there is space
+            flag = True
         else:
             async_flag, msg = self.recv_direct()
             flag = bool(async_flag)
@@ -449,7 +652,8 @@ class AsyncComm(ProxyObject, ComponentBaseUnregistered):
             async_flag = self.send_direct(msg, **kwargs)
             if async_flag != FLAG_TRYAGAIN:
                 return bool(async_flag)
-        self.add_backlog(((msg, ), kwargs))
+        payload = ((msg, ), kwargs)
+        self.add_backlog(payload, wait_for_space=True)
         self._used = True
         return True
 
@@ -553,7 +757,9 @@ class AsyncComm(ProxyObject, ComponentBaseUnregistered):
         self._wrapped.purge()
         with self.backlog_thread.lock:
             self.backlog_ready.clear()
-            self._backlog_buffer = []
+            self._backlog_buffer.clear()
+            self._backlog_nbytes = 0
+            self.backlog_space.set()
 
     # ALIASES
     def send_nolimit(self, *args, **kwargs):
@@ -564,6 +770,18 @@ class AsyncComm(ProxyObject, ComponentBaseUnregistered):
         r"""Alias for recv_nolimit on wrapped comm."""
         return CommBase.CommBase.recv_nolimit(self, *args, **kwargs)
 
+    def send_many(self, *args, **kwargs):
+        r"""Alias for send_many on wrapped comm."""
+        return CommBase.CommBase.send_many(self, *args, **kwargs)
+
+    def send_batch(self, *args, **kwargs):
+        r"""Alias for send_batch on wrapped comm."""
+        return CommBase.CommBase.send_batch(self, *args, **kwargs)
+
+    def recv_many(self, *args, **kwargs):
+        r"""Alias for recv_many on wrapped comm."""
+        return CommBase.CommBase.recv_many(self, *args, **kwargs)
+
     def send_array(self, *args, **kwargs):
         r"""Alias for send_array on wrapped comm."""
         return CommBase.CommBase.send_array(self, *args, **kwargs)
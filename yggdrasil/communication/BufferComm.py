@@ -1,3 +1,4 @@
+import time
 from yggdrasil import multitasking
 from yggdrasil.communication import CommBase, NoMessages
 
@@ -9,6 +10,7 @@ class LockedBuffer(multitasking.Queue):
         kwargs.setdefault('task_method', 'process')
         super(LockedBuffer, self).__init__(*args, **kwargs)
         self._closed = self.context.Event()
+        self._listeners = []
 
     @property
     def closed(self):
@@ -36,6 +38,49 @@ class LockedBuffer(multitasking.Queue):
     def append(self, x):
         r"""Add an element to the queue."""
         self.put_nowait(x)
+        for event in self._listeners:
+            event.set()
+
+    def add_listener(self, event):
+        r"""Register an event that should be set when an element is added
+        to the queue. Listeners are only supported for buffers shared
+        between threads.
+
+        Args:
+            event (multitasking.Event): Event that should be set.
+
+        Returns:
+            bool: True if the event was registered, False otherwise.
+
+        """
+        if self.parallel:
+            return False
+        self._listeners.append(event)
+        return True
+
+    def wait_for_item(self, timeout):
+        r"""Wait until there is an element in the queue.
+
+        Args:
+            timeout (float): Maximum time (in seconds) to wait.
+
+        Returns:
+            bool: True if there is an element in the queue, False otherwise.
+
+        """
+        if self.closed:  # pragma: debug
+            return False
+        if self.parallel:
+            # Multiprocessing queues are backed by a pipe that can be polled
+            reader = getattr(self._base, '_reader', None)
+            if reader is None:  # pragma: debug
+                time.sleep(timeout)
+                return (len(self) > 0)
+            return reader.poll(timeout)
+        with self._base.not_empty:
+            if not self._base.queue:
+                self._base.not_empty.wait(timeout)
+            return bool(self._base.queue)
 
     def pop(self, index=0, default=None):
         r"""Remove the first element from the queue."""
@@ -132,6 +177,38 @@ class BufferComm(CommBase.CommBase):
         r"""int: Number of messages in the send backlog."""
         return len(self.address)
 
+    def add_recv_listener(self, event):
+        r"""Register an event that should be set when a message becomes
+        available to receive.
+
+        Args:
+            event (multitasking.Event): Event that should be set.
+
+        Returns:
+            bool: True if the event was registered, False if the comm does
+                not support listeners.
+
+        """
+        return self.address.add_listener(event)
+
+    def wait_for_recv(self, timeout=None):
+        r"""Wait until there is a message available to receive or the
+        timeout is reached.
+
+        Args:
+            timeout (float, optional): Maximum time (in seconds) to wait.
+                Defaults to sleeptime.
+
+        Returns:
+            bool: True if there is a message available, False otherwise.
+
+        """
+        if timeout is None:
+            timeout = self.sleeptime
+        if not self.is_open:  # pragma: debug
+            return False
+        return self.address.wait_for_item(timeout)
+
     @property
     def is_confirmed_send(self):
         r"""bool: True if all sent messages have been confirmed."""
@@ -14,6 +14,11 @@ class ClientComm(CommBase.CommBase):
             comm. Defaults to empty dict.
         direct_connection (bool, optional): If True, the comm will be
             directly connected to a ServerComm. Defaults to False.
+        persistent_response (bool, optional): If True, a single response
+            comm will be created and used to receive the responses to all
+            requests, which are matched to requests via the request_id
+            header entry. If False, a new single use response comm will
+            be created for each request. Defaults to True.
         **kwargs: Additional keywords arguments are passed to the output comm.
 
     Attributes:
@@ -21,6 +26,12 @@ class ClientComm(CommBase.CommBase):
         icomm (dict): Response comms keyed to the ID of the associated request.
         icomm_order (list): Response comm keys in the order or the requests.
         ocomm (Comm): Request comm.
+        persistent_response (bool): If True, a single response comm is
+            used for all requests.
+        response_comm (Comm): Response comm used for all requests when
+            persistent_response is True.
+        response_backlog (dict): Responses received out of order keyed
+            to the ID of the associated request.
 
     """
 
@@ -29,7 +40,7 @@ class ClientComm(CommBase.CommBase):
     
     def __init__(self, name, request_commtype=None, response_kwargs=None,
                  dont_open=False, is_async=False, direct_connection=False,
-                 **kwargs):
+                 persistent_response=True, **kwargs):
         if response_kwargs is None:
             response_kwargs = dict()
         ocomm_name = name
@@ -45,6 +56,9 @@ class ClientComm(CommBase.CommBase):
         self.ocomm = get_comm(ocomm_name, **ocomm_kwargs)
         self.icomm = dict()
         self.icomm_order = []
+        self.persistent_response = persistent_response
+        self.response_comm = None
+        self.response_backlog = dict()
         self.response_kwargs.setdefault('commtype', self.ocomm._commtype)
         self.response_kwargs.setdefault('recv_timeout', self.ocomm.recv_timeout)
         self.response_kwargs.setdefault('language', self.ocomm.language)
@@ -99,6 +113,13 @@ class ClientComm(CommBase.CommBase):
     def maxMsgSize(self):
         r"""int: Maximum size of a single message that should be sent."""
         return self.ocomm.maxMsgSize
+
+    @property
+    def batch_messages(self):
+        r"""bool: True if messages sent via send_many can be packed into
+        a single batch. Each request must be paired with a response so
+        batches are not used."""
+        return False
         
     @classmethod
     def underlying_comm_class(self):
@@ -165,6 +186,8 @@ class ClientComm(CommBase.CommBase):
         self.ocomm.close(*args, **kwargs)
         for k in self.icomm_order:
             self.icomm[k].close()
+        if self.response_comm is not None:
+            self.response_comm.close()
         super(ClientComm, self).close(*args, **kwargs)
 
     @property
@@ -195,24 +218,49 @@ class ClientComm(CommBase.CommBase):
     # RESPONSE COMM
     def create_response_comm(self):
         r"""Create a response comm based on information from the last header."""
-        comm_kwargs = dict(direction='recv', is_response_client=True,
-                           single_use=True, **self.response_kwargs)
-        if comm_kwargs.get('use_async', False):
-            comm_kwargs['async_recv_method'] = 'recv_message'
         header = dict(request_id=str(uuid.uuid4()))
         while header['request_id'] in self.icomm:  # pragma: debug
             header['request_id'] += str(uuid.uuid4())
-        c = new_comm('client_response_comm.' + header['request_id'], **comm_kwargs)
+        if self.persistent_response:
+            if (self.response_comm is None) or self.response_comm.is_closed:
+                self.response_comm = self.new_response_comm(
+                    'client_response_comm.' + header['request_id'])
+            c = self.response_comm
+            header['persistent_response'] = True
+        else:
+            c = self.new_response_comm(
+                'client_response_comm.' + header['request_id'],
+                single_use=True)
         header['response_address'] = c.address
         self.icomm[header['request_id']] = c
         self.icomm_order.append(header['request_id'])
         return header
 
+    def new_response_comm(self, name, **kwargs):
+        r"""Create a new comm for receiving responses.
+
+        Args:
+            name (str): Name of the new comm.
+            **kwargs: Additional keyword arguments are passed to new_comm
+                after being added to response_kwargs.
+
+        Returns:
+            CommBase: New response comm.
+
+        """
+        comm_kwargs = dict(direction='recv', is_response_client=True,
+                           **self.response_kwargs)
+        comm_kwargs.update(kwargs)
+        if comm_kwargs.get('use_async', False):
+            comm_kwargs['async_recv_method'] = 'recv_message'
+        return new_comm(name, **comm_kwargs)
+
     def remove_response_comm(self):
         r"""Remove response comm."""
         key = self.icomm_order.pop(0)
         icomm = self.icomm.pop(key)
-        icomm.close()
+        if icomm is not self.response_comm:
+            icomm.close()
 
     # SEND METHODS
     def prepare_message(self, *args, **kwargs):
@@ -268,6 +316,8 @@ class ClientComm(CommBase.CommBase):
         """
         if len(self.icomm) == 0:  # pragma: debug
             raise RuntimeError("There are not any registered response comms.")
+        if self.icomm_order[0] in self.response_backlog:
+            return self.response_backlog.pop(self.icomm_order[0])
         out = self.icomm[self.icomm_order[0]].recv_message(*args, **kwargs)
         self.errors += self.icomm[self.icomm_order[0]].errors
         return out
@@ -287,6 +337,14 @@ class ClientComm(CommBase.CommBase):
         if len(self.icomm) == 0:  # pragma: debug
             raise RuntimeError("There are not any registered response comms.")
         msg = self.icomm[self.icomm_order[0]].finalize_message(msg, **kwargs)
+        if (((msg.flag == CommBase.FLAG_SUCCESS)
+             and isinstance(msg.header, dict)
+             and (msg.header.get('request_id', self.icomm_order[0])
+                  != self.icomm_order[0])
+             and (msg.header['request_id'] in self.icomm))):
+            # Response to a later request on a persistent response comm
+            self.response_backlog[msg.header['request_id']] = msg
+            return CommBase.CommMessage(flag=CommBase.FLAG_SKIP)
         if msg.flag in [CommBase.FLAG_SUCCESS, CommBase.FLAG_FAILURE]:
             self.remove_response_comm()
         return msg
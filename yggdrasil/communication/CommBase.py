@@ -5,6 +5,9 @@ import atexit
 import logging
 import types
 import time
+import select
+import contextlib
+import threading
 import collections
 import numpy as np
 from yggdrasil import tools, multitasking
@@ -22,6 +25,7 @@ from yggdrasil.serialize import consolidate_array
 logger = logging.getLogger(__name__)
 _registered_servers = multitasking.LockedDict(task_method='thread')
 _registered_comms = multitasking.LockedDict(task_method='thread')
+_work_index = threading.local()
 
 
 FLAG_FAILURE = 0
@@ -46,7 +50,8 @@ class CommMessage(object):
     to send/receive them.
 
     Attributes:
-        msg (bytes): The serialized message including the header.
+        msg (bytes, list): The serialized message including the header or a
+            list of frames that should be sent together as one message.
         length (int): The size of the message.
         flag (int): Indicates the result of processing the message. Values are:
             FLAG_FAILURE: Processing was unsuccessful.
@@ -63,12 +68,16 @@ class CommMessage(object):
             comm as the original message had to be split due to its size.
         sent (bool): True if the message has been sent, False otherwise.
         singular (bool): True if there was only one argument.
+        serialized (bool): True if args is a serialized message (including
+            the header) that was not decoded on receipt and can be forwarded
+            without being serialized again.
 
     """
 
     __slots__ = ['msg', 'length', 'flag', 'args', 'header',
                  'additional_messages', 'worker', 'worker_messages',
-                 'sent', 'finalized', 'singular', 'stype', 'sinfo']
+                 'sent', 'finalized', 'singular', 'stype', 'sinfo',
+                 'serialized']
 
     def __init__(self, msg=None, length=0, flag=None, args=None, header=None):
         self.msg = msg
@@ -84,6 +93,7 @@ class CommMessage(object):
         self.singular = False
         self.stype = None
         self.sinfo = None
+        self.serialized = False
 
     def __str__(self):
         return 'CommMessage(flag=%s, %.100s..., sent=%s)' % (
@@ -149,6 +159,48 @@ class CommMessage(object):
         return out
 
 
+def wait_for_handles(handles, timeout):
+    r"""Wait until at least one of a set of pollable objects has a message
+    waiting.
+
+    Args:
+        handles (list): Tuples containing an object that can be polled for
+            incoming messages (a ZeroMQ socket or a file descriptor) and
+            a lock that should be held while polling the object (or None).
+        timeout (float): Maximum time (in seconds) to wait.
+
+    Returns:
+        bool: True if there is a message waiting on any of the objects,
+            False otherwise.
+
+    """
+    if not handles:
+        time.sleep(timeout)
+        return False
+    errors = (OSError, ValueError)
+    zmq = None
+    if any(type(h).__module__.startswith('zmq') for h, _ in handles):
+        # ZeroMQ sockets can only be polled by a ZeroMQ poller, which
+        # also accepts file descriptors
+        import zmq
+        errors += (zmq.ZMQError, )
+    with contextlib.ExitStack() as stack:
+        for _, lock in handles:
+            if lock is not None:
+                stack.enter_context(lock)
+        try:
+            if zmq is not None:
+                poller = zmq.Poller()
+                for h, _ in handles:
+                    poller.register(h, zmq.POLLIN)
+                return bool(poller.poll(timeout=int(1000 * timeout)))
+            return bool(select.select([h for h, _ in handles],
+                                      [], [], timeout)[0])
+        except errors:  # pragma: debug
+            # Closed sockets/files are handled by the caller
+            return False
+
+
 def is_registered(commtype, key):
     r"""Determine if a comm object has been registered under the specified key.
     
@@ -462,6 +514,9 @@ class CommBase(tools.YggClass):
         _maxMsgSize (int): Maximum size of a single message that should be sent.
         address_description (str): Description of the information constituting
             an address for this communication mechanism.
+        _transport_header_keys (list): Header keys describing how a message
+            was sent by a comm that are removed when a serialized message is
+            forwarded by another comm.
 
     Attributes:
         name (str): The environment variable where communication address is
@@ -497,6 +552,10 @@ class CommBase(tools.YggClass):
         send_converter (func): Converter that should be used on sent objects.
         filter (:class:.FilterBase): Callable class that will be used to determine when
             messages should be sent/received.
+        binary_payload (bool): If True, array data in sent messages is
+            appended to the message as raw bytes rather than being base64
+            encoded. This is only enabled when the partner comm is known to
+            deserialize messages in Python.
 
     Raises:
         RuntimeError: If the comm class is not installed.
@@ -573,6 +632,7 @@ class CommBase(tools.YggClass):
                             'skip_processing', 'skip_language2python',
                             'after_prepare_message']
     _finalize_message_kws = ['skip_python2language', 'after_finalize_message']
+    _transport_header_keys = ['address', 'id', 'incomplete']
 
     def __init__(self, name, address=None, direction='send', dont_open=False,
                  is_interface=None, language=None, partner_copies=0,
@@ -662,12 +722,16 @@ class CommBase(tools.YggClass):
         self._server_kwargs = {}
         self._send_serializer = True
         self.allow_multiple_comms = allow_multiple_comms
-        if (((not self.single_use)
+        if (((not (self.single_use or self.is_response_client
+                   or self.is_response_server))
              and ((self.is_interface and os.environ.get('YGG_THREADING', False))
                   or (self.model_copies > 1) or (self.partner_copies > 1)))):
             self.allow_multiple_comms = True
         if self.single_use and (not self.is_response_server):
             self._send_serializer = False
+        self.binary_payload = ((self.partner_language == 'python')
+                               and (self.is_interface
+                                    or (self.partner_model is not None)))
         self.create_proxy = ((self.is_client or self.allow_multiple_comms)
                              and (not self.is_interface)
                              and (self.direction != 'recv'))
@@ -685,6 +749,7 @@ class CommBase(tools.YggClass):
         self._eof_sent = multitasking.Event()
         self._iterator_backlog = None
         self._field_backlog = dict()
+        self._recv_batch = collections.deque()
         if self.single_use:
             self._eof_sent.set()
         if self.is_response_client or self.is_response_server:
@@ -967,6 +1032,27 @@ class CommBase(tools.YggClass):
         r"""int: Number of copies of the model using the comm."""
         return int(os.environ.get('YGG_MODEL_COPIES', '1'))
 
+    @property
+    def tracks_work_index(self):
+        r"""bool: True if the work index of messages received by a copy of a
+        model should be attached to the messages it sends so that the order
+        of the inputs can be restored by an ordered connection."""
+        return self.is_interface and (self.model_copies > 1)
+
+    def get_work_index(self):
+        r"""Get the work index of the last message received in the current
+        thread by a comm belonging to a copy of a model.
+
+        Returns:
+            int: Work index assigned to the message by the connection that
+                distributed it between the model copies, None if there is
+                not one.
+
+        """
+        if not self.tracks_work_index:
+            return None
+        return getattr(_work_index, 'value', None)
+
     @classmethod
     def underlying_comm_class(cls):
         r"""str: Name of underlying communication class."""
@@ -1316,13 +1402,67 @@ class CommBase(tools.YggClass):
     @property
     def n_msg_recv_drain(self):
         r"""int: The number of incoming messages in the connection to drain."""
-        return self.n_msg_recv
+        return self.n_msg_recv + len(self._recv_batch)
+
+    @property
+    def recv_poll_handle(self):
+        r"""tuple: Object that can be polled for incoming messages (a
+        ZeroMQ socket or file descriptor) and the lock that should be held
+        while polling it. None if the comm cannot be polled."""
+        return None
+
+    def add_recv_listener(self, event):
+        r"""Register an event that should be set when a message becomes
+        available to receive.
+
+        Args:
+            event (multitasking.Event): Event that should be set.
+
+        Returns:
+            bool: True if the event was registered, False if the comm does
+                not support listeners.
+
+        """
+        return False
+
+    def wait_for_recv(self, timeout=None):
+        r"""Wait until there is a message available to receive or the
+        timeout is reached. Comms that cannot be polled sleep for the
+        duration of the timeout.
+
+        Args:
+            timeout (float, optional): Maximum time (in seconds) to wait.
+                Defaults to sleeptime.
+
+        Returns:
+            bool: True if there is a message available, False otherwise.
+
+        """
+        if self._recv_batch:
+            return True
+        if timeout is None:
+            timeout = self.sleeptime
+        handle = self.recv_poll_handle
+        if handle is None:
+            self.sleep(timeout)
+            return False
+        return wait_for_handles([handle], timeout)
 
     @property
     def n_msg_send_drain(self):
         r"""int: The number of outgoing messages in the connection to drain."""
         return self.n_msg_send
 
+    @property
+    def batch_messages(self):
+        r"""bool: True if messages sent via send_many can be packed into
+        a single batch that the partner comm will unpack."""
+        return (self.binary_payload
+                and not (self.no_serialization or self.is_file
+                         or self.single_use or self.is_client
+                         or self.is_server or self.is_response_client
+                         or self.is_response_server))
+
     @property
     def eof_msg(self):
         r"""str: Message indicating EOF."""
@@ -1509,9 +1649,11 @@ class CommBase(tools.YggClass):
             msg (str, bytes): Raw message bytes to be chunked.
 
         Returns:
-            str: Chunks of message.
+            memoryview: Chunks of message that reference the original
+                message without copying it.
 
         """
+        msg = memoryview(msg)
         prev = 0
         while prev < len(msg):
             next = min(prev + self.maxMsgSize, len(msg))
@@ -1755,6 +1897,7 @@ class CommBase(tools.YggClass):
                           (self._send_serializer and (not self.is_file)))
         kwargs.setdefault('no_metadata', self.is_file)
         kwargs.setdefault('max_header_size', self.maxMsgSize)
+        kwargs.setdefault('binary_payload', self.binary_payload)
         return self.serializer.serialize(*args, **kwargs)
 
     def deserialize(self, *args, **kwargs):
@@ -1839,7 +1982,7 @@ class CommBase(tools.YggClass):
         else:  # pragma: debug
             raise Exception("Unrecognized message flag: %s" % msg.flag)
         self.special_debug('Sending %d bytes to %s', msg.length, self.address)
-        if self.maxMsgSize != 0:
+        if (self.maxMsgSize != 0) and (not isinstance(msg.msg, list)):
             assert(msg.length <= self.maxMsgSize)
         try:
             if skip_safe_send:
@@ -1943,6 +2086,11 @@ class CommBase(tools.YggClass):
                 if header_kwargs is None:
                     header_kwargs = {}
                 header_kwargs.setdefault('model', self.model_name)
+            work_index = self.get_work_index()
+            if work_index is not None:
+                if header_kwargs is None:
+                    header_kwargs = {}
+                header_kwargs.setdefault('work_index', work_index)
             msg = CommMessage(args=args, header=header_kwargs,
                               flag=FLAG_SUCCESS)
             # 1. Convert the message based on the language
@@ -1995,6 +2143,16 @@ class CommBase(tools.YggClass):
                     x.msg = x.args
                     x.length = 1
                     x.flag = FLAG_SUCCESS
+                elif x.serialized:
+                    # Header information describing how the message was
+                    # sent by the previous comm is replaced
+                    header, body = self.serializer.update_header(
+                        x.args, header_kwargs=x.header,
+                        max_header_size=self.maxMsgSize,
+                        remove_keys=self._transport_header_keys)
+                    x.msg = header + body
+                    x.length = len(x.msg)
+                    x.flag = FLAG_SUCCESS
                 else:
                     if x.flag == FLAG_EOF:
                         if x.header:
@@ -2006,28 +2164,43 @@ class CommBase(tools.YggClass):
                         x.msg = self.serialize(x.args, header_kwargs=x.header)
                         x.flag = FLAG_SUCCESS
                     x.length = len(x.msg)
-                # 8. Create a work comm if the message is too large to be sent all
-                #    at once and re-serialize the message w/ the work comm info in it
+                # 8. Split the message if it is too large to be sent all at once
                 if (x.length > self.maxMsgSize) and (self.maxMsgSize != 0):
-                    if x.flag == FLAG_EOF:  # pragma: debug
-                        raise NotImplementedError(("EOF message with header (%d) "
-                                                   "exceeds max message size (%d).")
-                                                  % (msg.length, self.maxMsgSize))
-                    if x.header is None:
-                        x.header = dict()
-                    x.worker = self.create_work_comm()
-                    # if 'address' not in x.header:
-                    #     x.worker = self.create_work_comm()
-                    # else:
-                    #     x.worker = self.get_work_comm(x.header)
-                    x.header = self.workcomm2header(x.worker, **x.header)
-                    total = self.serialize(x.args, header_kwargs=x.header)
-                    x.msg = total[:self.maxMsgSize]
-                    x.length = len(x.msg)
-                    for imsg in self.chunk_message(total[self.maxMsgSize:]):
-                        x.add_worker_message(msg=imsg, length=len(imsg))
+                    self.prepare_large_message(x)
         return msg
 
+    def prepare_large_message(self, msg):
+        r"""Prepare a message that is too large to be sent all at once by
+        creating a work comm that the remainder of the message will be sent
+        through and updating the message header w/ the work comm info in it
+        (the encoded body is reused).
+
+        Args:
+            msg (CommMessage): Serialized message that exceeds maxMsgSize.
+
+        Raises:
+            NotImplementedError: If msg is an EOF message.
+
+        """
+        if msg.flag == FLAG_EOF:  # pragma: debug
+            raise NotImplementedError(("EOF message with header (%d) "
+                                       "exceeds max message size (%d).")
+                                      % (msg.length, self.maxMsgSize))
+        if msg.header is None:
+            msg.header = dict()
+        msg.worker = self.create_work_comm()
+        msg.header = self.workcomm2header(msg.worker, **msg.header)
+        header, body = self.serializer.update_header(
+            msg.msg, header_kwargs=msg.header,
+            max_header_size=self.maxMsgSize)
+        msg.msg = header[:self.maxMsgSize]
+        nfirst = self.maxMsgSize - len(msg.msg)
+        msg.msg += body[:nfirst]
+        msg.length = len(msg.msg)
+        for part in [header[self.maxMsgSize:], body[nfirst:]]:
+            for imsg in self.chunk_message(part):
+                msg.add_worker_message(msg=imsg, length=len(imsg))
+
     def send(self, *args, **kwargs):
         r"""Send a message.
 
@@ -2063,6 +2236,155 @@ class CommBase(tools.YggClass):
         """
         return self.send(self.eof_msg, *args, **kwargs)
 
+    def send_many(self, iterable, **kwargs):
+        r"""Send several messages. If batch_messages is True, the messages
+        are packed into batches that are each sent as a single message
+        with one header and unpacked by the receiving comm. Header
+        information shared by all of the messages in a batch (e.g. the
+        datatype) is only included once. Filters, transforms, and EOF
+        messages are handled for each message in the same way as send.
+
+        Args:
+            iterable (iterable): Messages that should be sent. Each element
+                is treated as the single argument to send.
+            **kwargs: All keywords arguments are passed to prepare_message or
+                send_message.
+
+        Returns:
+            bool: Success or failure of sending the messages.
+
+        """
+        self.precheck('send')
+        if not self.batch_messages:
+            for x in iterable:
+                if not self.send(x, **kwargs):
+                    return False
+            return True
+        kws_prepare = {k: kwargs.pop(k) for k in self._prepare_message_kws
+                       if k in kwargs}
+        kws_prepare['skip_serialization'] = True
+        batch_id = str(uuid.uuid4())
+        batch = []
+        nbytes = 0
+        for x in iterable:
+            msg = self.prepare_message(x, **kws_prepare)
+            if msg.flag == FLAG_SKIP:
+                continue
+            if msg.flag == FLAG_EOF:
+                if not self.send_batch(batch, **kwargs):  # pragma: debug
+                    return False
+                batch = []
+                nbytes = 0
+                if not self.send_message(self.prepare_message(
+                        msg, skip_processing=True), **kwargs):
+                    return False
+                continue
+            for imsg in [msg] + msg.additional_messages:
+                imsg.msg = self.serialize(
+                    imsg.args, header_kwargs=dict(imsg.header or {},
+                                                  id=batch_id))
+                imsg.length = len(imsg.msg)
+                if (((self.maxMsgSize != 0) and batch
+                     and ((nbytes + imsg.length) > self.maxMsgSize))):
+                    if not self.send_batch(batch, **kwargs):  # pragma: debug
+                        return False
+                    batch = []
+                    nbytes = 0
+                batch.append(imsg)
+                nbytes += imsg.length
+        return self.send_batch(batch, **kwargs)
+
+    def send_batch(self, batch, **kwargs):
+        r"""Send a set of serialized messages as a single message. The
+        header of the batch contains the header information shared by all
+        of the messages, the information that differs for each message,
+        and the size of each message body.
+
+        Args:
+            batch (list): CommMessage objects for serialized messages that
+                should be sent together.
+            **kwargs: Additional keyword arguments are passed to send_message.
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        if not batch:
+            return True
+        if len(batch) == 1:
+            msg = CommMessage(args=batch[0].msg, flag=FLAG_SUCCESS)
+        else:
+            items = [self.serializer.split_header(x.msg) for x in batch]
+            shared = {k: v for k, v in items[0][0].items()
+                      if (k != 'size') and all(
+                          (k in x[0]) and (x[0][k] == v) for x in items[1:])}
+            header = {'batch_sizes': [len(x[1]) for x in items],
+                      'batch_header': shared,
+                      'raw': True, 'id': str(uuid.uuid4())}
+            extra = [{k: v for k, v in x[0].items()
+                      if (k != 'size') and (k not in shared)}
+                     for x in items]
+            if any(extra):
+                header['batch_metadata'] = extra
+            body = b''.join([x[1] for x in items])
+            msg = CommMessage(
+                args=(self.serializer.encoded_datatype.serialize_header(
+                    header, len(body)) + body),
+                flag=FLAG_SUCCESS)
+        msg.serialized = True
+        msg = self.prepare_message(msg, skip_processing=True)
+        return self.send_message(msg, **kwargs)
+
+    def unpack_batch(self, msg):
+        r"""Split a received batch message into the messages it contains.
+
+        Args:
+            msg (CommMessage): Received batch message with the concatenated
+                message bodies as args.
+
+        Returns:
+            list: CommMessage objects for each message body in the batch
+                with the header information for the message.
+
+        """
+        out = []
+        start = 0
+        sizes = msg.header['batch_sizes']
+        extra = msg.header.get('batch_metadata', [{}] * len(sizes))
+        for size, iextra in zip(sizes, extra):
+            header = dict(msg.header['batch_header'], **iextra)
+            header['size'] = size
+            out.append(CommMessage(msg=msg.args[start:(start + size)],
+                                   header=header, flag=FLAG_SUCCESS))
+            start += size
+        return out
+
+    def decode_batch_message(self, msg, dont_decode=False):
+        r"""Deserialize a message from a received batch.
+
+        Args:
+            msg (CommMessage): Message returned by unpack_batch.
+            dont_decode (bool, optional): If True, the message will not be
+                decoded and the serialized message (including a header) will
+                be returned as the message arguments. Defaults to False.
+
+        Returns:
+            CommMessage: Deserialized message.
+
+        """
+        if dont_decode:
+            msg.serialized = not (msg.header.get('raw', False)
+                                  or (msg.header['size'] == 0))
+        if msg.serialized:
+            msg.msg = (self.serializer.encoded_datatype.serialize_header(
+                msg.header, msg.header['size']) + msg.msg)
+            msg.args = msg.msg
+        else:
+            msg.args, msg.header = self.deserialize(msg.msg,
+                                                    metadata=msg.header)
+        self.update_message_from_serializer(msg)
+        return msg
+
     # RECV METHODS
     def _safe_recv(self, timeout=None, **kwargs):
         r"""Safe receive that does things for all comm classes."""
@@ -2129,13 +2451,19 @@ class CommBase(tools.YggClass):
             out = (bool(msg.flag), msg.args)
         return out
 
-    def recv_message(self, *args, skip_deserialization=False, **kwargs):
+    def recv_message(self, *args, skip_deserialization=False, dont_decode=False,
+                     **kwargs):
         r"""Receive a message.
 
         Args:
             *args: Arguments are passed to _safe_recv.
             skip_deserialization (bool, optional): If True, deserialization is not
                 performed. Defaults to False.
+            dont_decode (bool, optional): If True, only the header of complete
+                messages will be parsed and the serialized message will be
+                returned as the message arguments so that it can be forwarded
+                without being decoded. Incomplete, raw (e.g. EOF), and empty
+                messages are still deserialized. Defaults to False.
             **kwargs: Additional keyword arguments are passed to _safe_recv.
 
         Returns:
@@ -2143,6 +2471,9 @@ class CommBase(tools.YggClass):
 
         """
         no_serialization = (skip_deserialization or self.no_serialization)
+        if self._recv_batch:
+            return self.annotate_recv_message(self.decode_batch_message(
+                self._recv_batch.popleft(), dont_decode=dont_decode))
         if self.is_closed:
             self.debug('Comm closed')
             return CommMessage(flag=FLAG_FAILURE)
@@ -2160,7 +2491,15 @@ class CommBase(tools.YggClass):
                 if isinstance(msg.msg, bytes):
                     msg.header['size'] = len(msg.msg)
             else:
-                msg.args, msg.header = self.deserialize(msg.msg)
+                if dont_decode:
+                    msg.header = self.serializer.parse_header(msg.msg)
+                    msg.serialized = not (msg.header.get('incomplete', False)
+                                          or msg.header.get('raw', False)
+                                          or (msg.header['size'] == 0))
+                if msg.serialized:
+                    msg.args = msg.msg
+                else:
+                    msg.args, msg.header = self.deserialize(msg.msg)
             msg.flag = FLAG_SUCCESS
             if msg.header.get('incomplete', False):
                 msg.msg = msg.args
@@ -2183,7 +2522,12 @@ class CommBase(tools.YggClass):
                                                                 metadata=msg.header)
                     msg.flag = FLAG_SUCCESS
                 msg.worker.linger_close()
-            if not no_serialization:
+            if (((not no_serialization) and (msg.flag == FLAG_SUCCESS)
+                 and ('batch_sizes' in msg.header))):
+                self._recv_batch.extend(self.unpack_batch(msg))
+                msg = self.decode_batch_message(self._recv_batch.popleft(),
+                                                dont_decode=dont_decode)
+            elif not no_serialization:
                 self.update_message_from_serializer(msg)
         except TemporaryCommunicationError if self.is_async else NeverMatch:
             raise
@@ -2191,6 +2535,18 @@ class CommBase(tools.YggClass):
             self.exception('Failed to recv.')
             self.close()
             return CommMessage(flag=FLAG_FAILURE)
+        return self.annotate_recv_message(msg)
+
+    def annotate_recv_message(self, msg):
+        r"""Set the length, flag, and commtype of a received message.
+
+        Args:
+            msg (CommMessage): Received message.
+
+        Returns:
+            CommMessage: Annotated message.
+
+        """
         if isinstance(msg.msg, bytes):
             msg.length = len(msg.msg)
         else:
@@ -2213,7 +2569,7 @@ class CommBase(tools.YggClass):
             3. python2language
             4. Close comm on EOF if close_on_eof_recv set
             5. Check for empty recv after processing
-            6. Mark comm as used and close if single use
+            6. Mark comm as used, close if single use, and record the work index
             7. Apply after_finalize_message functions
 
         Args:
@@ -2257,12 +2613,14 @@ class CommBase(tools.YggClass):
             msg.flag = FLAG_EMPTY
         # if not (self.is_empty(msg.msg, self.empty_bytes_msg)
         #         or msg.header.get('incomplete', False)):
-        # 6. Mark comm as used and close if single use
+        # 6. Mark comm as used, close if single use, and record the work index
         if msg.flag in [FLAG_EOF, FLAG_SUCCESS]:
             self._used = True
         if self.single_use and self._used and self.is_open:
             self.debug('Linger close on single use')
             self.linger_close(active_confirm=self.is_async)
+        if (msg.flag == FLAG_SUCCESS) and self.tracks_work_index:
+            _work_index.value = (msg.header or {}).get('work_index', None)
         # 7. Apply after_finalize_message functions
         if after_finalize_message:
             for x in after_finalize_message:
@@ -2274,6 +2632,39 @@ class CommBase(tools.YggClass):
         r"""Alias for recv."""
         return self.recv(*args, **kwargs)
 
+    def recv_many(self, max_n=None, timeout=None, **kwargs):
+        r"""Receive several messages, waiting for the first one and then
+        collecting those that are already available (e.g. the remainder
+        of a batch sent using send_many).
+
+        Args:
+            max_n (int, optional): Maximum number of messages that should be
+                returned. Defaults to None and all of the available messages
+                are returned.
+            timeout (float, optional): Time (in seconds) that should be waited
+                for the first message. Defaults to None and recv_timeout is
+                used.
+            **kwargs: Additional keyword arguments are passed to recv.
+
+        Returns:
+            tuple (bool, list): Success or failure of receive and the received
+                messages. Receipt stops after an EOF message.
+
+        """
+        out = []
+        kwargs['timeout'] = timeout
+        while (max_n is None) or (len(out) < max_n):
+            flag, msg = self.recv(**kwargs)
+            if (not flag) or self.is_empty_recv(msg):
+                if not out:
+                    return (flag, out)
+                break
+            out.append(msg)
+            if self.is_eof(msg):
+                break
+            kwargs['timeout'] = 0
+        return (True, out)
+
     def drain_server_signon_messages(self, **kwargs):
         r"""Drain server signon messages. This should only be used
         for testing purposes."""
@@ -2304,6 +2695,7 @@ class CommBase(tools.YggClass):
 
     def purge(self):
         r"""Purge all messages from the comm."""
+        self._recv_batch.clear()
         if self.direction == 'recv':
             while self.n_msg_recv > 0:  # pragma: debug
                 self.recv(skip_deserialization=True)
@@ -131,6 +131,12 @@ class FileComm(CommBase.CommBase):
         valid file."""
         return self.serializer.concats_as_str
             
+    @property
+    def read_in_chunks(self):
+        r"""bool: True if the file contents are received as a series of
+        chunks rather than all at once."""
+        return False
+
     @staticmethod
     def before_registration(cls):
         r"""Operations that should be performed to modify class attributes prior
@@ -712,7 +718,8 @@ class FileComm(CommBase.CommBase):
                     # Exclude comments
                     flag, out = self._recv()
                 elif (((self.read_meth == 'read') and (prev_pos > 0)
-                       and (not self.concats_as_str))):
+                       and (not self.concats_as_str)
+                       and (not self.read_in_chunks))):
                     # Rewind file and read entire contents if data was added to
                     # the file type using a serialization method that dosn't
                     # concatenate
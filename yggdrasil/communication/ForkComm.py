@@ -1,27 +1,147 @@
 import copy
+import json
+import time
+import collections
+from yggdrasil import multitasking
 from yggdrasil.communication import CommBase, get_comm, import_comm
 
 
 _address_sep = ':YGG_ADD:'
+_distributions = ['broadcast', 'scatter', 'round_robin', 'least_loaded']
 
 
 class ForkedCommMessage(CommBase.CommMessage):
-    r"""Class for forked comm messages."""
+    r"""Class for forked comm messages. Comms that share the same serializer
+    state receive the same serialized message body, with only the header
+    updated for each comm. Messages are only copied for comms that could
+    modify them (e.g. those with transforms).
+
+    Args:
+        msg (CommMessage): Message prepared by the fork comm.
+        comm_list (list): Comms in the fork.
+        targets (list, optional): Indices of the comms in comm_list that the
+            message will be sent to. Defaults to None and the message is
+            sent to all of the comms.
+        **kwargs: Additional keyword arguments are passed to the
+            prepare_message methods of the comms.
+
+    """
 
     __slots__ = ['orig']
 
-    def __init__(self, msg, comm_list, **kwargs):
+    def __init__(self, msg, comm_list, targets=None, **kwargs):
         super(ForkedCommMessage, self).__init__(
             msg=msg.msg, length=msg.length, flag=msg.flag,
             args=msg.args, header=msg.header)
         for k in CommBase.CommMessage.__slots__:
             setattr(self, k, getattr(msg, k))
-        args = {i: x.prepare_message(copy.deepcopy(msg), **kwargs)
-                for i, x in enumerate(comm_list)}
+        args = {}
+        shared = collections.OrderedDict()
+        if targets is None:
+            targets = range(len(comm_list))
+        for i in targets:
+            x = comm_list[i]
+            mode = get_broadcast_mode(x, msg, **kwargs)
+            if mode == 'copy':
+                args[i] = x.prepare_message(copy.deepcopy(msg), **kwargs)
+            elif mode == 'single':
+                args[i] = x.prepare_message(copy_message(msg), **kwargs)
+            else:
+                shared.setdefault(get_broadcast_key(x), []).append(i)
+        for idx in shared.values():
+            if len(idx) == 1:
+                i = idx[0]
+                args[i] = comm_list[i].prepare_message(copy_message(msg),
+                                                       **kwargs)
+                continue
+            body = comm_list[idx[0]].serialize(
+                msg.args, header_kwargs=copy.deepcopy(msg.header))
+            kws = dict(kwargs, skip_processing=True)
+            for i in idx:
+                x = comm_list[i]
+                x.serializer.initialize_from_message(
+                    msg.args, **copy.deepcopy(msg.header or {}))
+                imsg = copy_message(msg)
+                imsg.args = body
+                imsg.serialized = True
+                args[i] = x.prepare_message(imsg, **kws)
         self.orig = msg.args
         self.args = args
 
 
+def copy_message(msg):
+    r"""Create a shallow copy of a message that can be prepared by a comm
+    without altering the original. The message arguments are not copied.
+
+    Args:
+        msg (CommMessage): Message to copy.
+
+    Returns:
+        CommMessage: Copy of the message.
+
+    """
+    out = copy.copy(msg)
+    out.header = copy.deepcopy(msg.header)
+    out.additional_messages = []
+    out.worker_messages = []
+    return out
+
+
+def get_broadcast_mode(comm, msg, after_prepare_message=None,
+                       skip_serialization=False, skip_processing=False,
+                       **kwargs):
+    r"""Determine how a message should be prepared for one of the comms in
+    a fork.
+
+    Args:
+        comm (CommBase): Comm that the message will be sent to.
+        msg (CommMessage): Message prepared by the fork comm.
+        after_prepare_message (list, optional): Functions that will be
+            applied to the message by the comm. Defaults to None.
+        skip_serialization (bool, optional): If True, the message will not
+            be serialized. Defaults to False.
+        skip_processing (bool, optional): If True, the message will not be
+            processed by the comm. Defaults to False.
+        **kwargs: Additional keyword arguments are ignored.
+
+    Returns:
+        str: 'copy' if the comm could modify the message or pass it to the
+            receiver without serializing it so it must receive a deep copy,
+            'single' if the comm must prepare the message itself, or 'shared'
+            if the serialized message can be shared with other comms that
+            have the same broadcast key (see get_broadcast_key).
+
+    """
+    if ((comm.transform or comm.no_serialization or after_prepare_message
+         or skip_serialization or (msg.sinfo is not None)
+         or (msg.flag != CommBase.FLAG_SUCCESS) or msg.additional_messages)):
+        return 'copy'
+    if msg.serialized or comm.filter or comm.is_file or skip_processing:
+        return 'single'
+    return 'shared'
+
+
+def get_broadcast_key(comm):
+    r"""Get a key identifying the options that determine how a comm
+    serializes messages so that comms with the same key will produce the
+    same serialized message body.
+
+    Args:
+        comm (CommBase): Comm to get the key for.
+
+    Returns:
+        tuple: Comm and serializer classes along with the serialization
+            options and serializer state.
+
+    """
+    state = json.dumps([comm.serializer.initialized,
+                        comm.serializer.serializer_info,
+                        comm.serializer.typedef],
+                       sort_keys=True, default=str)
+    return (type(comm), type(comm.serializer), comm._send_serializer,
+            comm.maxMsgSize, comm.binary_payload, state)
+
+
 def get_comm_name(name, i):
     r"""Get the name of the ith comm in the series.
 
@@ -44,11 +164,29 @@ class ForkComm(CommBase.CommBase):
             stored.
         comm_list (list, optional): The list of options for the comms that
             should be bundled. If not provided, the bundle will be empty.
+        distribution (str, optional): How sent messages should be divided
+            between the comms. Options are:
+                'broadcast': Every message is sent to all of the comms.
+                'scatter': Each message is sent to a single comm that does
+                    not have any queued messages, waiting for one to become
+                    idle (up to the timeout) if necessary.
+                'round_robin': Each message is sent to the next comm in turn.
+                'least_loaded': Each message is sent to the comm with the
+                    fewest queued messages.
+            Messages sent to a single comm are tagged with a 'work_index'
+            header entry that can be used to restore their order. EOF
+            messages are always sent to all of the comms. Defaults to
+            'broadcast'.
         **kwargs: Additional keyword arguments are passed to the parent class.
 
     Attributes:
         comm_list (list): Comms included in this fork.
+        distribution (str): How sent messages are divided between the comms.
+        work_index (int): Index that will be assigned to the next message
+            sent to a single comm.
         curr_comm_index (int): Index comm that next receive will be from.
+        recv_ready (multitasking.Event): Event set by comms in the fork
+            that support listeners when they have a message available.
 
     """
 
@@ -57,13 +195,24 @@ class ForkComm(CommBase.CommBase):
     child_keys = ['serializer_class', 'serializer_kwargs',  # 'datatype',
                   'format_str', 'field_names', 'field_units', 'as_array']
     noprop_keys = ['send_converter', 'recv_converter', 'filter', 'transform']
+    _disconnect_attr = (CommBase.CommBase._disconnect_attr
+                        + ['recv_ready'])
     
-    def __init__(self, name, comm_list=None, is_async=False, **kwargs):
+    def __init__(self, name, comm_list=None, is_async=False,
+                 distribution='broadcast', **kwargs):
         child_kwargs = {k: kwargs.pop(k) for k in self.child_keys if k in kwargs}
         noprop_kwargs = {k: kwargs.pop(k) for k in self.noprop_keys if k in kwargs}
         self.comm_list = []
+        if distribution not in _distributions:
+            raise ValueError("Unsupported distribution '%s'. Options are %s."
+                             % (distribution, _distributions))
         self.curr_comm_index = 0
+        self.distribution = distribution
+        self.work_index = 0
+        self._next_send_index = 0
         self.eof_recv = []
+        self.recv_ready = multitasking.Event()
+        self._recv_listening = set([])
         address = kwargs.pop('address', None)
         if comm_list is None:
             if isinstance(address, list):
@@ -262,6 +411,49 @@ class ForkComm(CommBase.CommBase):
                 return False
         return True
 
+    def wait_for_recv(self, timeout=None):
+        r"""Wait until one of the forked comms has a message available to
+        receive or the timeout is reached. Comms that support listeners
+        wake the wait via recv_ready and comms that can be polled are
+        polled together. If any of the comms support neither, this sleeps
+        for the duration of the timeout.
+
+        Args:
+            timeout (float, optional): Maximum time (in seconds) to wait.
+                Defaults to sleeptime.
+
+        Returns:
+            bool: True if there is a message available, False otherwise.
+
+        """
+        if timeout is None:
+            timeout = self.sleeptime
+        handles = []
+        for i, x in enumerate(self.comm_list):
+            if (not x.is_open) or (i in self._recv_listening):
+                continue
+            if x.add_recv_listener(self.recv_ready):
+                self._recv_listening.add(i)
+                continue
+            handle = x.recv_poll_handle
+            if handle is None:
+                self.sleep(timeout)
+                return False
+            handles.append(handle)
+        if not handles:
+            return self.recv_ready.wait(timeout)
+        if not self._recv_listening:
+            return CommBase.wait_for_handles(handles, timeout)
+        # Poll in short intervals so that listeners are also checked
+        tstop = time.time() + timeout
+        while not self.recv_ready.is_set():
+            dt = min(self.sleeptime / 10, tstop - time.time())
+            if dt <= 0:
+                return False
+            if CommBase.wait_for_handles(handles, dt):
+                return True
+        return True
+
     @property
     def n_msg_recv(self):
         r"""int: The number of incoming messages in the connection."""
@@ -282,6 +474,13 @@ class ForkComm(CommBase.CommBase):
         r"""int: The number of outgoing messages in the connection to drain."""
         return sum([x.n_msg_send_drain for x in self.comm_list])
 
+    @property
+    def batch_messages(self):
+        r"""bool: True if messages sent via send_many can be packed into
+        a single batch. Messages are forwarded to the forked comms
+        individually so batches are not used."""
+        return False
+
     def is_empty_recv(self, msg):
         r"""Check if a received message object is empty.
 
@@ -324,8 +523,65 @@ class ForkComm(CommBase.CommBase):
                 kws_root[k] = kwargs.pop(k)
         msg = super(ForkComm, self).prepare_message(*args, **kws_root)
         if not isinstance(msg, ForkedCommMessage):
-            msg = ForkedCommMessage(msg, self.comm_list, **kwargs)
+            targets = None
+            if (((self.distribution != 'broadcast') and len(self)
+                 and (msg.flag == CommBase.FLAG_SUCCESS))):
+                targets = [self.select_comm()]
+                msg.header = dict(msg.header or {}, work_index=self.work_index)
+                self.work_index += 1
+            msg = ForkedCommMessage(msg, self.comm_list, targets=targets,
+                                    **kwargs)
         return msg
+
+    @staticmethod
+    def get_queue_depth(comm):
+        r"""Get the number of messages that have been sent to a comm, but
+        not yet received by its partner.
+
+        Args:
+            comm (CommBase): Comm to check.
+
+        Returns:
+            int: Number of queued messages.
+
+        """
+        out = comm.n_msg_send
+        if comm.is_async:
+            out += comm.n_msg_direct_send
+        return out
+
+    def select_comm(self):
+        r"""Select the comm that the next message should be sent to based
+        on the distribution. Ties are broken by cycling through the comms.
+
+        Returns:
+            int: Index of the selected comm in comm_list.
+
+        """
+        order = [(self._next_send_index + i) % len(self)
+                 for i in range(len(self))]
+        order = [i for i in order if self.comm_list[i].is_open] or order
+        out = None
+        if self.distribution == 'round_robin':
+            out = order[0]
+        elif self.distribution == 'scatter':
+            T = self.start_timeout(key_suffix='.scatter')
+            while (out is None) and (not T.is_out):
+                for i in order:
+                    if self.get_queue_depth(self.comm_list[i]) == 0:
+                        out = i
+                        break
+                else:
+                    self.sleep()
+            self.stop_timeout(key_suffix='.scatter')
+            if out is None:  # pragma: debug
+                self.debug("No comms became idle before the timeout, "
+                           "sending to the least loaded comm.")
+        if out is None:
+            out = min(order, key=lambda i: self.get_queue_depth(
+                self.comm_list[i]))
+        self._next_send_index = (out + 1) % len(self)
+        return out
         
     def send_message(self, msg, **kwargs):
         r"""Send a message encapsulated in a CommMessage object.
@@ -339,7 +595,8 @@ class ForkComm(CommBase.CommBase):
         
         """
         assert(isinstance(msg.args, dict))
-        for i, x in enumerate(self.comm_list):
+        for i in sorted(msg.args.keys()):
+            x = self.comm_list[i]
             out = x.send_message(msg.args[i], **kwargs)
             self.errors += x.errors
             if not out:
@@ -371,6 +628,9 @@ class ForkComm(CommBase.CommBase):
         out_idx = None
         i = 0
         while ((not T.is_out) or first_comm) and self.is_open and (out is None):
+            # Cleared before checking the comms so that messages arriving
+            # during the check will end the wait below
+            self.recv_ready.clear()
             for i in range(len(self)):
                 if out is not None:
                     break
@@ -379,8 +639,9 @@ class ForkComm(CommBase.CommBase):
                     msg = x.recv_message(*args, **kwargs)
                     self.errors += x.errors
                     if msg.flag == CommBase.FLAG_EOF:
-                        self.eof_recv[self.curr_comm_index % len(self)] = 1
-                        if sum(self.eof_recv) == len(self):
+                        self.eof_recv[self.curr_comm_index % len(self)] += 1
+                        if all(n >= max(c.partner_copies, 1) for n, c in
+                               zip(self.eof_recv, self.comm_list)):
                             out = msg
                         else:
                             x.finalize_message(msg)
@@ -391,7 +652,7 @@ class ForkComm(CommBase.CommBase):
                 self.curr_comm_index += 1
             first_comm = False
             if out is None:
-                self.sleep()
+                self.wait_for_recv()
         self.stop_timeout(key_suffix='recv:forkd')
         if out is None:
             out_idx = 0
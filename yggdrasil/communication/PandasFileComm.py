@@ -16,3 +16,11 @@ class PandasFileComm(AsciiTableComm):
     _filetype = 'pandas'
     _schema_subtype_description = ('The file is a Pandas frame output as a table.')
     _default_serializer = 'pandas'
+
+    @property
+    def chunk_header_rows(self):
+        r"""int: Number of rows at the start of the table (excluding
+        comments) that must be included at the start of every chunk."""
+        if self.serializer.no_header:
+            return 0
+        return 1
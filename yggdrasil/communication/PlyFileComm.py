@@ -17,3 +17,5 @@ class PlyFileComm(FileComm):
         'data format for 3D structures.')
     _default_serializer = 'ply'
     _default_extension = '.ply'
+    _schema_excluded_from_inherit = (
+        FileComm._schema_excluded_from_inherit + ['plyformat'])
@@ -397,6 +397,8 @@ class RMQComm(CommBase.CommBase):
         if routing_key is None:
             routing_key = self.queue
         kwargs.setdefault('mandatory', True)
+        if isinstance(msg, memoryview):
+            msg = msg.tobytes()
         out = self.channel.basic_publish(exchange, routing_key, msg, **kwargs)
         return out
 
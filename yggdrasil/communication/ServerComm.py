@@ -23,6 +23,10 @@ class ServerComm(CommBase.CommBase):
         response_kwargs (dict): Keyword arguments for the response comm.
         icomm (Comm): Request comm.
         ocomm (OrderedDict): Response comms for each request.
+        request_ids (dict): IDs of the requests that each response comm
+            is registered for.
+        persistent_response_comms (dict): Response comms that are used
+            for multiple requests keyed by their address.
 
     """
 
@@ -47,6 +51,8 @@ class ServerComm(CommBase.CommBase):
         self.response_kwargs = response_kwargs
         self.icomm = get_comm(icomm_name, **icomm_kwargs)
         self.ocomm = OrderedDict()
+        self.request_ids = dict()
+        self.persistent_response_comms = dict()
         self.response_kwargs.setdefault('commtype', self.icomm._commtype)
         self.response_kwargs.setdefault('recv_timeout', self.icomm.recv_timeout)
         self.response_kwargs.setdefault('language', self.icomm.language)
@@ -168,6 +174,8 @@ class ServerComm(CommBase.CommBase):
             ocomm.close()
         for ocomm in self._used_response_comms.values():
             ocomm.close()
+        for ocomm in self.persistent_response_comms.values():
+            ocomm.close()
         super(ServerComm, self).close(*args, **kwargs)
 
     @property
@@ -190,6 +198,13 @@ class ServerComm(CommBase.CommBase):
         r"""int: The number of messages in the connection to drain."""
         return self.icomm.n_msg_recv_drain
 
+    @property
+    def batch_messages(self):
+        r"""bool: True if messages sent via send_many can be packed into
+        a single batch. Each response must be paired with a request so
+        batches are not used."""
+        return False
+
     @property
     def open_clients(self):
         r"""list: Available open clients."""
@@ -209,9 +224,11 @@ class ServerComm(CommBase.CommBase):
             raise RuntimeError("No header received with last message.")
         elif 'response_address' not in header:  # pragma: debug
             raise RuntimeError("Last header does not contain response address.")
-        comm_kwargs = dict(address=header['response_address'],
+        response_address = header['response_address']
+        persistent = header.get('persistent_response', False)
+        comm_kwargs = dict(address=response_address,
                            direction='send',
-                           single_use=True, **self.response_kwargs)
+                           single_use=(not persistent), **self.response_kwargs)
         if self.direct_connection:
             comm_kwargs['is_response_client'] = True
         else:
@@ -220,12 +237,19 @@ class ServerComm(CommBase.CommBase):
         while response_id in self.ocomm:  # pragma: debug
             response_id += str(uuid.uuid4())
         header['response_id'] = response_id
-        self.ocomm[response_id] = get_comm(
-            self.name + '.server_response_comm.' + response_id,
-            **comm_kwargs)
+        if persistent and (response_address in self.persistent_response_comms):
+            self.ocomm[response_id] = self.persistent_response_comms[
+                response_address]
+        else:
+            self.ocomm[response_id] = get_comm(
+                self.name + '.server_response_comm.' + response_id,
+                **comm_kwargs)
+            if persistent:
+                self.persistent_response_comms[response_address] = (
+                    self.ocomm[response_id])
         client_model = header.get('model', '')
         self.ocomm[response_id].client_model = client_model
-        self.ocomm[response_id].request_id = header['request_id']
+        self.request_ids[response_id] = header['request_id']
         if client_model and (client_model not in self.clients):
             self.clients.append(client_model)
 
@@ -238,7 +262,8 @@ class ServerComm(CommBase.CommBase):
 
         """
         ocomm = self.ocomm.pop(response_id, None)
-        if ocomm is not None:
+        self.request_ids.pop(response_id, None)
+        if (ocomm is not None) and ocomm.single_use:
             ocomm.close_in_thread(no_wait=True)
             self._used_response_comms[ocomm.name] = ocomm
 
@@ -278,7 +303,7 @@ class ServerComm(CommBase.CommBase):
         if response_id is None:
             response_id = next(iter(self.ocomm.keys()))
             kwargs['header_kwargs']['response_id'] = response_id
-        kwargs['header_kwargs']['request_id'] = self.ocomm[response_id].request_id
+        kwargs['header_kwargs']['request_id'] = self.request_ids[response_id]
         return self.ocomm[response_id].prepare_message(*args, **kwargs)
         
     def send_message(self, msg, **kwargs):
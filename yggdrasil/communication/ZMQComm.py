@@ -1,4 +1,5 @@
 import os
+import time
 import tempfile
 import uuid
 import logging
@@ -33,6 +34,38 @@ _reply_msg = b'YGG_REPLY'
 _purge_msg = b'YGG_PURGE'
 
 
+def format_reply_msg(count=1):
+    r"""Create a reply message confirming one or more messages.
+
+    Args:
+        count (int, optional): Number of messages confirmed by the reply.
+            Defaults to 1.
+
+    Returns:
+        bytes: Reply message.
+
+    """
+    if count == 1:
+        return _reply_msg
+    return _reply_msg + b'_' + str(count).encode('utf-8')
+
+
+def parse_reply_msg(msg):
+    r"""Get the number of messages confirmed by a reply message.
+
+    Args:
+        msg (bytes): Reply message.
+
+    Returns:
+        int: Number of messages confirmed by the reply.
+
+    """
+    prefix = _reply_msg + b'_'
+    if msg.startswith(prefix):
+        return int(msg[len(prefix):])
+    return 1
+
+
 def set_context_opts(context):
     context.set(zmq.MAX_SOCKETS, 8000)
     context.setsockopt(zmq.LINGER, 0)
@@ -46,6 +79,16 @@ else:  # pragma: debug
     _global_context = None
 
 
+def reset_global_context():
+    r"""Replace the global context with a new one. This should be called
+    in processes forked from a process that had already created a global
+    context as ZeroMQ contexts cannot be used after a fork."""
+    global _global_context
+    if _global_context is not None:
+        _global_context = zmq.Context.instance()
+        set_context_opts(_global_context)
+
+
 def get_ipc_host():
     r"""Get an IPC host using uuid.
 
@@ -160,6 +203,24 @@ def create_socket(context, socket_type):
     return socket
 
 
+def join_frames(frames):
+    r"""Join the frames of a multipart message received without copying.
+
+    Args:
+        frames (list): zmq.Frame objects received as part of a single
+            multipart message.
+
+    Returns:
+        bytes: Message formed by the frames.
+
+    """
+    if len(frames) == 1:
+        return frames[0].bytes
+    # bytes.join allocates the result once at its final size so each frame
+    # is only copied once
+    return b''.join([x.buffer for x in frames])
+
+
 def bind_socket(socket, address, retry_timeout=-1, nretry=1):
     r"""Bind a socket to an address, getting a random port as necessary.
 
@@ -299,9 +360,11 @@ class ZMQProxy(CommBase.CommServer):
         r"""Send single message to the server."""
         if msg is None:  # pragma: debug
             return
+        if not isinstance(msg, list):
+            msg = [msg]
         while not self.was_break:
             try:
-                self.srv_socket.send(msg, zmq.NOBLOCK)
+                self.srv_socket.send_multipart(msg, zmq.NOBLOCK)
                 break
             except zmq.ZMQError:  # pragma: no cover
                 self.sleep(0.0001)
@@ -324,7 +387,7 @@ class ZMQProxy(CommBase.CommServer):
             if message is not None:
                 self.debug('Forwarding message of size %d from %s',
                            len(message[1]), message[0])
-                self.server_send(message[1])
+                self.server_send(message[1:])
         if (not self.server_active):
             self.nsignon += 1
             self.server_send(self.server_signon_msg + self.cli_address.encode('utf-8'))
@@ -371,6 +434,13 @@ class ZMQComm(CommBase.CommBase):
             all messages.
         dealer_identity (str, optional): Identity that should be used to route
             messages to a dealer socket. Defaults to '0'.
+        reply_window (int, optional): Maximum number of received messages
+            that can be confirmed by a single reply handshake. Defaults to 1
+            and every message is confirmed individually.
+        reply_interval (float, optional): Time (in seconds) after which
+            received messages are confirmed even if the reply window is not
+            full. Defaults to 0.0 and messages are only confirmed when the
+            window is full or there are no more messages waiting.
         **kwargs: Additional keyword arguments are passed to :class:.CommBase.
 
     Attributes:
@@ -382,6 +452,12 @@ class ZMQComm(CommBase.CommBase):
         topic_filter (str): Message filter to use when subscribing.
         dealer_identity (str): Identity that should be used to route messages
             to a dealer socket.
+        multipart (bool): If True, messages larger than maxMsgSize are sent as
+            a single multipart message rather than via a work comm.
+        reply_window (int): Maximum number of received messages that can be
+            confirmed by a single reply handshake.
+        reply_interval (float): Time (in seconds) after which received
+            messages are confirmed even if the reply window is not full.
 
     Developer Notes:
         |yggdrasil| uses the tcp transport by default with a PAIR socket type.
@@ -400,11 +476,32 @@ class ZMQComm(CommBase.CommBase):
         When creating worker comms for sending large messages, the sending
         model should create the reply comm for the worker in advanced and send
         it in the header with the worker address under the key 'zmq_reply_worker'.
+        If the partner receives messages in Python, large messages are instead
+        sent as a single multipart message with frames of at most maxMsgSize
+        that the receiving model joins back together.
+        If reply_window is greater than 1 or reply_interval is greater than 0,
+        the sending model includes them in the header under the keys
+        'zmq_reply_window' and 'zmq_reply_interval'. Receiving models that
+        support windowed confirmation can then confirm several messages with
+        a single handshake by sending 'YGG_REPLY_<N>', where N is the number
+        of messages confirmed. Sending models count a reply without a suffix
+        as confirming a single message so receiving models that ignore
+        these keys remain compatible.
 
     """
 
     _commtype = 'zmq'
     _schema_subtype_description = ('ZeroMQ socket.')
+    _schema_properties = {
+        'reply_window': {
+            'type': 'integer', 'default': 1,
+            'description': ('Maximum number of received messages that can '
+                            'be confirmed by a single reply handshake.')},
+        'reply_interval': {
+            'type': 'number', 'default': 0.0,
+            'description': ('Time (in seconds) after which received '
+                            'messages are confirmed even if the reply '
+                            'window is not full.')}}
     # Based on limit of 32bit int, this could be 2**30, but this is
     # too large for stack allocation in C so 2**20 will be used.
     _maxMsgSize = 2**20
@@ -416,6 +513,9 @@ class ZMQComm(CommBase.CommBase):
     _disconnect_attr = (CommBase.CommBase._disconnect_attr
                         + ['reply_socket_lock', 'socket_lock',
                            '_reply_thread'])
+    _transport_header_keys = (CommBase.CommBase._transport_header_keys
+                              + ['zmq_reply', 'zmq_reply_window',
+                                 'zmq_reply_interval'])
     
     def _init_before_open(self, context=None, socket_type=None,
                           socket_action=None, topic_filter='',
@@ -449,6 +549,16 @@ class ZMQComm(CommBase.CommBase):
             # to use a ROUTER socket type as defined above
             socket_type = 'DEALER'
             socket_action = 'connect'
+        elif self.is_response_server and (not self.single_use):
+            # Persistent response comms used by ServerComm and the
+            # RPCResponseDriver input comm can have multiple senders
+            # when the server has multiple copies
+            if self.direction == 'recv':
+                socket_type = 'ROUTER'
+                socket_action = 'bind'
+            else:
+                socket_type = 'DEALER'
+                socket_action = 'connect'
         # Set defaults
         if socket_type is None:
             if self.direction == 'recv':
@@ -456,7 +566,7 @@ class ZMQComm(CommBase.CommBase):
             elif self.direction == 'send':
                 socket_type = _socket_send_types[_default_socket_type]
         if not (self.allow_multiple_comms or self.is_client or self.is_server
-                or self.is_response_client):
+                or self.is_response_client or self.is_response_server):
             if socket_type in ['PULL', 'SUB', 'REP', 'DEALER']:
                 self.direction = 'recv'
             elif socket_type in ['PUSH', 'PUB', 'REQ', 'ROUTER']:
@@ -503,11 +613,15 @@ class ZMQComm(CommBase.CommBase):
         self._n_zmq_recv = {}
         self._n_reply_sent = 0
         self._n_reply_recv = {}
+        self._reply_window_recv = {}
+        self._reply_pending_recv = {}
         self._server_class = ZMQProxy
         self._server_kwargs = dict(zmq_context=self.context,
                                    nretry=4, retry_timeout=2.0 * self.sleeptime)
         self.cli_address = None
         self.cli_socket = None
+        # Multipart messages can only be joined by Python partners
+        self.multipart = self.binary_payload
         super(ZMQComm, self)._init_before_open(**kwargs)
 
     def __getstate__(self):
@@ -670,6 +784,8 @@ class ZMQComm(CommBase.CommBase):
         if kwargs['socket_type'] in ['DEALER', 'ROUTER']:
             kwargs['dealer_identity'] = self.dealer_identity
         kwargs['context'] = self.context
+        kwargs['reply_window'] = self.reply_window
+        kwargs['reply_interval'] = self.reply_interval
         return kwargs
 
     @property
@@ -677,6 +793,19 @@ class ZMQComm(CommBase.CommBase):
         r"""str: String used to register the socket."""
         return '%s_%s_%s' % (self.socket_type_name, self.address, self.direction)
 
+    def unregister_socket(self, dont_close=False):
+        r"""Remove this comm's socket from the registry if it is the socket
+        registered under the comm's registry key. Sockets connected to the
+        same address by other comms share the key and are left untouched.
+
+        Args:
+            dont_close (bool, optional): If True, the registered socket will
+                not be closed. Defaults to False.
+
+        """
+        if self.comm_registry().get(self.registry_key, None) is self.socket:
+            self.unregister_comm(self.registry_key, dont_close=dont_close)
+
     def bind(self):
         r"""Bind to address, getting random port as necessary."""
         super(ZMQComm, self).bind()
@@ -731,7 +860,7 @@ class ZMQComm(CommBase.CommBase):
                     self.socket.unbind(self.address)
                 except zmq.ZMQError:  # pragma: debug
                     pass
-                self.unregister_comm(self.registry_key, dont_close=dont_close)
+                self.unregister_socket(dont_close=dont_close)
                 self._bound = False
             self.debug('Unbound socket')
 
@@ -746,7 +875,7 @@ class ZMQComm(CommBase.CommBase):
                     self.socket.disconnect(self.address)
                 except zmq.ZMQError:  # pragma: debug
                     pass
-                self.unregister_comm(self.registry_key, dont_close=dont_close)
+                self.unregister_socket(dont_close=dont_close)
                 self._connected = False
             self.debug('Disconnected socket')
 
@@ -796,6 +925,8 @@ class ZMQComm(CommBase.CommBase):
             with self.reply_socket_lock:
                 self._n_reply_recv[address] = 0
                 self._n_zmq_recv[address] = 0
+                self._reply_window_recv.setdefault(
+                    address, self.default_reply_window)
                 self.reply_socket_recv[address] = s
             self.debug("new recv address: %s", address)
         return address
@@ -831,9 +962,43 @@ class ZMQComm(CommBase.CommBase):
         if (address is None):
             address = self.reply_socket_address
         if address is not None:
-            self.set_reply_socket_recv(address)
+            address = self.set_reply_socket_recv(address)
+            if 'zmq_reply_window' in header:
+                self._reply_window_recv[address] = (
+                    header['zmq_reply_window'],
+                    header.get('zmq_reply_interval', 0.0))
         return msg, address
 
+    @property
+    def default_reply_window(self):
+        r"""tuple: Reply window and interval used to confirm messages from
+        senders that do not specify them. Windowed confirmation is only used
+        if the partner can interpret replies confirming several messages."""
+        if self.partner_language == 'python':
+            return (self.reply_window, self.reply_interval)
+        return (1, 0.0)
+
+    def is_reply_due(self, key):
+        r"""Determine if the messages received from a sender should be
+        confirmed.
+
+        Args:
+            key (str): Reply address for the sender.
+
+        Returns:
+            bool: True if the messages should be confirmed, False otherwise.
+
+        """
+        window, interval = self._reply_window_recv.get(key, (1, 0.0))
+        if window <= 1:
+            return True
+        if (self._n_zmq_recv[key] - self._n_reply_recv[key]) >= window:
+            return True
+        if ((interval > 0) and ((time.time() - self._reply_pending_recv.get(
+                key, time.time())) >= interval)):
+            return True
+        return (not self.is_message(zmq.POLLIN))
+
     def _catch_eagain(self, function, *args, **kwargs):
         tries = 10
         error = BaseException('_catch_eagain')
@@ -871,7 +1036,7 @@ class ZMQComm(CommBase.CommBase):
             return msg
         self._catch_eagain(self.reply_socket_send.send,
                            msg, flags=zmq.NOBLOCK)
-        self._n_reply_sent += 1
+        self._n_reply_sent += parse_reply_msg(msg)
         self.reply_socket_send.poll(timeout=self.zmq_sleeptime,
                                     flags=zmq.POLLIN)
         return msg
@@ -912,7 +1077,7 @@ class ZMQComm(CommBase.CommBase):
                 "_reply_handshake_recv (in recv) => ZMQ Error(%s): %s"
                 % (key, e))
         assert(msg_recv == msg_send)
-        self._n_reply_recv[key] += 1
+        self._n_reply_recv[key] += parse_reply_msg(msg_send)
         return True
 
     def _close_backlog(self, wait=False):
@@ -960,7 +1125,7 @@ class ZMQComm(CommBase.CommBase):
                 # if (self.direction == 'recv') and (self.protocol == 'ipc'):
                 #     if os.path.isfile(self.host):
                 #         os.remove(self.host)
-            self.unregister_comm(self.registry_key)
+            self.unregister_socket()
             if back_messages:  # pragma: debug
                 # for x in back_messages:
                 #     self._send_client_msg(x)
@@ -1030,6 +1195,15 @@ class ZMQComm(CommBase.CommBase):
             return int(self.is_message(zmq.POLLIN))
         return 0
 
+    @property
+    def recv_poll_handle(self):
+        r"""tuple: Socket that can be polled for incoming messages and the
+        lock that should be held while polling it. None if the comm cannot
+        be polled."""
+        if self.is_open and (self.direction == 'recv'):
+            return (self.socket, self.socket_lock)
+        return None
+
     @property
     def n_msg_send(self):
         r"""int: The number of outgoing messages in the connection."""
@@ -1108,7 +1282,24 @@ class ZMQComm(CommBase.CommBase):
         """
         kwargs.setdefault('header_kwargs', {})
         kwargs['header_kwargs']['zmq_reply'] = self.set_reply_socket_send()
+        if (self.reply_window > 1) or (self.reply_interval > 0):
+            kwargs['header_kwargs']['zmq_reply_window'] = self.reply_window
+            kwargs['header_kwargs']['zmq_reply_interval'] = self.reply_interval
         return super(ZMQComm, self).prepare_message(*args, **kwargs)
+
+    def prepare_large_message(self, msg):
+        r"""Prepare a message that is too large to be sent all at once. If
+        multipart is True, the message will be split into frames that will
+        be sent together as a single multipart message.
+
+        Args:
+            msg (CommMessage): Serialized message that exceeds maxMsgSize.
+
+        """
+        if self.multipart and (msg.flag != CommBase.FLAG_EOF):
+            msg.msg = list(self.chunk_message(msg.msg))
+        else:
+            super(ZMQComm, self).prepare_large_message(msg)
         
     def send(self, *args, **kwargs):
         r"""Send a message."""
@@ -1136,7 +1327,9 @@ class ZMQComm(CommBase.CommBase):
         r"""Send a message.
 
         Args:
-            msg (str, bytes): Message to be sent.
+            msg (str, bytes, list): Message to be sent. If a list is provided,
+                each element will be sent without copying as a frame of a
+                single multipart message.
             topic (str, optional): Filter that should be sent with the
                 message for 'PUB' sockets. Defaults to ''.
             identity (str, optional): Identify of identified worker that
@@ -1153,11 +1346,13 @@ class ZMQComm(CommBase.CommBase):
             identity = self.dealer_identity
         topic = tools.str2bytes(topic)
         identity = tools.str2bytes(identity)
-        if self.socket_type_name == 'PUB':
-            total_msg = topic + _flag_zmq_filter + msg
+        if isinstance(msg, list):
+            frames = list(msg)
         else:
-            total_msg = msg
-        total_msg = self.check_reply_socket_send(total_msg)
+            frames = [msg]
+        if self.socket_type_name == 'PUB':
+            frames[0] = topic + _flag_zmq_filter + frames[0]
+        frames[0] = self.check_reply_socket_send(frames[0])
         kwargs.setdefault('flags', zmq.NOBLOCK)
         with self.socket_lock:
             try:
@@ -1166,8 +1361,10 @@ class ZMQComm(CommBase.CommBase):
                     self.socket.send(identity, **kwargs)
                     # self.socket.send_multipart([identity, total_msg],
                     #                            **kwargs)
+                elif len(frames) > 1:
+                    self.socket.send_multipart(frames, copy=False, **kwargs)
                 else:
-                    self.socket.send(total_msg, **kwargs)
+                    self.socket.send(frames[0], **kwargs)
                 TemporaryCommunicationError.reset((self.address, "zmq.EAGAIN"))
             except zmq.ZMQError as e:  # pragma: debug
                 if e.errno == zmq.EAGAIN:
@@ -1183,7 +1380,7 @@ class ZMQComm(CommBase.CommBase):
             # TemporaryCommunicationError is raised due to failure to send
             # total_msg after successfully sending identity
             kwargs['flags'] = 0
-            self.socket.send(total_msg, **kwargs)
+            self.socket.send_multipart(frames, copy=False, **kwargs)
         self._n_zmq_sent += 1
         return True
 
@@ -1205,11 +1402,11 @@ class ZMQComm(CommBase.CommBase):
                     if self.socket.closed:  # pragma: debug
                         self.error("Socket closed")
                         return (False, self.empty_bytes_msg)
+                    frames = self.socket.recv_multipart(copy=False, **kwargs)
                     if self.socket_type_name == 'ROUTER':
-                        [identity, total_msg] = self.socket.recv_multipart(**kwargs)
+                        identity = frames.pop(0).bytes
                         self._recv_identities.add(identity)
-                    else:
-                        total_msg = self.socket.recv(**kwargs)
+                    total_msg = join_frames(frames)
                 except zmq.ZMQError as e:
                     if e.errno == zmq.ETIMEDOUT:  # pragma: debug
                         raise NoMessages("No messages in socket.")
@@ -1239,6 +1436,8 @@ class ZMQComm(CommBase.CommBase):
             msg = total_msg
         # Confirm receipt
         if k is not None:
+            if self._n_zmq_recv[k] == self._n_reply_recv[k]:
+                self._reply_pending_recv[k] = time.time()
             self._n_zmq_recv[k] += 1
         else:  # pragma: debug
             self.info("No reply address.")
@@ -1294,12 +1493,17 @@ class ZMQComm(CommBase.CommBase):
             return True
         flag = True
         for k in keys:
-            if self.is_open and (self._n_zmq_recv[k] != self._n_reply_recv[k]):
+            if ((self.is_open and (self._n_zmq_recv[k] != self._n_reply_recv[k])
+                 and self.is_reply_due(k))):
                 self.debug("Confirming %d/%d received messages",
                            self._n_reply_recv[k], self._n_zmq_recv[k])
                 while (self._n_zmq_recv[k] != self._n_reply_recv[k]) and flag:
+                    window = self._reply_window_recv.get(k, (1, 0.0))[0]
+                    msg_send = format_reply_msg(
+                        max(1, min(window, self._n_zmq_recv[k]
+                                   - self._n_reply_recv[k])))
                     with self.reply_socket_lock:
-                        flag = self._reply_handshake_recv(_reply_msg, k)
+                        flag = self._reply_handshake_recv(msg_send, k)
                     if flag:
                         self.debug("Recv confirmed (%d/%d)",
                                    self._n_reply_recv[k], self._n_zmq_recv[k])
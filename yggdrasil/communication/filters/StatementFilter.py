@@ -1,6 +1,6 @@
 import numpy as np
 from yggdrasil import units
-from yggdrasil.tools import safe_eval
+from yggdrasil.tools import safe_eval, compile_safe_eval
 from yggdrasil.communication.filters.FilterBase import FilterBase
 
 
@@ -27,6 +27,16 @@ class StatementFilter(FilterBase):
     def __init__(self, *args, **kwargs):
         super(StatementFilter, self).__init__(*args, **kwargs)
         self.statement = self.statement.replace('%x%', 'x')
+        self._compiled_statement = compile_safe_eval(self.statement)
+
+    def __getstate__(self):
+        out = super(StatementFilter, self).__getstate__()
+        out.pop('_compiled_statement', None)
+        return out
+
+    def __setstate__(self, state):
+        super(StatementFilter, self).__setstate__(state)
+        self._compiled_statement = compile_safe_eval(self.statement)
 
     def evaluate_filter(self, x):
         r"""Call filter on the provided message.
@@ -38,7 +48,7 @@ class StatementFilter(FilterBase):
             bool: True if the message will pass through the filter, False otherwise.
 
         """
-        return safe_eval(self.statement, x=x)
+        return safe_eval(self._compiled_statement, x=x)
 
     @classmethod
     def get_testing_options(cls):
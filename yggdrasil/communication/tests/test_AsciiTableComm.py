@@ -33,6 +33,40 @@ def test_AsciiTableComm_nofmt():
     os.remove(test_file)
 
 
+def test_AsciiTableComm_chunks():
+    r"""Test reading an array table in chunks."""
+    test_file = os.path.join(os.getcwd(), 'temp_file.txt')
+    nrow = 10
+    arr = np.zeros(nrow, dtype=[('a', 'float'), ('b', 'int32')])
+    arr['a'] = np.arange(nrow)
+    arr['b'] = 2 * np.arange(nrow)
+    out = AsciiTableComm.AsciiTableComm('test', test_file, direction='send',
+                                        as_array=True, field_names=['a', 'b'])
+    out.open()
+    assert(out.send([arr['a'], arr['b']]))
+    out.close()
+    for kws, nchunk in [({'chunk_size': 3}, [3, 3, 3, 1]),
+                        ({'chunk_bytes': 20}, [2, 5, 3])]:
+        inst = AsciiTableComm.AsciiTableComm('test', test_file,
+                                             direction='recv', as_array=True,
+                                             **kws)
+        inst.open()
+        assert(inst.read_in_chunks)
+        chunks = []
+        flag = True
+        while flag:
+            flag, x = inst.recv()
+            if flag:
+                chunks.append(x)
+        inst.close()
+        assert_equal([len(x[0]) for x in chunks], nchunk)
+        np.testing.assert_array_equal(
+            np.hstack([x[0] for x in chunks]), arr['a'])
+        np.testing.assert_array_equal(
+            np.hstack([x[1] for x in chunks]), arr['b'])
+    os.remove(test_file)
+
+
 class TestAsciiTableComm(parent.TestAsciiFileComm):
     r"""Test for AsciiTableComm communication class."""
 
@@ -0,0 +1,110 @@
+import threading
+from yggdrasil import tools
+from yggdrasil.tests import assert_equal, assert_raises
+from yggdrasil.communication import (
+    new_comm, get_comm, CommBase, TemporaryCommunicationError)
+from yggdrasil.communication.AsyncComm import AsyncComm
+
+
+def test_backlog_item_size():
+    r"""Test determining the size of messages in the backlog."""
+    msg = CommBase.CommMessage(msg=b'hello')
+    assert_equal(AsyncComm.backlog_item_size(msg), 5)
+    assert_equal(AsyncComm.backlog_item_size(((msg, ), {})), 5)
+    msg.msg = [b'hello', memoryview(b'world')]
+    assert_equal(AsyncComm.backlog_item_size(msg), 10)
+    assert_equal(AsyncComm.backlog_item_size(((), {})), 0)
+
+
+def test_max_backlog_recv():
+    r"""Test that a full recv backlog leaves messages in the wrapped comm."""
+    nmsg = 5
+    send_comm = new_comm('test_max_backlog_recv', commtype='buffer')
+    recv_kwargs = send_comm.opp_comm_kwargs()
+    recv_kwargs.update(use_async=True, max_backlog=2)
+    recv_comm = get_comm('test_max_backlog_recv', **recv_kwargs)
+    try:
+        for i in range(nmsg):
+            assert(send_comm.send(b'msg%d' % i))
+        T = recv_comm.start_timeout(10.0)
+        while (not T.is_out) and (recv_comm.n_msg_backlog < 2):
+            tools.sleep(recv_comm.sleeptime)
+        recv_comm.stop_timeout()
+        tools.sleep(10 * recv_comm.sleeptime)
+        assert_equal(recv_comm.n_msg_backlog, 2)
+        assert(recv_comm.is_backlog_full())
+        for i in range(nmsg):
+            flag, msg = recv_comm.recv(timeout=10.0)
+            assert(flag)
+            assert_equal(msg, b'msg%d' % i)
+        assert_equal(recv_comm.backlog_high_water, 2)
+        recv_comm.printStatus()
+    finally:
+        send_comm.close()
+        recv_comm.close()
+
+
+def test_max_backlog_send():
+    r"""Test errors raised when the send backlog is full."""
+    send_comm = new_comm('test_max_backlog_send', commtype='zmq',
+                         use_async=True, max_backlog=2,
+                         backlog_block=False, timeout=0.1)
+    try:
+        # Messages remain in the backlog until there is a receiver
+        msg = 60 * b'a'
+        assert(send_comm.send(msg))
+        assert(send_comm.send(msg))
+        assert_raises(TemporaryCommunicationError, send_comm.send, msg)
+        assert_equal(send_comm.n_msg_backlog, 2)
+        assert_equal(send_comm.backlog_high_water, 2)
+        assert(send_comm.backlog_high_water_bytes > 2 * len(msg))
+        send_comm.max_backlog = 0
+        assert(not send_comm.is_backlog_full())
+        send_comm.max_backlog_bytes = send_comm.backlog_high_water_bytes
+        assert(send_comm.is_backlog_full(1))
+        assert(not send_comm.is_backlog_full())
+        send_comm.purge()
+        assert(not send_comm.is_backlog_full())
+        assert(send_comm.backlog_space.is_set())
+    finally:
+        send_comm.close()
+
+
+class SlowAsyncComm(AsyncComm):
+    r"""AsyncComm that pauses after finding space in the backlog so that
+    other senders have a chance to check for space in between."""
+
+    __slots__ = []
+
+    def wait_for_backlog_space(self, *args, **kwargs):
+        super(SlowAsyncComm, self).wait_for_backlog_space(*args, **kwargs)
+        tools.sleep(0.1)
+
+
+def test_max_backlog_send_concurrent():
+    r"""Test that concurrent senders cannot exceed the backlog limit."""
+    nthread = 8
+    send_comm = SlowAsyncComm(
+        new_comm('test_max_backlog_send_concurrent', commtype='zmq',
+                 is_async=True, timeout=0.1),
+        max_backlog=2, backlog_block=False)
+    results = []
+
+    def send():
+        try:
+            results.append(send_comm.send(60 * b'a'))
+        except TemporaryCommunicationError:
+            results.append(False)
+
+    try:
+        threads = [threading.Thread(target=send) for _ in range(nthread)]
+        for x in threads:
+            x.start()
+        for x in threads:
+            x.join(10.0)
+        assert_equal(len(results), nthread)
+        assert_equal(results.count(True), 2)
+        assert_equal(send_comm.n_msg_backlog, 2)
+        assert_equal(send_comm.backlog_high_water, 2)
+    finally:
+        send_comm.close()
@@ -1,4 +1,4 @@
-from yggdrasil import tools
+from yggdrasil import tools, multitasking
 from yggdrasil.tests import assert_equal
 from yggdrasil.communication import BufferComm
 from yggdrasil.communication.tests import test_CommBase
@@ -21,6 +21,31 @@ def test_LockedBuffer_pop():
     assert_equal(x.pop(default='hello'), 'hello')
 
 
+def test_LockedBuffer_wait_for_item():
+    r"""Test waiting for an element to be added to a LockedBuffer."""
+    for task_method in ['thread', 'process']:
+        x = BufferComm.LockedBuffer(task_method=task_method)
+        assert(not x.wait_for_item(0.01))
+        x.append('test')
+        assert(x.wait_for_item(10.0))
+        assert_equal(x.pop(), 'test')
+        x.close()
+
+
+def test_LockedBuffer_add_listener():
+    r"""Test listeners on a LockedBuffer."""
+    x = BufferComm.LockedBuffer(task_method='thread')
+    event = multitasking.Event()
+    assert(x.add_listener(event))
+    assert(not event.is_set())
+    x.append('test')
+    assert(event.is_set())
+    x.close()
+    y = BufferComm.LockedBuffer(task_method='process')
+    assert(not y.add_listener(event))
+    y.close()
+
+
 class TestBufferComm(test_CommBase.TestCommBase):
     r"""Tests for BufferComm communication class."""
 
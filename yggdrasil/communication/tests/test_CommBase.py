@@ -653,6 +653,41 @@ class TestCommBase(YggTestClassInfo):
         msg_send = getattr(self, 'test_msg_array', None)
         self.do_send_recv('send_array', 'recv_array', msg_send=msg_send)
 
+    def test_send_recv_binary_payload(self):
+        r"""Test send/recv of a array message with a binary payload."""
+        for x in ([self.send_instance]
+                  + getattr(self.send_instance, 'comm_list', [])):
+            x.binary_payload = True
+        self.test_send_recv_array()
+
+    def test_send_recv_many(self, nmsg=5, nrecv=None):
+        r"""Test send/recv of several messages with an EOF in a batch."""
+        if nrecv is None:
+            nrecv = nmsg
+        if ((self.comm in ['CommBase', 'AsyncComm', 'ValueComm',
+                           'ServerComm', 'ClientComm']
+             or self.send_instance.is_file)):
+            return
+        for x in ([self.send_instance]
+                  + getattr(self.send_instance, 'comm_list', [])):
+            x.binary_payload = True
+        msg_list = [self.test_msg for _ in range(nmsg)]
+        assert(self.send_instance.send_many(
+            msg_list + [self.send_instance.eof_msg]))
+        out = []
+        flag = True
+        T = self.recv_instance.start_timeout(self.timeout)
+        while flag and (not T.is_out):
+            flag, msgs = self.recv_instance.recv_many(
+                max_n=(nmsg - 1), timeout=self.timeout)
+            assert(len(msgs) <= (nmsg - 1))
+            out += msgs
+        self.recv_instance.stop_timeout()
+        self.assert_equal(len(out), nrecv)
+        for x in out:
+            self.assert_msg_equal(x, self.test_msg)
+        assert(self.recv_instance.is_closed)
+
     def test_eof(self):
         r"""Test send/recv of EOF message."""
         self.do_send_recv(send_meth='send_eof')
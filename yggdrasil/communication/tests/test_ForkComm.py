@@ -1,5 +1,7 @@
 import uuid
 import copy
+from yggdrasil.tests import assert_equal, assert_raises
+from yggdrasil.communication import CommBase
 from yggdrasil.communication.tests import test_CommBase as parent
 
 
@@ -63,6 +65,82 @@ class TestForkComm(parent.TestCommBase):
         kwargs['nrecv'] = self.ncomm
         super(TestForkComm, self).test_purge(**kwargs)
 
+    def test_send_recv_many(self, nmsg=5):
+        r"""Test send/recv of several messages with an EOF in a batch."""
+        super(TestForkComm, self).test_send_recv_many(
+            nmsg=nmsg, nrecv=(nmsg * self.ncomm))
+
+    def test_broadcast(self):
+        r"""Test that messages are serialized once for all of the forked
+        comms."""
+        from yggdrasil.communication import ForkComm
+        nserialize = []
+        comm_list = self.send_instance.comm_list
+        keys = [ForkComm.get_broadcast_key(x) for x in comm_list]
+        assert(all(k == keys[0] for k in keys))
+
+        def wrap_serialize(x):
+            old_serialize = x.serialize
+
+            def serialize(*args, **kwargs):
+                nserialize.append(x)
+                return old_serialize(*args, **kwargs)
+            return serialize
+
+        for x in comm_list:
+            x.serialize = wrap_serialize(x)
+        try:
+            msg = self.send_instance.prepare_message(self.test_msg)
+        finally:
+            for x in comm_list:
+                del x.serialize
+        assert_equal(len(nserialize), 1)
+        assert_equal(sorted(msg.args.keys()), list(range(self.ncomm)))
+        assert(all(x.flag == CommBase.FLAG_SUCCESS for x in msg.args.values()))
+        assert(self.send_instance.send_message(msg))
+        for i in range(self.ncomm):
+            flag, msg_recv = self.recv_instance.recv(timeout=self.timeout)
+            assert(flag)
+            self.assert_equal(msg_recv, self.test_msg)
+
+    def test_distribution(self):
+        r"""Test sending messages to a single forked comm."""
+        nmsg = 0
+        for distribution in ['round_robin', 'least_loaded', 'scatter']:
+            self.send_instance.distribution = distribution
+            for i in range(self.ncomm):
+                msg = self.send_instance.prepare_message(self.test_msg)
+                assert_equal(len(msg.args), 1)
+                if distribution == 'round_robin':
+                    assert_equal(list(msg.args.keys()), [i])
+                assert(self.send_instance.send_message(msg))
+                msg_recv = self.recv_instance.recv(
+                    timeout=self.timeout, return_message_object=True)
+                assert_equal(msg_recv.flag, CommBase.FLAG_SUCCESS)
+                assert_equal(msg_recv.header['work_index'], nmsg)
+                self.assert_equal(msg_recv.args, self.test_msg)
+                nmsg += 1
+        assert_equal(self.send_instance.work_index, nmsg)
+        self.send_instance.distribution = 'broadcast'
+
+    def test_wait_for_recv(self):
+        r"""Test waiting for a message on any of the forked comms."""
+        self.send_instance.drain_server_signon_messages()
+        self.recv_instance.drain_server_signon_messages()
+        assert(not self.recv_instance.wait_for_recv(0.01))
+        assert(self.send_instance.comm_list[-1].send(self.test_msg))
+        assert(self.recv_instance.wait_for_recv(self.timeout))
+        flag, msg_recv = self.recv_instance.recv(timeout=self.timeout)
+        assert(flag)
+        self.assert_equal(msg_recv, self.test_msg)
+
+
+class TestForkCommAsync(TestForkComm):
+    r"""Tests for ForkComm communication class with asynchronous comms."""
+
+    use_async = True
+    test_purge = None
+
 
 class TestForkCommList(TestForkComm):
     r"""Tests for ForkComm communication class with construction from address."""
@@ -72,3 +150,10 @@ class TestForkCommList(TestForkComm):
         out = super(TestForkComm, self).inst_kwargs
         out['comm_list'] = None  # To force test of construction from addresses
         return out
+
+
+def test_ForkComm_distribution_errors():
+    r"""Test that errors are raised for invalid distributions."""
+    from yggdrasil.communication import ForkComm
+    assert_raises(ValueError, ForkComm.ForkComm, 'test',
+                  distribution='invalid')
@@ -1,8 +1,41 @@
+import os
 import numpy as np
 import pandas
+from yggdrasil.communication import PandasFileComm
 from yggdrasil.communication.tests import test_AsciiTableComm as parent
 
 
+def test_PandasFileComm_chunks():
+    r"""Test reading a pandas table in chunks."""
+    test_file = os.path.join(os.getcwd(), 'temp_file.txt')
+    nrow = 10
+    arr = np.zeros(nrow, dtype=[('a', 'float'), ('b', 'int32')])
+    arr['a'] = np.arange(nrow)
+    arr['b'] = 2 * np.arange(nrow)
+    frame = pandas.DataFrame(arr)
+    out = PandasFileComm.PandasFileComm('test', test_file, direction='send')
+    out.open()
+    assert(out.send(frame))
+    out.close()
+    inst = PandasFileComm.PandasFileComm('test', test_file, direction='recv',
+                                         chunk_size=4)
+    inst.open()
+    chunks = []
+    flag = True
+    while flag:
+        flag, x = inst.recv()
+        if flag:
+            chunks.append(x)
+    inst.close()
+    assert([len(x) for x in chunks] == [4, 4, 2])
+    for x in chunks:
+        assert(x.columns.tolist() == ['a', 'b'])
+    result = pandas.concat(chunks, ignore_index=True)
+    np.testing.assert_array_equal(result['a'].values, arr['a'])
+    np.testing.assert_array_equal(result['b'].values, arr['b'])
+    os.remove(test_file)
+
+
 class TestPandasFileComm(parent.TestAsciiTableComm):
     r"""Test for PandasFileComm communication class."""
 
@@ -0,0 +1,24 @@
+import os
+from yggdrasil.communication import PlyFileComm
+from yggdrasil.serialize.PlySerialize import PlySerialize
+
+
+def test_PlyFileComm_binary():
+    r"""Test sending/receiving ply files in binary formats."""
+    test_file = os.path.join(os.getcwd(), 'temp_file.ply')
+    obj = PlySerialize.get_testing_options()['objects'][0]
+    for plyformat in ['binary_little_endian 1.0', 'binary_big_endian 1.0']:
+        out = PlyFileComm.PlyFileComm('test', test_file, direction='send',
+                                      plyformat=plyformat)
+        out.open()
+        assert(out.send(obj))
+        out.close()
+        with open(test_file, 'rb') as fd:
+            assert(('format %s' % plyformat).encode('utf-8') in fd.read())
+        inst = PlyFileComm.PlyFileComm('test', test_file, direction='recv')
+        inst.open()
+        flag, x = inst.recv()
+        inst.close()
+        assert(flag)
+        assert(x == obj)
+        os.remove(test_file)
@@ -2,6 +2,7 @@ import unittest
 import uuid
 import copy
 from yggdrasil.communication import new_comm
+from yggdrasil.tests import assert_equal
 from yggdrasil.communication.tests import test_CommBase
 
 
@@ -66,6 +67,36 @@ class TestServerComm(test_CommBase.TestCommBase):
         assert(flag)
         self.assert_equal(msg_recv, self.test_msg)
 
+    def test_call_persistent(self):
+        r"""Test that the same response comms are used for repeated calls."""
+        for i in range(3):
+            self.test_call()
+            assert(self.send_instance.response_comm is not None)
+            assert_equal(len(self.recv_instance.persistent_response_comms), 1)
+            assert_equal(len(self.send_instance.icomm), 0)
+            assert_equal(len(self.recv_instance.ocomm), 0)
+
+    def test_call_out_of_order(self):
+        r"""Test matching of responses sent out of order to requests."""
+        msgs = [b'request %d' % i for i in range(3)]
+        response_ids = []
+        for x in msgs:
+            flag = self.send_instance.send(x)
+            assert(flag)
+            flag, msg_recv, response_id = self.recv_instance.recv_from(
+                timeout=self.timeout)
+            assert(flag)
+            assert_equal(msg_recv, x)
+            response_ids.append(response_id)
+        for x, response_id in zip(msgs[::-1], response_ids[::-1]):
+            flag = self.recv_instance.send_to(response_id, x)
+            assert(flag)
+        for x in msgs:
+            flag, msg_recv = self.send_instance.recv(timeout=self.timeout)
+            assert(flag)
+            assert_equal(msg_recv, x)
+        assert_equal(len(self.send_instance.response_backlog), 0)
+
     def test_call_alias(self):
         r"""Test RPC call aliases."""
         # self.send_instance.sched_task(0.0, self.send_instance.rpcSend,
@@ -21,6 +21,7 @@ class TestValueComm(parent.TestCommBase):
     test_send_recv_filter_recv_filter = None
     test_send_recv_nolimit = None
     test_send_recv_array = None
+    test_send_recv_binary_payload = None
     test_eof = None
     test_eof_no_close = None
     test_send_recv_dict = None
@@ -4,7 +4,8 @@ from yggdrasil import platform
 from yggdrasil.tests import assert_raises, assert_equal
 from yggdrasil.communication import new_comm
 from yggdrasil.communication.tests import test_CommBase
-from yggdrasil.communication import ZMQComm, IPCComm
+from yggdrasil.communication import CommBase, ZMQComm, IPCComm
+from yggdrasil.metaschema.datatypes import YGG_MSG_HEAD
 
 
 _zmq_installed = ZMQComm.ZMQComm.is_installed(language='python')
@@ -42,6 +43,14 @@ def test_invalid_protocol():
                   commtype='zmq', protocol='invalid')
 
 
+@unittest.skipIf(not _zmq_installed, "ZMQ library not installed")
+def test_reply_msg():
+    r"""Test creating/parsing reply messages confirming several messages."""
+    for n in [1, 5]:
+        assert_equal(ZMQComm.parse_reply_msg(ZMQComm.format_reply_msg(n)), n)
+    assert_equal(ZMQComm.parse_reply_msg(ZMQComm._reply_msg), 1)
+
+
 @unittest.skipIf(not _zmq_installed, "ZMQ library not installed")
 @unittest.skipIf(platform._is_mac, "Testing on MacOS")
 @unittest.skipIf(platform._is_win, "Testing on Windows")
@@ -89,12 +98,129 @@ class TestZMQComm(test_CommBase.TestCommBase):
             raise unittest.SkipTest('Only test once')
         super(TestZMQComm, self).test_send_recv_nolimit()
 
+    def test_send_recv_multipart(self):
+        r"""Send/recv of large message as a single multipart message."""
+        self.send_instance.multipart = True
+        nwork = len(self.send_instance._work_comms)
+        super(TestZMQComm, self).test_send_recv_nolimit()
+        self.assert_equal(len(self.send_instance._work_comms), nwork)
+
     def test_eof_no_close(self):
         r"""Test send/recv of EOF message with no close."""
         if self.__class__ != TestZMQComm:
             raise unittest.SkipTest('Only test once')
         super(TestZMQComm, self).test_eof_no_close()
-        
+
+    def test_wait_for_recv(self):
+        r"""Test waiting for a message by polling the socket."""
+        if self.__class__ != TestZMQComm:
+            raise unittest.SkipTest('Only test once')
+        assert(self.recv_instance.recv_poll_handle is not None)
+        assert(self.send_instance.recv_poll_handle is None)
+        assert(not self.recv_instance.wait_for_recv(0.01))
+        assert(self.send_instance.send(self.test_msg))
+        assert(self.recv_instance.wait_for_recv(self.timeout))
+        flag, msg_recv = self.recv_instance.recv(timeout=self.timeout)
+        assert(flag)
+        self.assert_equal(msg_recv, self.test_msg)
+
+    def test_send_recv_batch(self):
+        r"""Test that messages sent with send_many are sent as a single
+        batch and filtered individually."""
+        if self.__class__ != TestZMQComm:
+            raise unittest.SkipTest('Only test once')
+        self.send_instance.binary_payload = True
+        assert(self.send_instance.batch_messages)
+        self.add_filter(self.recv_instance,
+                        self.get_filter_function(b'b', 'recv'))
+        assert(self.send_instance.send_many([b'a', b'b', b'c']))
+        flag, msgs = self.recv_instance.recv_many(timeout=self.timeout)
+        assert(flag)
+        self.assert_equal(msgs, [b'a', b'c'])
+        self.assert_equal(self.send_instance._n_sent, 1)
+        self.assert_equal(self.recv_instance._n_recv, 1)
+        # Pass through without decoding
+        assert(self.send_instance.send_many([b'd', b'e']))
+        msg = self.recv_instance.recv_message(timeout=self.timeout,
+                                              dont_decode=True)
+        assert(msg.serialized)
+        self.assert_equal(len(self.recv_instance._recv_batch), 1)
+        self.assert_equal(self.recv_instance.n_msg_recv_drain, 1)
+        assert(self.recv_instance.wait_for_recv(0))
+        self.assert_equal(self.recv_instance.deserialize(msg.args)[0], b'd')
+        flag, msg_recv = self.recv_instance.recv(timeout=self.timeout)
+        self.assert_equal(msg_recv, b'e')
+        # Batch is sent with a single header
+        sent = []
+        send_message = self.send_instance.send_message
+
+        def record_message(msg, **kwargs):
+            sent.append(msg.msg)
+            return send_message(msg, **kwargs)
+
+        self.send_instance.send_message = record_message
+        assert(self.send_instance.send_many([b'f', b'g']))
+        self.assert_equal(len(sent), 1)
+        self.assert_equal(sent[0].count(YGG_MSG_HEAD), 2)
+        flag, msgs = self.recv_instance.recv_many(timeout=self.timeout)
+        assert(flag)
+        self.assert_equal(msgs, [b'f', b'g'])
+
+
+class TestZMQCommReplyWindow(TestZMQComm):
+    r"""Test for ZMQComm communication class with windowed confirmation."""
+
+    reply_window = 5
+    reply_interval = 0.0
+
+    @property
+    def send_inst_kwargs(self):
+        r"""Keyword arguments for send instance."""
+        out = super(TestZMQCommReplyWindow, self).send_inst_kwargs
+        out['reply_window'] = self.reply_window
+        out['reply_interval'] = self.reply_interval
+        return out
+
+    def test_send_recv_window(self):
+        r"""Test send/recv of more messages than fit in the window."""
+        nmsg = 2 * self.reply_window + 1
+        self.do_send_recv(n_send=nmsg, n_recv=nmsg)
+        self.send_instance.wait_for_confirm(timeout=self.timeout)
+        self.recv_instance.wait_for_confirm(timeout=self.timeout)
+        assert(self.send_instance.is_confirmed_send)
+        assert(self.recv_instance.is_confirmed_recv)
+        self.assert_equal(self.send_instance._n_reply_sent,
+                          self.send_instance._n_zmq_sent)
+
+    def test_forward_serialized(self):
+        r"""Test that the reply window of the original sender is not
+        included in the header when a serialized message is forwarded."""
+        msg = self.send_instance.prepare_message(self.test_msg)
+        header = self.send_instance.serializer.parse_header(msg.msg)
+        self.assert_equal(header['zmq_reply_window'], self.reply_window)
+        fwd = new_comm('test_forward', direction='send', commtype='zmq')
+        try:
+            msg_fwd = CommBase.CommMessage(args=msg.msg,
+                                           flag=CommBase.FLAG_SUCCESS)
+            msg_fwd.serialized = True
+            msg_fwd = fwd.prepare_message(msg_fwd, skip_processing=True)
+            header_fwd = fwd.serializer.parse_header(msg_fwd.msg)
+            for k in ['zmq_reply_window', 'zmq_reply_interval']:
+                assert(k not in header_fwd)
+            assert(header_fwd['zmq_reply'] != header['zmq_reply'])
+            self.assert_equal(fwd.deserialize(msg_fwd.msg)[0],
+                              self.test_msg)
+        finally:
+            fwd.close()
+
+
+class TestZMQCommReplyInterval(TestZMQCommReplyWindow):
+    r"""Test for ZMQComm communication class with windowed confirmation
+    on an interval."""
+
+    reply_window = 100
+    reply_interval = 0.01
+
     
 # Tests for server/client
 class TestZMQComm_client(TestZMQComm):
@@ -188,6 +314,10 @@ class TestZMQCommREQ(TestZMQComm):
         r"""Test send/recv with conditional."""
         pass
 
+    def test_send_recv_many(self):
+        r"""Test send/recv of several messages with an EOF in a batch."""
+        pass
+
     def test_send_recv_filter_eof(self, **kwargs):
         r"""Test send/recv of EOF with filter."""
         self.setup_filters()
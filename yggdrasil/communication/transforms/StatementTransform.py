@@ -1,9 +1,58 @@
+import ast
 import numpy as np
 from yggdrasil import units
-from yggdrasil.tools import safe_eval
+from yggdrasil.tools import safe_eval, compile_safe_eval
 from yggdrasil.communication.transforms.TransformBase import TransformBase
 
 
+_constant_nodes = tuple(getattr(ast, k) for k in ['Constant', 'Num']
+                        if hasattr(ast, k))
+
+
+def is_elementwise(node):
+    r"""Determine if an expression in terms of the variable x will give the
+    same result when evaluated for a numpy array of Python floats as it
+    does when evaluated for each of the floats. Only numeric constants,
+    x, addition, subtraction, multiplication, division by non-zero
+    constants, negation, and single comparisons are allowed.
+
+    Args:
+        node (ast.AST): Parsed expression.
+
+    Returns:
+        bool: True if the expression is elementwise, False otherwise.
+
+    """
+    if isinstance(node, ast.Expression):
+        return is_elementwise(node.body)
+    if isinstance(node, ast.Name):
+        return (node.id == 'x')
+    if isinstance(node, _constant_nodes):
+        value = getattr(node, 'value', getattr(node, 'n', None))
+        return (type(value) in (int, float))
+    if isinstance(node, ast.UnaryOp):
+        return (isinstance(node.op, (ast.USub, ast.UAdd))
+                and is_elementwise(node.operand))
+    if isinstance(node, ast.BinOp):
+        if isinstance(node.op, ast.Div):
+            # Python raises an error for division by zero
+            if not (isinstance(node.right, _constant_nodes)
+                    and is_elementwise(node.right)
+                    and getattr(node.right, 'value',
+                                getattr(node.right, 'n', 0))):
+                return False
+        elif not isinstance(node.op, (ast.Add, ast.Sub, ast.Mult)):
+            return False
+        return is_elementwise(node.left) and is_elementwise(node.right)
+    if isinstance(node, ast.Compare):
+        return ((len(node.ops) == 1)
+                and isinstance(node.ops[0], (ast.Eq, ast.NotEq, ast.Lt,
+                                             ast.LtE, ast.Gt, ast.GtE))
+                and is_elementwise(node.left)
+                and is_elementwise(node.comparators[0]))
+    return False
+
+
 class StatementTransform(TransformBase):
     r"""Class for transforming messages based on a provided statement using Python syntax.
 
@@ -26,6 +75,18 @@ class StatementTransform(TransformBase):
     def __init__(self, *args, **kwargs):
         super(StatementTransform, self).__init__(*args, **kwargs)
         self.statement = self.statement.replace('%x%', 'x')
+        self._compiled_statement = compile_safe_eval(self.statement)
+        self._elementwise = is_elementwise(
+            ast.parse(self.statement, mode='eval'))
+
+    def __getstate__(self):
+        out = super(StatementTransform, self).__getstate__()
+        out.pop('_compiled_statement', None)
+        return out
+
+    def __setstate__(self, state):
+        super(StatementTransform, self).__setstate__(state)
+        self._compiled_statement = compile_safe_eval(self.statement)
 
     def evaluate_transform(self, x, no_copy=False):
         r"""Call transform on the provided message.
@@ -40,7 +101,36 @@ class StatementTransform(TransformBase):
             bool: True if the message will pass through the transform, False otherwise.
 
         """
-        return safe_eval(self.statement, x=x)
+        return safe_eval(self._compiled_statement, x=x)
+
+    def evaluate_transform_batch(self, xlist, no_copy=False):
+        r"""Call transform on a set of messages. If the messages are all
+        Python floats and the statement only contains operations that give
+        the same result for a numpy array as they do for each float (see
+        is_elementwise), the statement is evaluated once for an array
+        containing all of the messages.
+
+        Args:
+            xlist (list): Message objects to transform.
+            no_copy (bool, optional): If True, the transformation occurs in
+                place. Otherwise a copy is created and transformed. Defaults
+                to False.
+
+        Returns:
+            list: The transformed messages.
+
+        """
+        if ((self._elementwise and (len(xlist) > 1)
+             and all(type(x) is float for x in xlist))):
+            try:
+                out = self.evaluate_transform(np.array(xlist), no_copy=True)
+            except Exception:
+                out = None
+            if (((type(out) is np.ndarray) and (out.shape == (len(xlist), ))
+                 and (out.dtype.kind in 'bf'))):
+                return out.tolist()
+        return super(StatementTransform, self).evaluate_transform_batch(
+            xlist, no_copy=no_copy)
 
     @classmethod
     def get_testing_options(cls):
@@ -61,5 +151,12 @@ class StatementTransform(TransformBase):
                 'in/out': [(1.0, units.add_units(1.0, 'cm')),
                            (2.0, units.add_units(2.0, 'cm'))]},
                {'kwargs': {'statement': '%x%**3'},
-                'in/out': [(iter([1, 2]), iter([1, 8]))]}]
+                'in/out': [(iter([1, 2]), iter([1, 8]))]},
+               {'kwargs': {'statement': '2.0 * %x%'},
+                'in/out': [(iter([1.0, 2.0]), iter([2.0, 4.0]))]},
+               {'kwargs': {'statement': '1.0/%x%'},
+                'in/out': [(iter([1.0, 0.0]), ZeroDivisionError)]},
+               {'kwargs': {'statement': '%x% * array([1.0, 1.0])'},
+                'in/out': [(iter([1.0, 2.0]),
+                            iter([np.ones(2), 2 * np.ones(2)]))]}]
         return out
@@ -91,6 +91,21 @@ class TransformBase(ComponentBase):
         """
         raise NotImplementedError
 
+    def evaluate_transform_batch(self, xlist, no_copy=False):
+        r"""Call transform on a set of messages.
+
+        Args:
+            xlist (list): Message objects to transform.
+            no_copy (bool, optional): If True, the transformation occurs in
+                place. Otherwise a copy is created and transformed. Defaults
+                to False.
+
+        Returns:
+            list: The transformed messages.
+
+        """
+        return [self.evaluate_transform(x, no_copy=no_copy) for x in xlist]
+
     def __call__(self, x, no_copy=False, no_init=False):
         r"""Call transform on the provided message.
 
@@ -112,8 +127,7 @@ class TransformBase(ComponentBase):
             xlist = list(x)
             if (not self.original_datatype) and (not no_init) and xlist:
                 self.set_original_datatype(encode_type(xlist[0]))
-            out = iter([self.evaluate_transform(xx, no_copy=no_copy)
-                        for xx in xlist])
+            out = iter(self.evaluate_transform_batch(xlist, no_copy=no_copy))
         else:
             if (not self.original_datatype) and (not no_init):
                 self.set_original_datatype(encode_type(x))
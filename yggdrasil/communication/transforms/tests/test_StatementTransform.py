@@ -0,0 +1,32 @@
+from yggdrasil.tests import assert_equal, assert_raises
+from yggdrasil.communication.transforms.StatementTransform import (
+    StatementTransform)
+
+
+def test_evaluate_transform_batch():
+    r"""Test that evaluating a statement for a batch of messages gives the
+    same result as evaluating it for each message."""
+    xlist = [4.0, -1.0, 0.5, 0.0, -0.0, 1e308, float('inf')]
+    for statement in ['%x%**0.5', '2.0 * %x% - 1', '-%x% / 2.0 + 1 > 0',
+                      '%x% * %x% + 1e308', '%x% * array([1.0, 1.0])']:
+        inst = StatementTransform(statement=statement)
+        out = inst.evaluate_transform_batch(xlist)
+        exp = [inst.evaluate_transform(x) for x in xlist]
+        assert_equal(out, exp)
+        assert_equal([type(x) for x in out], [type(x) for x in exp])
+    for statement in ['1.0/%x%', '%x% / 0.0']:
+        inst = StatementTransform(statement=statement)
+        assert_raises(ZeroDivisionError, inst.evaluate_transform_batch,
+                      [1.0, 0.0])
+
+
+def test_is_elementwise():
+    r"""Test detection of statements that can be evaluated for an array of
+    messages."""
+    for statement, result in [('%x%**0.5', False), ('1.0/%x%', False),
+                              ('%x% / 0', False), ('%x% / 2.0', True),
+                              ('-%x% * 3 + 1.5', True), ('%x% < 1', True),
+                              ('0 < %x% < 1', False), ('abs(%x%)', False),
+                              ('%x% * array([1.0])', False)]:
+        inst = StatementTransform(statement=statement)
+        assert_equal(inst._elementwise, result)
@@ -87,9 +87,30 @@ _cfg_map = {
         'env': 'YGG_TEST_PRODUCTION_RUNS',
         'action': 'store_true',
         'help': 'Run production level tests when encountered.'},
+    ('compilation', 'build_cache_dir'): {
+        'env': 'YGG_BUILD_CACHE_DIR', 'type': str,
+        'help': ('Directory where compiled products are cached. Defaults '
+                 'to ~/.yggdrasil_build_cache.')},
+    ('compilation', 'build_cache_size'): {
+        'env': 'YGG_BUILD_CACHE_SIZE', 'type': float,
+        'help': ('Maximum size of the compilation cache in MB. A value of '
+                 '0 disables caching.')},
+    ('compilation', 'build_jobs'): {
+        'env': 'YGG_BUILD_JOBS', 'type': int,
+        'help': ('Maximum number of compilation jobs that should be run '
+                 'at the same time. Defaults to the number of CPUs.')},
     ('general', 'default_comm'): {
         'env': 'YGG_DEFAULT_COMM', 'type': str,
-        'help': 'Comm type that should be used by default.'}
+        'help': 'Comm type that should be used by default.'},
+    ('general', 'interpreter_pool'): {
+        'env': 'YGG_INTERPRETER_POOL', 'action': 'store_true',
+        'help': ('Start Python and domain specific language models from a '
+                 'pool of interpreters that have already imported '
+                 'yggdrasil (Decreases model startup time).')},
+    ('general', 'interpreter_pool_modules'): {
+        'env': 'YGG_INTERPRETER_POOL_MODULES', 'type': str,
+        'help': ('Comma separated list of modules that should be imported '
+                 'by the interpreter pool before models are started.')}
 }
 _key2env = {}
 for k, v in _cfg_map.items():
@@ -564,6 +564,7 @@ class CMakeBuilder(LinkerBase):
                                 ('configuration', '--config')])
     executable_ext = ''
     tool_suffix_format = ''
+    build_cache = False
 
     @classmethod
     def call(cls, *args, **kwargs):
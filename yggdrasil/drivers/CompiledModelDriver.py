@@ -6,8 +6,12 @@ import glob
 import logging
 import subprocess
 import shutil
+import functools
+import threading
 from collections import OrderedDict
-from yggdrasil import platform, tools, scanf
+from contextlib import contextmanager
+from concurrent import futures
+from yggdrasil import platform, tools, scanf, build_cache
 from yggdrasil.drivers.ModelDriver import ModelDriver, remove_products
 from yggdrasil.components import import_component
 
@@ -24,6 +28,178 @@ if _conda_prefix is not None:
     _system_suffix += '_' + os.path.basename(_conda_prefix)
 if _venv_prefix is not None:
     _system_suffix += '_' + os.path.basename(_venv_prefix)
+_product_locks = {}
+_product_locks_lock = threading.Lock()
+_build_semaphores = {}
+_deferred_builds = None
+
+
+def get_build_jobs():
+    r"""Determine the maximum number of compilation jobs that should be run
+    at the same time from the 'build_jobs' option in the 'compilation'
+    section of the yggdrasil config file (or YGG_BUILD_JOBS).
+
+    Returns:
+        int: Number of jobs. Defaults to the number of CPUs.
+
+    """
+    from yggdrasil.config import ygg_cfg
+    out = ygg_cfg.get('compilation', 'build_jobs', None)
+    if out is None:
+        out = os.cpu_count()
+    return max(int(out or 1), 1)
+
+
+def get_product_lock(product):
+    r"""Get the lock that should be held while a product is built so that
+    concurrent builds of the same product are serialized.
+
+    Args:
+        product (str): Full path to the product.
+
+    Returns:
+        threading.RLock: Lock for the product.
+
+    """
+    key = os.path.normcase(os.path.abspath(product))
+    with _product_locks_lock:
+        if key not in _product_locks:
+            _product_locks[key] = threading.RLock()
+        return _product_locks[key]
+
+
+@contextmanager
+def build_slot():
+    r"""Context manager that waits until fewer than the maximum number of
+    compilation jobs (see get_build_jobs) are running in this process
+    before entering. The limit is shared by all threads so that nested
+    calls to run_build_jobs (e.g. compiling the sources for several models
+    at once) do not run more compilation processes than the limit.
+
+    """
+    njobs = get_build_jobs()
+    with _product_locks_lock:
+        if njobs not in _build_semaphores:
+            _build_semaphores[njobs] = threading.BoundedSemaphore(njobs)
+        semaphore = _build_semaphores[njobs]
+    with semaphore:
+        yield
+
+
+def run_build_jobs(jobs, dependencies=None, njobs=None):
+    r"""Run build jobs concurrently, waiting to start each job until the
+    jobs it depends on have completed.
+
+    Args:
+        jobs (OrderedDict): Functions taking no arguments that should be
+            called, keyed by a unique job name. Jobs will be started in
+            the order provided once their dependencies are met.
+        dependencies (dict, optional): Names of jobs that must be completed
+            before a job can be started, keyed by job name. Dependencies that
+            are not in jobs are ignored. Defaults to None and all jobs are
+            independent.
+        njobs (int, optional): Maximum number of jobs to run at the same
+            time. Defaults to None and get_build_jobs is used. Jobs run in
+            separate threads, but the compilation processes they start are
+            limited across all threads by build_slot.
+
+    Returns:
+        OrderedDict: Values returned by each job.
+
+    Raises:
+        RuntimeError: If there are circular dependencies.
+        Exception: The first error raised by a job is re-raised once running
+            jobs have finished. Jobs that were not started will be skipped.
+
+    """
+    if dependencies is None:
+        dependencies = {}
+    if njobs is None:
+        njobs = get_build_jobs()
+    remaining = OrderedDict(
+        (k, [x for x in dependencies.get(k, []) if (x in jobs) and (x != k)])
+        for k in jobs.keys())
+    results = {}
+
+    def get_ready():
+        return [k for k, v in remaining.items()
+                if all(x in results for x in v)]
+
+    if (njobs == 1) or (len(jobs) == 1):
+        while remaining:
+            ready = get_ready()
+            if not ready:
+                raise RuntimeError("Circular build dependencies: %s"
+                                   % list(remaining.keys()))
+            k = ready[0]
+            del remaining[k]
+            results[k] = jobs[k]()
+    else:
+        running = {}
+        error = None
+        with futures.ThreadPoolExecutor(max_workers=njobs) as executor:
+            while remaining or running:
+                if error is None:
+                    for k in get_ready():
+                        del remaining[k]
+                        running[executor.submit(jobs[k])] = k
+                    if remaining and not running:
+                        error = RuntimeError(
+                            "Circular build dependencies: %s"
+                            % list(remaining.keys()))
+                if not running:
+                    break
+                done, _ = futures.wait(list(running.keys()),
+                                       return_when=futures.FIRST_COMPLETED)
+                for f in done:
+                    k = running.pop(f)
+                    try:
+                        results[k] = f.result()
+                    except BaseException as e:
+                        if error is None:
+                            error = e
+        if error is not None:
+            raise error
+    return OrderedDict((k, results[k]) for k in jobs.keys())
+
+
+@contextmanager
+def deferred_compilation(njobs=None):
+    r"""Context manager that defers the compilation of CompiledModelDriver
+    instances created within the context until the context exits, at which
+    point the models are compiled concurrently. Instances sharing a model
+    file (e.g. copies) are compiled one after another by the same job.
+
+    Args:
+        njobs (int, optional): Maximum number of models that should be
+            compiled at the same time. Defaults to None and get_build_jobs
+            is used.
+
+    Yields:
+        list: Instances that have been deferred.
+
+    """
+    global _deferred_builds
+    if _deferred_builds is not None:  # pragma: debug
+        yield _deferred_builds
+        return
+    _deferred_builds = []
+    try:
+        yield _deferred_builds
+        groups = OrderedDict()
+        for x in _deferred_builds:
+            groups.setdefault(x.model_file, []).append(x)
+    finally:
+        _deferred_builds = None
+
+    def build_group(group):
+        def build():
+            for x in group:
+                x.compile_model_instance()
+        return build
+
+    run_build_jobs(OrderedDict((k, build_group(v)) for k, v in groups.items()),
+                   njobs=njobs)
 
 
 def get_compatible_tool(tool, tooltype, language, default=False):
@@ -315,6 +491,8 @@ class CompilationToolBase(object):
         remove_product_exts (list): List of extensions or directories matching
             entries in product_exts and product_files that should be removed
             during cleanup. Be careful when adding files to this list.
+        build_cache (bool): If True, products produced by the tool will be
+            stored in and restored from the build cache.
 
     """
 
@@ -352,6 +530,7 @@ class CompilationToolBase(object):
     toolset = None
     compatible_toolsets = []
     is_build_tool = False
+    build_cache = True
     tool_suffix_format = '_%sx'
     _language_ext = None  # only update once per class
     
@@ -1037,6 +1216,23 @@ class CompilationToolBase(object):
                 if isrc in products:  # pragma: debug
                     products.remove(isrc)
 
+    @classmethod
+    def get_build_cache(cls):
+        r"""Get the build cache that should be used for products produced
+        by this tool.
+
+        Returns:
+            BuildCache: Build cache. None is returned if the tool dosn't
+                support caching or caching is disabled.
+
+        """
+        if cls.is_build_tool or (not cls.build_cache):
+            return None
+        out = build_cache.get_build_cache()
+        if not out.enabled:
+            return None
+        return out
+
     @classmethod
     def call(cls, args, language=None, toolname=None, skip_flags=False,
              dry_run=False, out=None, overwrite=False, products=None,
@@ -1067,7 +1263,10 @@ class CompilationToolBase(object):
                 be ignored if skip_flags is True.
             overwrite (bool, optional): If True, the existing compile file will
                 be overwritten. Otherwise, it will be kept and this function
-                will return without recompiling the source file.
+                will return without recompiling the source file unless the
+                build cache indicates it was built from different inputs.
+                In either case, products will be restored from the build
+                cache if it contains an entry for the current inputs.
             products (list, optional): Existing Python list that additional
                 products produced by the compilation should be appended to.
                 Defaults to None and is ignored.
@@ -1098,6 +1297,7 @@ class CompilationToolBase(object):
         language = kwargs.pop('%s_language' % cls.tooltype, language)
         cls = cls.get_alternate_class(toolname=toolname,
                                       language=language)
+        cache = None
         # Add additional arguments
         if isinstance(args, (str, bytes)):
             args = [args]
@@ -1116,66 +1316,97 @@ class CompilationToolBase(object):
                    and (working_dir is not None))):
                 out = os.path.join(working_dir, out)
             assert(out not in args)  # Don't remove source files
-            # Check for file
-            if overwrite and (not dry_run):
-                cls.remove_products(args, out)
-                if os.path.isfile(out) or os.path.isdir(out):  # pragma: debug
-                    raise RuntimeError("Product not removed: %s" % out)
-            if (not dry_run) and (os.path.isfile(out) or os.path.isdir(out)):
-                cls.append_product(products, args, out)
-                return out
-            kwargs['outfile'] = out
-        # Get command
-        unused_kwargs = kwargs.pop('unused_kwargs', {})
-        cmd = cls.get_executable_command(args, skip_flags=skip_flags,
-                                         unused_kwargs=unused_kwargs,
-                                         cwd=working_dir, **kwargs)
-        # Return if dry run, adding potential output to product
-        if dry_run:
-            if skip_flags:
-                return ''
-            else:
-                if out != 'clean':
+        # Serialize concurrent builds of the same product
+        if (not skip_flags) and (not dry_run) and (out != 'clean'):
+            lock = get_product_lock(out)
+            if not os.path.isdir(out):
+                cache = cls.get_build_cache()
+        else:
+            lock = threading.RLock()
+        with lock:
+            if (not skip_flags):
+                # Check for file
+                if overwrite and (not dry_run):
+                    cls.remove_products(args, out)
+                    if os.path.isfile(out) or os.path.isdir(out):  # pragma: debug
+                        raise RuntimeError("Product not removed: %s" % out)
+                if ((cache is None) and (not dry_run)
+                        and (os.path.isfile(out) or os.path.isdir(out))):
                     cls.append_product(products, args, out)
-                return out
-        # Run command
-        output = ''
-        try:
-            if (not skip_flags) and ('env' not in unused_kwargs):
-                unused_kwargs['env'] = cls.set_env()
-            logger.debug('Command: "%s"' % ' '.join(cmd))
-            proc = tools.popen_nobuffer(cmd, **unused_kwargs)
-            output, err = proc.communicate()
-            output = output.decode("utf-8")
-            if (proc.returncode != 0) and (not allow_error):
-                raise RuntimeError("Command '%s' failed with code %d:\n%s."
-                                   % (' '.join(cmd), proc.returncode, output))
+                    return out
+                kwargs['outfile'] = out
+            # Get command
+            unused_kwargs = kwargs.pop('unused_kwargs', {})
+            cmd = cls.get_executable_command(args, skip_flags=skip_flags,
+                                             unused_kwargs=unused_kwargs,
+                                             cwd=working_dir, **kwargs)
+            # Check for up-to-date or cached products
+            if cache is not None:
+                new_products = []
+                cls.append_product(new_products, args, out)
+                cache_key = cache.get_key(cmd, args, working_dir=working_dir,
+                                          executable=cls.get_executable(
+                                              full_path=True),
+                                          suffix=suffix,
+                                          products=new_products)
+                if os.path.isfile(out):
+                    if not cache.is_stale(out, cache_key):
+                        cls.append_product(products, args, out)
+                        return out
+                    logger.debug("Inputs changed since %s was built" % out)
+                    cls.remove_products(args, out)
+                if cache.restore(cache_key, out):
+                    cls.append_product(products, args, out)
+                    return out
+            # Return if dry run, adding potential output to product
+            if dry_run:
+                if skip_flags:
+                    return ''
+                else:
+                    if out != 'clean':
+                        cls.append_product(products, args, out)
+                    return out
+            # Run command
+            output = ''
             try:
-                logger.debug(' '.join(cmd) + '\n' + output)
-            except UnicodeDecodeError:  # pragma: debug
-                tools.print_encoded(output)
-        except (subprocess.CalledProcessError, OSError) as e:
-            if not allow_error:
-                raise RuntimeError("Could not call command '%s': %s"
-                                   % (' '.join(cmd), e))
-        except BaseException as e:
-            print("Unexpected call error: %s" % e)
-            print(e, type(e))
-            raise
-        # Check for output
-        if (not skip_flags):
-            if (out != 'clean'):
-                if not (os.path.isfile(out)
-                        or os.path.isdir(out)):  # pragma: debug
-                    logger.error('%s\n%s' % (' '.join(cmd), output))
-                    raise RuntimeError(("%s tool, %s, failed to produce "
-                                        "result '%s'")
-                                       % (cls.tooltype.title(), cls.toolname, out))
-                logger.debug("%s %s produced %s"
-                             % (cls.tooltype.title(), cls.toolname, out))
-                cls.append_product(products, args, out)
-            return out
-        return output
+                if (not skip_flags) and ('env' not in unused_kwargs):
+                    unused_kwargs['env'] = cls.set_env()
+                logger.debug('Command: "%s"' % ' '.join(cmd))
+                with build_slot():
+                    proc = tools.popen_nobuffer(cmd, **unused_kwargs)
+                    output, err = proc.communicate()
+                output = output.decode("utf-8")
+                if (proc.returncode != 0) and (not allow_error):
+                    raise RuntimeError("Command '%s' failed with code %d:\n%s."
+                                       % (' '.join(cmd), proc.returncode, output))
+                try:
+                    logger.debug(' '.join(cmd) + '\n' + output)
+                except UnicodeDecodeError:  # pragma: debug
+                    tools.print_encoded(output)
+            except (subprocess.CalledProcessError, OSError) as e:
+                if not allow_error:
+                    raise RuntimeError("Could not call command '%s': %s"
+                                       % (' '.join(cmd), e))
+            except BaseException as e:
+                print("Unexpected call error: %s" % e)
+                print(e, type(e))
+                raise
+            # Check for output
+            if (not skip_flags):
+                if (out != 'clean'):
+                    if not (os.path.isfile(out)
+                            or os.path.isdir(out)):  # pragma: debug
+                        logger.error('%s\n%s' % (' '.join(cmd), output))
+                        raise RuntimeError(("%s tool, %s, failed to produce "
+                                            "result '%s'")
+                                           % (cls.tooltype.title(), cls.toolname, out))
+                    logger.debug("%s %s produced %s"
+                                 % (cls.tooltype.title(), cls.toolname, out))
+                    if (cache is not None) and os.path.isfile(out):
+                        cache.store(cache_key, out, new_products[1:])
+                    cls.append_product(products, args, out)
+                return out
+            return output
 
 
 class CompilerBase(CompilationToolBase):
@@ -1569,10 +1800,20 @@ class CompilerBase(CompilationToolBase):
                 kwargs_link = tool.extract_kwargs(kwargs, compiler=cls)
             else:
                 kwargs.pop('linker_language', None)
+            # Compile sources concurrently, collecting products in order
+            products = kwargs.pop('products', None)
+            jobs = OrderedDict()
+            for i, (isrc, iout) in enumerate(zip(args, out_comp)):
+                jobs[i] = functools.partial(
+                    cls.call, isrc, out=iout, dont_link=True, products=[],
+                    **copy.deepcopy(kwargs))
             obj_list = []
-            for isrc, iout in zip(args, out_comp):
-                iobj = cls.call(isrc, out=iout, dont_link=True, **kwargs)
-                obj_list.append(iobj)
+            for k, v in run_build_jobs(jobs).items():
+                obj_list.append(v)
+                if products is not None:
+                    for x in jobs[k].keywords['products']:
+                        if x not in products:
+                            products.append(x)
             if dont_link:
                 return obj_list
             # Link/archive
@@ -2108,10 +2349,17 @@ class CompiledModelDriver(ModelDriver):
         super(CompiledModelDriver, self).__init__(name, args, **kwargs)
         # Compile
         if not skip_compile:
-            self.compile_model()
-            self.products.append(self.model_file)
-            assert(os.path.isfile(self.model_file))
-            self.debug("Compiled %s", self.model_file)
+            if _deferred_builds is not None:
+                _deferred_builds.append(self)
+            else:
+                self.compile_model_instance()
+
+    def compile_model_instance(self):
+        r"""Compile the model executable and add it to the products."""
+        self.compile_model()
+        self.products.append(self.model_file)
+        assert(os.path.isfile(self.model_file))
+        self.debug("Compiled %s", self.model_file)
 
     @staticmethod
     def after_registration(cls, **kwargs):
@@ -3572,14 +3820,34 @@ class CompiledModelDriver(ModelDriver):
             base_cls.compile_dependencies(toolname=toolname, **kwargs)
         if (dep is not None) and cls.is_installed() and (dep not in base_libraries):
             dep_order = cls.get_dependency_order(dep, toolname=toolname)
+            # Compile libraries concurrently once their dependencies are built
+            jobs = OrderedDict()
+            dependencies = {}
             for k in dep_order[::-1]:
                 if isinstance(k, tuple):
                     assert(len(k) == 2)
+                    dep_lang, dep_name = k
                     ikw = dict(kwargs, language=k[0],
                                toolname=get_compatible_tool(compiler, 'compiler', k[0]))
-                    cls.call_compiler(k[1], **ikw)
                 else:
-                    cls.call_compiler(k, toolname=toolname, **kwargs)
+                    dep_lang, dep_name = cls.language, k
+                    ikw = dict(kwargs, toolname=toolname)
+                ikw['products'] = []
+                jobs[k] = functools.partial(cls.call_compiler, dep_name, **ikw)
+                dependencies[k] = []
+                info = import_component('model', dep_lang).get_dependency_info(
+                    dep_name, default={})
+                for x in info.get('internal_dependencies', []):
+                    if not isinstance(x, tuple):
+                        x = (dep_lang, x)
+                    if x[0] == cls.language:
+                        x = x[1]
+                    dependencies[k].append(x)
+            run_build_jobs(jobs, dependencies=dependencies)
+            for v in jobs.values():
+                for x in v.keywords['products']:
+                    if x not in kwargs['products']:
+                        kwargs['products'].append(x)
 
     @classmethod
     def cleanup_dependencies(cls, products=None, verbose=False, **kwargs):
@@ -3640,8 +3908,15 @@ class CompiledModelDriver(ModelDriver):
             kwargs.setdefault(k, v)
         if ((isinstance(kwargs['out'], str) and os.path.isfile(kwargs['out'])
              and (not kwargs['overwrite']))):
-            self.debug("Result already exists: %s", kwargs['out'])
-            return kwargs['out']
+            # Products recorded by the build cache are checked against
+            # the current sources during compilation
+            cache = self.get_tool('compiler', toolname=kwargs['toolname'],
+                                  default=None)
+            if cache is not None:
+                cache = cache.get_build_cache()
+            if (cache is None) or (not cache.has_record(kwargs['out'])):
+                self.debug("Result already exists: %s", kwargs['out'])
+                return kwargs['out']
         if 'env' not in kwargs:
             kwargs['env'] = self.set_env(for_compile=True,
                                          toolname=kwargs['toolname'])
@@ -5,7 +5,7 @@ import numpy as np
 import functools
 import queue
 from yggdrasil import multitasking
-from yggdrasil.communication import new_comm, CommBase
+from yggdrasil.communication import new_comm, CommBase, AsyncComm
 from yggdrasil.drivers.Driver import Driver
 from yggdrasil.components import create_component, isinstance_component
 
@@ -147,6 +147,17 @@ class ConnectionDriver(Driver):
         onexit (str, optional): Class method that should be called when a
             model that the connection interacts with exits, but before the
             connection driver is shut down. Defaults to None.
+        distribution (str, optional): How messages should be divided between
+            the copies of output models that have more than one copy. Options
+            are 'broadcast' (all copies receive every message), 'scatter'
+            (each message is sent to an idle copy), 'round_robin' (copies
+            receive messages in turn), and 'least_loaded' (each message is
+            sent to the copy with the fewest queued messages). Defaults to
+            'broadcast'.
+        ordered (bool, optional): If True, messages tagged with a work index
+            by a connection that distributed work between copies of a model
+            are sent in the order that the copies received the work instead
+            of the order that they were received. Defaults to False.
         **kwargs: Additonal keyword arguments are passed to the parent class.
 
     Attributes:
@@ -166,6 +177,15 @@ class ConnectionDriver(Driver):
             loop.
         onexit (str): Class method that should be called when the corresponding
             model exits, but before the driver is shut down.
+        distribution (str): How messages are divided between the copies of
+            output models that have more than one copy.
+        ordered (bool): If True, messages tagged with a work index are sent
+            in order of their work index.
+        passthrough (bool): True if serialized messages are being forwarded
+            from the input communicator to the output communicator without
+            being decoded and encoded again. This is enabled after the first
+            message if there are no translators, transforms, or filters and
+            both communicators use the same datatype.
 
     """
 
@@ -208,7 +228,25 @@ class ConnectionDriver(Driver):
                        'items': {'oneOf': [
                            {'type': 'function'},
                            {'$ref': '#/definitions/transform'}]}},
-        'onexit': {'type': 'string'}}
+        'onexit': {'type': 'string'},
+        'distribution': {
+            'type': 'string', 'default': 'broadcast',
+            'enum': ['broadcast', 'scatter', 'round_robin', 'least_loaded'],
+            'description': (
+                'How messages should be divided between the copies of '
+                'output models with more than one copy. \'broadcast\' '
+                'sends every message to all copies, \'scatter\' sends '
+                'each message to an idle copy, \'round_robin\' sends '
+                'messages to the copies in turn, and \'least_loaded\' '
+                'sends each message to the copy with the fewest queued '
+                'messages.')},
+        'ordered': {
+            'type': 'boolean', 'default': False,
+            'description': (
+                'If True, messages output by copies of a model that '
+                'received work from a connection with a \'distribution\' '
+                'other than \'broadcast\' will be sent in the order that '
+                'the work was distributed.')}}
     _schema_excluded_from_class_validation = ['inputs', 'outputs']
     _disconnect_attr = Driver._disconnect_attr + [
         '_comm_closed', '_skip_after_loop', 'shared', 'task_thread']
@@ -227,7 +265,11 @@ class ConnectionDriver(Driver):
         self._eof_sent = False
         self._first_send_done = False
         self._used = False
+        self.passthrough = False
         self.onexit = None
+        self._n_eof_recv = 0
+        self._ordered_next = 0
+        self._ordered_buffer = {}
         self.task_thread = None
         if self.as_process:
             self.task_thread = RemoteTaskLoop(
@@ -302,6 +344,7 @@ class ConnectionDriver(Driver):
                     for idx in range(comm_list[i]['partner_copies'])]
                 for k in ForkComm.ForkComm.child_keys:
                     comm_list[i].pop(k, None)
+                comm_list[i]['distribution'] = self.distribution
         comm_kws['commtype'] = copy.deepcopy(comm_list)
         self.debug('%s comm_kws:\n%s', attr_comm, self.pprint(comm_kws, 1))
         setattr(self, attr_comm, new_comm(**comm_kws))
@@ -797,7 +840,9 @@ class ConnectionDriver(Driver):
             return bool(msg.flag)
 
     def on_eof(self, msg):
-        r"""Actions to take when EOF received.
+        r"""Actions to take when EOF received. If the input comm receives
+        messages from more than one copy of a model, the loop continues until
+        an EOF has been received from each copy.
 
         Args:
             msg (CommMessage): Message object that provided the EOF.
@@ -806,6 +851,11 @@ class ConnectionDriver(Driver):
             CommMessage, bool: Value that should be returned by recv_message on EOF.
 
         """
+        self._n_eof_recv += 1
+        if self._n_eof_recv < self.icomm.partner_copies:
+            self.debug('EOF received from %d/%d model copies',
+                       self._n_eof_recv, self.icomm.partner_copies)
+            return True
         with self.lock:
             self.debug('EOF received')
             self.state = 'eof'
@@ -830,6 +880,44 @@ class ConnectionDriver(Driver):
             msg.args = t(msg.args)
         return msg
 
+    def order_message(self, msg):
+        r"""Buffer a message so that messages tagged with a work index are
+        sent in order. Messages without a work index or with a work index
+        that has already been sent are returned immediately.
+
+        Args:
+            msg (CommMessage): Processed message.
+
+        Returns:
+            list: Messages that can be sent.
+
+        """
+        idx = None
+        if self.ordered and msg.header:
+            idx = msg.header.get('work_index', None)
+        if (idx is None) or (idx < self._ordered_next):
+            return [msg]
+        self._ordered_buffer.setdefault(idx, []).append(msg)
+        out = []
+        while self._ordered_next in self._ordered_buffer:
+            out += self._ordered_buffer.pop(self._ordered_next)
+            self._ordered_next += 1
+        return out
+
+    def flush_ordered(self):
+        r"""Get all messages remaining in the buffer used to order messages
+        in order of their work index, regardless of any missing indices.
+
+        Returns:
+            list: Buffered messages.
+
+        """
+        out = []
+        for idx in sorted(self._ordered_buffer.keys()):
+            out += self._ordered_buffer.pop(idx)
+            self._ordered_next = idx + 1
+        return out
+
     def update_serializer(self, msg):
         r"""Update the serializer for the output comm based on input."""
         self.debug('Before update:\n'
@@ -927,6 +1015,30 @@ class ConnectionDriver(Driver):
                                    args=self.ocomm.eof_msg)
         return self.send_message(msg)
 
+    @property
+    def can_passthrough(self):
+        r"""bool: True if serialized messages can be forwarded from the input
+        comm to the output comm without being decoded and encoded again."""
+        if self.translator or self.single_use or (not self._first_send_done):
+            return False
+        for x in [self.icomm, self.ocomm]:
+            if ((x.filter or x.transform or x.any_files or x.no_serialization
+                 or (x._commtype == 'fork') or x.is_client or x.is_server
+                 or x.is_response_client or x.is_response_server)):
+                return False
+        return (isinstance(self.icomm, AsyncComm.AsyncComm)
+                and (self.icomm.serializer.serializer_info
+                     == self.ocomm.serializer.serializer_info)
+                and (self.icomm.serializer.typedef
+                     == self.ocomm.serializer.typedef))
+
+    def enable_passthrough(self):
+        r"""Begin receiving messages from the input comm without decoding them
+        so that they can be forwarded to the output comm."""
+        self.debug("Enabling passthrough of serialized messages")
+        self.passthrough = True
+        self.icomm.async_recv_kwargs['dont_decode'] = True
+
     def send_message(self, msg, **kwargs):
         r"""Send a single message.
 
@@ -944,7 +1056,18 @@ class ConnectionDriver(Driver):
             self._used = True
         kws_prepare = {k: kwargs.pop(k) for k in self.ocomm._prepare_message_kws
                        if k in kwargs}
-        msg_out = self.ocomm.prepare_message(msg.args, **kws_prepare)
+        if (((msg.serialized and msg.header.get('binary_size', 0))
+             and (not self.ocomm.binary_payload))):
+            # The output partner cannot decode binary payloads
+            msg.args = self.icomm.deserialize(msg.args)[0]
+            msg.serialized = False
+        if msg.serialized:
+            msg_out = CommBase.CommMessage(args=msg.args, flag=msg.flag)
+            msg_out.serialized = True
+            kws_prepare['skip_processing'] = True
+            msg_out = self.ocomm.prepare_message(msg_out, **kws_prepare)
+        else:
+            msg_out = self.ocomm.prepare_message(msg.args, **kws_prepare)
         if self._first_send_done:
             flag = self._send_message(msg_out, **kwargs)
         else:
@@ -984,6 +1107,11 @@ class ConnectionDriver(Driver):
         msg = self.recv_message()
         if msg is False:
             self.debug('No more messages')
+            for x in self.flush_ordered():
+                if self.send_message(x) is False:  # pragma: debug
+                    self.error('Could not send buffered message.')
+                    break
+                self.nsent += 1
             self.set_break_flag()
             self.set_close_state('receiving')
             return
@@ -1016,13 +1144,21 @@ class ConnectionDriver(Driver):
         self.state = 'processed'
         self.debug('Processed message.')
         # Send a message
-        self.state = 'sending'
-        ret = self.send_message(msg)
-        if ret is False:
-            self.error('Could not send message.')
-            self.set_break_flag()
-            self.set_close_state('sending')
+        msg_list = self.order_message(msg)
+        if not msg_list:
+            self.state = 'buffered'
+            self.debug('Buffered message until preceding work is sent.')
             return
-        self.nsent += 1
+        self.state = 'sending'
+        for x in msg_list:
+            ret = self.send_message(x)
+            if ret is False:
+                self.error('Could not send message.')
+                self.set_break_flag()
+                self.set_close_state('sending')
+                return
+            self.nsent += 1
         self.state = 'sent'
         self.debug('Sent message to %s.', self.ocomm.address)
+        if (not self.passthrough) and self.can_passthrough:
+            self.enable_passthrough()
@@ -1,5 +1,5 @@
 import os
-from yggdrasil import multitasking, platform
+from yggdrasil import multitasking, platform, interpreter_pool
 from yggdrasil.components import import_component
 from yggdrasil.drivers.InterpretedModelDriver import InterpretedModelDriver
 
@@ -55,10 +55,13 @@ class DSLModelDriver(InterpretedModelDriver):  # pragma: no cover
         return None
 
     @classmethod
-    def model_wrapper_no_forward(cls, *args, **kwargs):
+    def model_wrapper_no_forward(cls, *args, pool_working_dir=None, **kwargs):
         if not platform._is_win:
             # TODO: Unsure how to do this on windows
             os.setpgrp()
+        if pool_working_dir is not None:
+            interpreter_pool.prepare_child(env=kwargs.get('env', None),
+                                           working_dir=pool_working_dir)
         return cls.model_wrapper(*args, **kwargs)
     
     @classmethod
@@ -113,9 +116,13 @@ class DSLModelDriver(InterpretedModelDriver):  # pragma: no cover
         self.debug('Model file: %s', self.model_file)
         self.debug('Environment Variables:\n%s',
                    self.pprint(kwargs['env'], block_indent=1))
+        # Start from the interpreter pool if enabled and compatible
+        context = interpreter_pool.get_context(kwargs['env'])
+        if context is not None:
+            kwargs['pool_working_dir'] = os.getcwd()
         p = multitasking.YggTask(task_method='process', with_pipe=True,
                                  target=self.model_wrapper_no_forward,
-                                 args=args, kwargs=kwargs)
+                                 args=args, kwargs=kwargs, context=context)
         p.start()
         if return_process:
             return p
@@ -2,6 +2,8 @@ import os
 import re
 import sys
 import copy
+import codecs
+import select
 import logging
 import warnings
 import subprocess
@@ -419,6 +421,8 @@ class ModelDriver(Driver):
         self.model_process = None
         self.queue = multitasking.Queue()
         self.queue_thread = None
+        self.output_scheduler = None
+        self._output_decoder = None
         self.event_process_kill_called = multitasking.Event()
         self.event_process_kill_complete = multitasking.Event()
         # Strace/valgrind
@@ -1233,11 +1237,28 @@ class ModelDriver(Driver):
         self.model_process = self.run_model(**kwargs)
         # Start thread to queue output
         if not no_queue_thread:
+            scheduler = None
+            if self.can_schedule_output:
+                scheduler = self.output_scheduler
+                self._output_decoder = codecs.getincrementaldecoder(
+                    'utf-8')()
             self.queue_thread = multitasking.YggTaskLoop(
                 target=self.enqueue_output_loop,
-                name=self.name + '.EnqueueLoop')
+                name=self.name + '.EnqueueLoop',
+                scheduler=scheduler)
             self.queue_thread.start()
 
+    @property
+    def can_schedule_output(self):
+        r"""bool: True if output from the model process can be read without
+        blocking so that it can be forwarded by output_scheduler rather
+        than a dedicated thread."""
+        return ((self.output_scheduler is not None)
+                and (not platform._is_win)
+                and (type(self).queue_recv is ModelDriver.queue_recv)
+                and hasattr(getattr(self.model_process, 'stdout', None),
+                            'fileno'))
+
     def queue_close(self):
         r"""Close the queue for messages from the model process."""
         self.model_process.stdout.close()
@@ -1246,10 +1267,30 @@ class ModelDriver(Driver):
         r"""Receive a message from the model process."""
         return self.model_process.stdout.readline()
 
+    def queue_recv_nowait(self):
+        r"""Receive output from the model process if there is any available.
+
+        Returns:
+            bytes: Output from the model process. An empty string is returned
+                if the model process closed its output and None is returned if
+                there is not any output available.
+
+        """
+        stdout = self.model_process.stdout
+        if not select.select([stdout], [], [], 0)[0]:
+            return None
+        return os.read(stdout.fileno(), 4096)
+
     def enqueue_output_loop(self):
         r"""Keep passing lines to queue."""
         try:
-            line = self.queue_recv()
+            if self._output_decoder is None:
+                line = self.queue_recv()
+            else:
+                line = self.queue_recv_nowait()
+                if line is None:
+                    self.queue_thread.sleep()
+                    return
         except BaseException as e:  # pragma: debug
             print(e)
             line = ""
@@ -1267,7 +1308,10 @@ class ModelDriver(Driver):
                 pass
         else:
             try:
-                self.queue.put(line.decode('utf-8'))
+                if self._output_decoder is None:
+                    self.queue.put(line.decode('utf-8'))
+                else:
+                    self.queue.put(self._output_decoder.decode(line))
             except BaseException as e:  # pragma: debug
                 warnings.warn("Error in printing output: %s" % e)
 
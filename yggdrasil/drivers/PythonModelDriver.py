@@ -1,7 +1,7 @@
 import os
 import sys
 import importlib
-from yggdrasil import tools
+from yggdrasil import tools, interpreter_pool
 from yggdrasil.drivers.InterpretedModelDriver import InterpretedModelDriver
 
 
@@ -111,6 +111,42 @@ class PythonModelDriver(InterpretedModelDriver):
             out['PYTHONMALLOC'] = 'malloc'
         return out
         
+    def run_model(self, return_process=True, **kwargs):
+        r"""Run the model. If the 'interpreter_pool' option is set in the
+        'general' section of the yggdrasil config file and the model can be
+        run by the current interpreter without additional flags, the model
+        is started from the pool of interpreters that have already imported
+        yggdrasil. Otherwise the model is run in a new interpreter.
+
+        Args:
+            return_process (bool, optional): If True, the process running
+                the model is returned. If False, the process will block until
+                the model finishes running. Defaults to True.
+            **kwargs: Keyword arguments are passed to the parent class's
+                method.
+
+        """
+        if (return_process and (not kwargs)
+                and (not (self.with_strace or self.with_valgrind))
+                and (self.interpreter == sys.executable)
+                and (not self.interpreter_flags)
+                and self.model_file.endswith('.py')):
+            env = self.set_env()
+            context = interpreter_pool.get_context(
+                env, working_dir=self.working_dir)
+            if context is not None:
+                command = self.model_command()
+                self.debug('Working directory: %s', self.working_dir)
+                self.debug('Command (interpreter pool): %s',
+                           ' '.join(command))
+                self.debug('Environment Variables:\n%s',
+                           self.pprint(env, block_indent=1))
+                return interpreter_pool.PoolProcess(
+                    command, env=env, working_dir=self.working_dir,
+                    context=context)
+        return super(PythonModelDriver, self).run_model(
+            return_process=return_process, **kwargs)
+
     @classmethod
     def is_language_installed(self):
         r"""Determine if this model driver is installed on the current
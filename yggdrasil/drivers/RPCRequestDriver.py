@@ -39,6 +39,9 @@ class RPCRequestDriver(ConnectionDriver):
 
     Attributes:
         response_drivers (list): Response drivers created for each request.
+        persistent_response_drivers (dict): Response drivers that forward
+            responses for all requests from clients using persistent
+            response comms keyed by the address of the client response comm.
 
     """
 
@@ -62,6 +65,7 @@ class RPCRequestDriver(ConnectionDriver):
         super(RPCRequestDriver, self).__init__(model_request_name, **kwargs)
         self.response_kwargs.setdefault('commtype', self.ocomm._commtype)
         self.response_drivers = []
+        self.persistent_response_drivers = {}
         self._block_response = False
 
     @property
@@ -91,9 +95,14 @@ class RPCRequestDriver(ConnectionDriver):
         with self.lock:
             self.debug("Closing response drivers.")
             self._block_response = True
-            for x in self.response_drivers:
-                x.terminate()
+            response_drivers = self.response_drivers
             self.response_drivers = []
+            self.persistent_response_drivers = {}
+        # Drivers are terminated without the lock so that the loop
+        # can finish the current iteration if it shares a thread with
+        # the response drivers
+        for x in response_drivers:
+            x.terminate()
 
     def close_comm(self):
         r"""Close response drivers."""
@@ -157,7 +166,8 @@ class RPCRequestDriver(ConnectionDriver):
         self.ocomm._send_serializer = True
 
     def send_message(self, msg, **kwargs):
-        r"""Start a response driver for a request message and send message with
+        r"""Start a response driver for a request message (or reuse the one
+        started for a client's persistent response comm) and send message with
         header.
 
         Args:
@@ -176,31 +186,69 @@ class RPCRequestDriver(ConnectionDriver):
                 if (not self.is_comm_open) or self._block_response:  # pragma: debug
                     self.debug("Comm closed, not creating response driver.")
                     return False
-                drv_args = [msg.header['response_address'],
-                            msg.header['request_id']]
-                drv_kwargs = dict(
-                    request_name=self.name,
-                    inputs=[self.response_kwargs.copy()],
-                    outputs=[{'commtype': msg.header["commtype"]}])
-                self.debug("Creating response comm: address = %s, request_id = %s",
-                           msg.header['response_address'], msg.header['request_id'])
-                try:
-                    response_driver = RPCResponseDriver(*drv_args, **drv_kwargs)
-                    self.response_drivers.append(response_driver)
-                    response_driver.start()
-                    self.debug("Started response comm: address = %s, request_id = %s",
-                               msg.header['response_address'], msg.header['request_id'])
-                except BaseException:  # pragma: debug
-                    self.exception("Could not create/start response driver.")
-                    return False
+                # Responses from servers in other languages are sent via
+                # single use comms created for each request
+                persistent = (msg.header.get('persistent_response', False)
+                              and (self.ocomm.partner_language == 'python'))
+                response_driver = None
+                if persistent:
+                    response_driver = self.persistent_response_drivers.get(
+                        msg.header['response_address'], None)
+                    if ((response_driver is not None)
+                            and (not response_driver.is_valid)):  # pragma: debug
+                        response_driver = None
+                if response_driver is None:
+                    response_driver = self.start_response_driver(
+                        msg.header, persistent=persistent)
+                    if response_driver is None:  # pragma: debug
+                        return False
             # Send response address in header
             kwargs.setdefault('header_kwargs', {})
             kwargs['header_kwargs'].setdefault(
                 'response_address', response_driver.response_address)
             kwargs['header_kwargs'].setdefault('request_id', msg.header['request_id'])
             kwargs['header_kwargs'].setdefault('model', msg.header.get('model', ''))
+            if persistent:
+                kwargs['header_kwargs'].setdefault('persistent_response', True)
         return super(RPCRequestDriver, self).send_message(msg, **kwargs)
 
+    def start_response_driver(self, header, persistent=False):
+        r"""Create and start a response driver for a request.
+
+        Args:
+            header (dict): Header of the request message containing the
+                address of the client's response comm and the request ID.
+            persistent (bool, optional): If True, the response driver will
+                be reused for all requests from the client. Defaults to
+                False.
+
+        Returns:
+            RPCResponseDriver: Response driver. None is returned if the
+                driver could not be created or started.
+
+        """
+        drv_args = [header['response_address'], header['request_id']]
+        drv_kwargs = dict(
+            request_name=self.name, persistent=persistent,
+            inputs=[self.response_kwargs.copy()],
+            outputs=[{'commtype': header["commtype"]}],
+            scheduler=self.scheduler)
+        self.debug("Creating response comm: address = %s, request_id = %s",
+                   header['response_address'], header['request_id'])
+        try:
+            response_driver = RPCResponseDriver(*drv_args, **drv_kwargs)
+            self.response_drivers.append(response_driver)
+            response_driver.start()
+            self.debug("Started response comm: address = %s, request_id = %s",
+                       header['response_address'], header['request_id'])
+        except BaseException:  # pragma: debug
+            self.exception("Could not create/start response driver.")
+            return None
+        if persistent:
+            self.persistent_response_drivers[header['response_address']] = (
+                response_driver)
+        return response_driver
+
     def run_loop(self):
         r"""Run the driver. Continue looping over messages until there are not
         any left or the communication channel is closed.
@@ -221,4 +269,7 @@ class RPCRequestDriver(ConnectionDriver):
                     x.cleanup()
                     remove_idx.append(i)
             for i in remove_idx[::-1]:
-                self.response_drivers.pop(i)
+                x = self.response_drivers.pop(i)
+                for k, v in list(self.persistent_response_drivers.items()):
+                    if v is x:
+                        self.persistent_response_drivers.pop(k)
@@ -9,22 +9,30 @@ class RPCResponseDriver(ConnectionDriver):
             client model to receive responses.
         msg_id (str): ID associate with the request message this driver was
             created to respond to.
+        persistent (bool, optional): If True, the driver will forward the
+            responses to all requests from a client that uses a persistent
+            response comm instead of stopping after one response. Defaults
+            to False.
         **kwargs: Additional keyword arguments are passed to parent class.
 
     Attributes:
         msg_id (str): ID associate with the request message this driver was
             created to respond to.
+        persistent (bool): If True, the driver forwards responses to
+            multiple requests.
         response_drivers (list): Response drivers created for each request.
 
     """
 
     _connection_type = 'rpc_response'
 
-    def __init__(self, model_response_address, msg_id, **kwargs):
+    def __init__(self, model_response_address, msg_id, persistent=False,
+                 **kwargs):
         # Input communicator
         inputs = kwargs.get('inputs', [{}])
         inputs[0]['name'] = 'server_model_response.' + msg_id
         inputs[0]['is_response_server'] = True
+        inputs[0]['single_use'] = (not persistent)
         kwargs['inputs'] = inputs
         # Output communicator
         outputs = kwargs.get('outputs', [{}])
@@ -34,12 +42,33 @@ class RPCResponseDriver(ConnectionDriver):
             outputs[0]['address'] = model_response_address
         kwargs['outputs'] = outputs
         # Overall keywords
-        kwargs['single_use'] = True
+        kwargs['single_use'] = (not persistent)
         super(RPCResponseDriver, self).__init__('rpc_response.' + msg_id,
                                                 **kwargs)
         self.msg_id = msg_id
+        self.persistent = persistent
+        if persistent:
+            # Response comms do not send EOF messages
+            self._eof_sent = True
 
     @property
     def response_address(self):
         r"""str: Address of response comm."""
         return self.icomm.address
+
+    def send_message(self, msg, **kwargs):
+        r"""Send a response message with the ID of the request it responds to.
+
+        Args:
+            msg (CommMessage): Message being sent.
+            **kwargs: Keyword arguments are passed to parent class send_message.
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        if isinstance(msg.header, dict):
+            kwargs.setdefault('header_kwargs', {})
+            kwargs['header_kwargs'].setdefault(
+                'request_id', msg.header.get('request_id', self.msg_id))
+        return super(RPCResponseDriver, self).send_message(msg, **kwargs)
@@ -1,6 +1,9 @@
 import os
+import time
+import bisect
+import numpy as np
 import pandas as pd
-from yggdrasil import units, tools, multitasking
+from yggdrasil import units, multitasking
 from yggdrasil.drivers.DSLModelDriver import DSLModelDriver
 
 
@@ -8,6 +11,398 @@ _default_agg = 'mean'
 _default_interp = 'index'
 
 
+class TimeSyncTables(object):
+    r"""Record of the states provided by models participating in a
+    timestep synchronization. States are added incrementally and the
+    interpolated/merged tables derived from them are cached until the
+    data they depend on changes so that requests for the same timestep
+    do not repeat the work.
+
+    Args:
+        synonyms (dict, optional): Mapping from model name to mappings
+            from base variables to information about alternate variables
+            used by the model. Defaults to empty dict and no conversions
+            are performed.
+        interpolation (dict, optional): Interpolation keyword arguments
+            that should be used for all models or mapping from model name
+            to the interpolation keyword arguments that should be used for
+            that model. Defaults to empty dict and the default
+            interpolation method is used.
+        aggregation (str, function, dict, optional): Method that should
+            be used to aggregate variables across models or mapping from
+            variable name to the aggregation method that should be used
+            for that variable. Defaults to 'mean'.
+
+    Attributes:
+        lock (Condition): Thread-safe lock for accessing the tables that
+            is notified when the tables are updated.
+        times (list): Sorted times that states have been provided for.
+        units (dict): Mapping from model name to dictionaries mapping from
+            variable names to units. The 'base' entry contains the units
+            that variables are merged in.
+        aggregation (dict): Mapping from variable name to the aggregation
+            method that should be used.
+        update_count (int): Number of times that the tables have been
+            updated or waiting requests have been notified of a change.
+        request_metrics (dict): Mapping from request ID to information
+            about how long the request waited for data.
+
+    """
+
+    def __init__(self, synonyms=None, interpolation=None, aggregation=None):
+        if synonyms is None:
+            synonyms = {}
+        if interpolation is None:
+            interpolation = {}
+        if aggregation is None:
+            aggregation = {}
+        self.synonyms = synonyms
+        self.interp_default = {'method': _default_interp}
+        if 'method' in interpolation:
+            self.interp_default = interpolation
+            interpolation = {}
+        self.interpolation = interpolation
+        self.default_agg = _default_agg
+        if not isinstance(aggregation, dict):
+            self.default_agg = aggregation
+            aggregation = {}
+        self.aggregation = aggregation
+        self.lock = multitasking.Condition()
+        self.update_count = 0
+        self.request_metrics = {}
+        self.times = []
+        self.units = {'base': {}}
+        self._records = {}
+        self._columns = {}
+        self._versions = {}
+        self._times_version = 0
+        self._max_time = {}
+        self._interpolated = {}
+        self._merged = (None, None)
+        self._states = {}
+
+    @property
+    def models(self):
+        r"""list: Models that have provided states."""
+        return list(self._records.keys())
+
+    def add_model(self, model, time, state):
+        r"""Add a model to the tables, recording the units of the
+        variables it provides.
+
+        Args:
+            model (str): Name of the model.
+            time (object): Time of the first state provided by the model
+                (with units).
+            state (dict): First state provided by the model.
+
+        """
+        with self.lock:
+            # NOTE: this assumes that units will not change between
+            # timesteps for a single model. Is there a case where this
+            # might not be true?
+            self._records[model] = {}
+            self._columns[model] = []
+            self._versions[model] = 0
+            model_units = {k: units.get_units(v) for k, v in state.items()}
+            model_units['time'] = units.get_units(time)
+            alt_vars = []
+            for k, v in self.synonyms.get(model, {}).items():
+                alt_vars += v['alt']
+                if v['alt2base'] is not None:
+                    model_units[k] = units.get_units(
+                        v['alt2base'](*[state[a] for a in v['alt']]))
+                else:
+                    model_units[k] = model_units[v['alt'][0]]
+            self.units[model] = model_units
+            for k, v in model_units.items():
+                self.units['base'].setdefault(k, v)
+            for k in list(set(state.keys()) - set(alt_vars)):
+                self.aggregation.setdefault(k, self.default_agg)
+
+    def update(self, model, time, state):
+        r"""Record the state provided by a model at a time, replacing any
+        state previously provided by the model for that time.
+
+        Args:
+            model (str): Name of the model providing the state.
+            time (object): Time of the state (with units).
+            state (dict): Mapping from variable names to values.
+
+        Returns:
+            pandas.Timedelta: Time of the state.
+
+        """
+        t_pd = units.convert_to_pandas_timedelta(time)
+        values = {k: units.get_data(v) for k, v in state.items()}
+        with self.lock:
+            if model not in self._records:
+                self.add_model(model, time, state)
+            i = bisect.bisect_left(self.times, t_pd)
+            if (i == len(self.times)) or (self.times[i] != t_pd):
+                self.times.insert(i, t_pd)
+                self._times_version += 1
+            new_columns = [k for k in values if k not in self._columns[model]]
+            self._columns[model] += new_columns
+            self._records[model][t_pd] = values
+            self._versions[model] += 1
+            if ((new_columns or (model not in self._max_time)
+                 or (not self._is_complete(model, values)))):
+                self._max_time.pop(model, None)
+            elif ((self._max_time[model] is None)
+                  or (t_pd > self._max_time[model])):
+                self._max_time[model] = t_pd
+            self.notify()
+        return t_pd
+
+    def notify(self):
+        r"""Wake requests that are waiting for the tables to change."""
+        with self.lock:
+            self.update_count += 1
+            self.lock.notify_all()
+
+    def wait_for_update(self, update_count, timeout=None):
+        r"""Wait for the tables to change.
+
+        Args:
+            update_count (int): Value of update_count when the tables were
+                last checked. If the tables have changed since then, this
+                method returns immediately.
+            timeout (float, optional): Maximum time to wait (in seconds).
+                Defaults to None and the wait is indefinite.
+
+        Returns:
+            bool: True if the tables changed, False if the wait timed out.
+
+        """
+        with self.lock:
+            return self.lock.wait_for(
+                lambda: self.update_count != update_count, timeout)
+
+    def start_request(self, request_id, model, timestep):
+        r"""Start recording metrics for a request.
+
+        Args:
+            request_id (str): ID associated with the request.
+            model (str): Name of the model that made the request.
+            timestep (pandas.Timedelta): Time that the state was requested
+                at.
+
+        """
+        with self.lock:
+            self.request_metrics[request_id] = {
+                'model': model, 'time': timestep, 'start': time.perf_counter(),
+                'checks': 0, 'wait': None}
+
+    def check_request(self, request_id):
+        r"""Record that a request checked for data.
+
+        Args:
+            request_id (str): ID associated with the request.
+
+        """
+        with self.lock:
+            self.request_metrics[request_id]['checks'] += 1
+
+    def finish_request(self, request_id):
+        r"""Record the time a request waited before it could be completed.
+
+        Args:
+            request_id (str): ID associated with the request.
+
+        Returns:
+            float: Time (in seconds) that the request waited.
+
+        """
+        with self.lock:
+            x = self.request_metrics[request_id]
+            x['wait'] = time.perf_counter() - x['start']
+            return x['wait']
+
+    def wait_summary(self):
+        r"""Summarize the time completed requests waited for data.
+
+        Returns:
+            dict: Number of completed requests ('count') and the total
+                ('total'), mean ('mean'), and maximum ('max') wait times
+                in seconds.
+
+        """
+        with self.lock:
+            waits = [x['wait'] for x in self.request_metrics.values()
+                     if x['wait'] is not None]
+        out = {'count': len(waits), 'total': sum(waits),
+               'mean': 0.0, 'max': 0.0}
+        if waits:
+            out['mean'] = out['total'] / len(waits)
+            out['max'] = max(waits)
+        return out
+
+    def _is_complete(self, model, values):
+        r"""Determine if a state provided by a model has values for all of
+        the model's variables.
+
+        Args:
+            model (str): Name of the model that provided the state.
+            values (dict): Values in the state.
+
+        Returns:
+            bool: True if there are no missing values, False otherwise.
+
+        """
+        for k in self._columns[model]:
+            if k not in values:
+                return False
+            isnull = pd.isnull(values[k])
+            if (np.ndim(isnull) == 0) and isnull:
+                return False
+        return True
+
+    def max_time(self, model):
+        r"""Get the latest time that a model has provided a complete
+        state for.
+
+        Args:
+            model (str): Name of the model.
+
+        Returns:
+            pandas.Timedelta: Latest time with a complete state, None if
+                the model has not provided a complete state.
+
+        """
+        with self.lock:
+            if model not in self._max_time:
+                out = None
+                for t, values in self._records[model].items():
+                    if ((((out is None) or (t > out))
+                         and self._is_complete(model, values))):
+                        out = t
+                self._max_time[model] = out
+            return self._max_time[model]
+
+    def table(self, model):
+        r"""Get the table of states provided by a model.
+
+        Args:
+            model (str): Name of the model.
+
+        Returns:
+            pandas.DataFrame: States provided by the model indexed by time
+                with missing values at times when the model has not
+                provided a state.
+
+        """
+        with self.lock:
+            records = [self._records[model].get(t, {}) for t in self.times]
+            out = pd.DataFrame(
+                {k: [x.get(k, np.nan) for x in records]
+                 for k in self._columns[model]},
+                index=pd.TimedeltaIndex(self.times, name='time'),
+                columns=self._columns[model])
+        return out
+
+    def interpolated(self, model, open_clients):
+        r"""Get the table of states provided by a model interpolated to all
+        of the times, with alternate variables converted to base variables
+        in base units. The result is cached until the model provides a new
+        state, a new time is added, or the model signs off.
+
+        Args:
+            model (str): Name of the model.
+            open_clients (list): Clients that are still open.
+
+        Returns:
+            pandas.DataFrame: Interpolated table indexed by time.
+
+        """
+        with self.lock:
+            key = (self._versions[model], self._times_version,
+                   model in open_clients)
+            cached = self._interpolated.get(model, (None, None))
+            if cached[0] == key:
+                return cached[1]
+            v = self.table(model)
+            kws = self.interpolation.get(model, self.interp_default).copy()
+            if model not in open_clients:
+                # Ensure that clients that have signed of are
+                # extrapolated, otherwise they would never produce
+                # valid data
+                kws['limit_area'] = None
+            if 'order' in kws:
+                kws['order'] = min(v.dropna().shape[0] - 1, kws['order'])
+                if kws['order'] == 0:
+                    kws.pop('order')
+                    kws.update(self.interp_default)
+            # Cannot interpolate on pandas timedelta as of pandas 1.0.1
+            ind = v.index
+            v.index = v.index.total_seconds()
+            v = v.interpolate(**kws)
+            v.index = ind
+            # Rename + transformation
+            drop = []
+            for kbase, alt in self.synonyms.get(model, {}).items():
+                if alt['alt2base'] is not None:
+                    args = [v[k] for k in alt['alt']]
+                    v[kbase] = alt['alt2base'](*args)
+                else:
+                    v[kbase] = v[alt['alt'][0]]
+                drop += alt['alt']
+            for k in drop:
+                v = v.drop(k, axis=1)
+            # Units
+            for k in v.columns:
+                funits = units.get_conversion_function(
+                    self.units[model][k], self.units['base'][k])
+                v[k] = funits(v[k])
+            self._interpolated[model] = (key, v)
+            return v
+
+    def merged(self, open_clients):
+        r"""Get the table of states merged across models. The result is
+        cached until the data it depends on changes.
+
+        Args:
+            open_clients (list): Clients that are still open.
+
+        Returns:
+            pandas.DataFrame: Merged table indexed by time in base units.
+
+        """
+        with self.lock:
+            models = self.models
+            key = (self._times_version,
+                   tuple((k, self._versions[k], k in open_clients)
+                         for k in models))
+            if self._merged[0] == key:
+                return self._merged[1]
+            out = pd.concat([self.interpolated(k, open_clients)
+                             for k in models], sort=False)
+            out = out.groupby('time').agg(self.aggregation)
+            self._merged = (key, out)
+            self._states = {}
+            return out
+
+    def get_state(self, time, open_clients):
+        r"""Get the merged state at a time. States are cached so that
+        requests from multiple clients for the same time only select the
+        state once.
+
+        Args:
+            time (pandas.Timedelta): Time to get the state at.
+            open_clients (list): Clients that are still open.
+
+        Returns:
+            pandas.DataFrame: Copy of the merged table containing only the
+                row for the requested time in base units.
+
+        """
+        with self.lock:
+            merged = self.merged(open_clients)
+            if time not in self._states:
+                self._states[time] = merged.loc[[time]]
+            return self._states[time].copy()
+
+
 class TimeSyncModelDriver(DSLModelDriver):
     r"""Class for synchronizing states for timesteps between two models.
 
@@ -100,6 +495,7 @@ class TimeSyncModelDriver(DSLModelDriver):
             'default': {}}}
     language = 'timesync'
     executable_type = 'other'
+    _response_wait_timeout = 1.0
 
     def __init__(self, name, *args, **kwargs):
         super(TimeSyncModelDriver, self).__init__(name, *args, **kwargs)
@@ -154,14 +550,8 @@ class TimeSyncModelDriver(DSLModelDriver):
             os.environ.update(env)
         rpc = YggTimesyncServer(name)
         threads = {}
-        times = []
-        tables = {}
-        table_units = {'base': {}}
-        table_lock = multitasking.RLock()
-        default_agg = _default_agg
-        if not isinstance(aggregation, dict):
-            default_agg = aggregation
-            aggregation = {}
+        tables = TimeSyncTables(synonyms, interpolation, aggregation)
+        client_status = None
         while True:
             # Check for errors on response threads
             for v in threads.values():
@@ -172,6 +562,12 @@ class TimeSyncModelDriver(DSLModelDriver):
                     raise Exception("Error on response thread.")
             # Receive values from client models
             flag, values, request_id = rpc.recv_from(timeout=1.0)
+            # Wake waiting requests if clients connected/signed off
+            new_status = (rpc.all_clients_connected,
+                          sorted(rpc.open_clients))
+            if new_status != client_status:
+                client_status = new_status
+                tables.notify()
             if not flag:
                 print("timesync server: End of input.")
                 break
@@ -179,7 +575,6 @@ class TimeSyncModelDriver(DSLModelDriver):
                 rpc.sleep()
                 continue
             t, state = values[:]
-            t_pd = units.convert_to_pandas_timedelta(t)
             client_model = rpc.ocomm[request_id].client_model
             # Remove variables marked as external so they are not merged
             external_variables = additional_variables.get(client_model, [])
@@ -187,53 +582,14 @@ class TimeSyncModelDriver(DSLModelDriver):
                 state.pop(k, None)
             internal_variables = list(state.keys())
             # Update record
-            with table_lock:
-                if client_model not in tables:
-                    tables[client_model] = pd.DataFrame({'time': times})
-                # Update units & aggregation methods
-                if client_model not in table_units:
-                    # NOTE: this assumes that units will not change
-                    # between timesteps for a single model. Is there a
-                    # case where this might not be true?
-                    table_units[client_model] = {
-                        k: units.get_units(v) for k, v in state.items()}
-                    table_units[client_model]['time'] = units.get_units(t)
-                    alt_vars = []
-                    for k, v in synonyms.get(client_model, {}).items():
-                        alt_vars += v['alt']
-                        if v['alt2base'] is not None:
-                            table_units[client_model][k] = units.get_units(
-                                v['alt2base'](*[state[a] for a in v['alt']]))
-                        else:
-                            table_units[client_model][k] = table_units[
-                                client_model][v['alt'][0]]
-                    for k, v in table_units[client_model].items():
-                        table_units['base'].setdefault(k, v)
-                    for k in list(set(state.keys()) - set(alt_vars)):
-                        aggregation.setdefault(k, default_agg)
-                # Update the state
-                if t_pd not in times:
-                    times.append(t_pd)
-                for model, table in tables.items():
-                    new_data = {'time': [t_pd]}
-                    if model == client_model:
-                        new_data.update({k: [units.get_data(v)]
-                                         for k, v in state.items()})
-                    new_data = pd.DataFrame(new_data)
-                    idx = table['time'].isin([t_pd])
-                    if not idx.any():
-                        table = table.append(new_data, sort=False)
-                    elif model == client_model:
-                        table = table.drop(table.index[idx])
-                        table = table.append(new_data, sort=False)
-                    tables[model] = table.sort_values('time')
+            t_pd = tables.update(client_model, t, state)
+            tables.start_request(request_id, client_model, t_pd)
             # Assign thread to handle checking when data is filled in
             threads[request_id] = multitasking.YggTaskLoop(
                 target=cls.response_loop,
                 args=(client_model, request_id, rpc, t_pd,
-                      internal_variables, external_variables,
-                      tables, table_units, table_lock,
-                      synonyms, interpolation, aggregation))
+                      internal_variables, external_variables, tables,
+                      synonyms))
             threads[request_id].start()
         # Cleanup threads (only called if there is an error since the
         # loop will only be broken when all of the clients have signed
@@ -244,42 +600,44 @@ class TimeSyncModelDriver(DSLModelDriver):
         for v in threads.values():
             if v.is_alive():  # pragma: debug
                 v.terminate()
+        metrics = tables.wait_summary()
+        print("timesync server: %d requests waited %.3f s on average "
+              "(max %.3f s, total %.3f s) for data."
+              % (metrics['count'], metrics['mean'], metrics['max'],
+                 metrics['total']))
 
     @classmethod
-    def check_for_data(cls, time, tables, table_units, table_lock,
-                       open_clients):
+    def check_for_data(cls, time, tables, open_clients):
         r"""Check for a time in the tables to determine if there is
         sufficient data available to calculate the state.
 
         Args:
             time (pandas.Timedelta): Time that state is requested at.
-            tables (dict): Mapping from model name to pandas DataFrames
-                containing variables supplied by the model.
-            table_units (dict): Mapping from model name to dictionaries
-                mapping from variable names to units.
-            table_lock (RLock): Thread-safe lock for accessing table.
+            tables (TimeSyncTables): States provided by the models.
             open_clients (list): Clients that are still open.
 
         Returns:
             bool: True if there is sufficient data, False otherwise.
 
         """
-        with table_lock:
-            for k, v in tables.items():
-                if (k in open_clients) and (time > max(v.dropna()['time'])):
-                    return False
+        with tables.lock:
+            for k in tables.models:
+                if k in open_clients:
+                    tmax = tables.max_time(k)
+                    if (tmax is None) or (time > tmax):
+                        return False
             for k in open_clients:
-                if k not in table_units:  # pragma: debug
+                if k not in tables.units:  # pragma: debug
                     return False
         return True
 
     @classmethod
     def response_loop(cls, client_model, request_id, rpc, time,
-                      internal_variables, external_variables,
-                      tables, table_units, table_lock,
-                      synonyms, interpolation, aggregation):
+                      internal_variables, external_variables, tables,
+                      synonyms):
         r"""Check for available data and send response if it is
-        available.
+        available. If the data is not available, the call blocks until
+        the tables are updated or the status of the clients changes.
 
         Args:
             client_model (str): Name of model that made the request.
@@ -292,42 +650,33 @@ class TimeSyncModelDriver(DSLModelDriver):
                 that it also calculates.
             external_variables (list): Variables that model is requesting
                 that will be provided by other models.
-            tables (dict): Mapping from model name to pandas DataFrames
-                containing variables supplied by the model.
-            table_units (dict): Mapping from model name to dictionaries
-                mapping from variable names to units.
-            table_lock (RLock): Thread-safe lock for accessing table.
+            tables (TimeSyncTables): States provided by the models.
             synonyms (dict): Dictionary mapping from base variables to
                 alternate variables and mapping functions used to convert
                 between the variables. Defaults to empty dict and no
                 conversions are performed.
-            interpolation (dict): Mapping from model name to the
-                interpolation kwargs that should be used. Defaults to
-                empty dictionary.
-            aggregation (dict): Mapping from variable name to the
-                aggregation method that should be used. Defaults to
-                empty dictionary.
 
         """
+        update_count = tables.update_count
+        tables.check_request(request_id)
         if not (rpc.all_clients_connected
-                and cls.check_for_data(time, tables, table_units, table_lock,
-                                       rpc.open_clients)):
+                and cls.check_for_data(time, tables, rpc.open_clients)):
             # Don't start sampling until all clients have connected
             # and there is data available for the requested timestep
-            tools.sleep(1.0)
+            tables.wait_for_update(update_count,
+                                   timeout=cls._response_wait_timeout)
             return
-        tot = cls.merge(tables, table_units, table_lock, rpc.open_clients,
-                        synonyms, interpolation, aggregation)
+        tot = cls.merge(time, tables, rpc.open_clients)
+        table_units = tables.units
         # Update external units
         for k in external_variables:
             if k not in table_units[client_model]:
                 table_units[client_model][k] = table_units['base'][k]
-        # Check if data is available at the desired timestep?
         # Convert units
         for k in tot.columns:
             funits = units.get_conversion_function(table_units['base'][k],
                                                    table_units[client_model][k])
-            tot[k] = tot[k].apply(funits)
+            tot[k] = funits(tot[k])
         # Transform back to variables expected by the model
         for kbase, alt in synonyms.get(client_model, {}).items():
             if alt['base2alt'] is not None:
@@ -348,6 +697,9 @@ class TimeSyncModelDriver(DSLModelDriver):
             state[v] = units.add_units(v_res, table_units[client_model][v])
         time_u = units.convert_to(units.convert_from_pandas_timedelta(time),
                                   table_units[client_model]['time'])
+        wait = tables.finish_request(request_id)
+        rpc.debug("Request %s from %s for time %s waited %f s for data.",
+                  request_id, client_model, time_u, wait)
         flag = rpc.send_to(request_id, state)
         if not flag:  # pragma: debug
             raise RuntimeError(("Failed to send response to "
@@ -357,79 +709,19 @@ class TimeSyncModelDriver(DSLModelDriver):
         raise multitasking.BreakLoopException
     
     @classmethod
-    def merge(cls, tables, table_units, table_lock, open_clients,
-              synonyms, interpolation, aggregation):
-        r"""Merge tables from models to get data.
+    def merge(cls, time, tables, open_clients):
+        r"""Merge tables from models to get the state at a time. Merged
+        tables are cached so that multiple requests for the same time
+        before new data arrives only merge the tables once.
 
         Args:
-            tables (dict): Mapping from model name to pandas DataFrames
-                containing variables supplied by the model.
-            table_units (dict): Mapping from model name to dictionaries
-                mapping from variable names to units.
-            table_lock (RLock): Thread-safe lock for accessing table.
+            time (pandas.Timedelta): Time to get the state at.
+            tables (TimeSyncTables): States provided by the models.
             open_clients (list): Clients that are still open.
-            synonyms (dict): Dictionary mapping from base variables to
-                alternate variables and mapping functions used to convert
-                between the variables. Defaults to empty dict and no
-                conversions are performed.
-            interpolation (dict): Mapping from model name to the
-                interpolation kwargs that should be used. Defaults to
-                empty dictionary.
-            aggregation (dict): Mapping from variable name to the
-                aggregation method that should be used. Defaults to
-                empty dictionary.
 
+        Returns:
+            pandas.DataFrame: Table containing the merged state at the
+                requested time in base units.
 
         """
-        # Adjust input arguments
-        interp_default = {'method': _default_interp}
-        if 'method' in interpolation:
-            interp_default = interpolation
-            interpolation = {}
-        # Interpolate
-        table_temp = {}
-        with table_lock:
-            for k, v in tables.items():
-                kws = interpolation.get(k, interp_default).copy()
-                if k not in open_clients:
-                    # Ensure that clients that have signed of are
-                    # extrapolated, otherwise they would never produce
-                    # valid data
-                    kws['limit_area'] = None
-                if 'order' in kws:
-                    kws['order'] = min(v.dropna().shape[0] - 1,
-                                       kws['order'])
-                    if kws['order'] == 0:
-                        kws.pop('order')
-                        kws.update(interp_default)
-                v = v.set_index('time')
-                # Cannot interpolate on pandas timedelta as of pandas 1.0.1
-                ind = v.index
-                v.index = v.index.total_seconds()
-                table_temp[k] = v.interpolate(**kws)
-                table_temp[k].index = ind
-        # Rename + transformation
-        for model, v in table_temp.items():
-            drop = []
-            for kbase, alt in synonyms.get(model, {}).items():
-                if alt['alt2base'] is not None:
-                    args = [v[k] for k in alt['alt']]
-                    v[kbase] = alt['alt2base'](*args)
-                else:
-                    v[kbase] = v[alt['alt'][0]]
-                drop += alt['alt']
-            for k in drop:
-                v = v.drop(k, axis=1)
-            # Units
-            for k in v.columns:
-                funits = units.get_conversion_function(table_units[model][k],
-                                                       table_units['base'][k])
-                v[k] = v[k].apply(funits)
-            table_temp[model] = v
-        # Append
-        out = pd.DataFrame()
-        for k, v in table_temp.items():
-            out = out.append(v, sort=False)
-        # Groupby + aggregate
-        out = out.groupby('time').agg(aggregation)
-        return out
+        return tables.get_state(time, open_clients)
@@ -1,7 +1,11 @@
 import os
+import time
 import shutil
+import tempfile
+import threading
+from collections import OrderedDict
 from yggdrasil import platform
-from yggdrasil.config import ygg_cfg
+from yggdrasil.config import ygg_cfg, temp_config
 from yggdrasil.tests import assert_equal, assert_raises, YggTestClass
 from yggdrasil.drivers import CompiledModelDriver
 import yggdrasil.drivers.tests.test_ModelDriver as parent
@@ -65,6 +69,129 @@ def test_CompilationToolBase():
                   invalid='invalid')
 
 
+def test_get_product_lock():
+    r"""Test get_product_lock."""
+    lock = CompiledModelDriver.get_product_lock('test.o')
+    assert(CompiledModelDriver.get_product_lock(os.path.abspath('test.o'))
+           is lock)
+    assert(CompiledModelDriver.get_product_lock('test2.o') is not lock)
+
+
+def test_run_build_jobs():
+    r"""Test run_build_jobs."""
+    order = []
+
+    def job(name, t=0.0):
+        def run():
+            time.sleep(t)
+            order.append(name)
+            return name
+        return run
+
+    def error():
+        raise ValueError("Test error.")
+
+    jobs = OrderedDict([('a', job('a', 0.1)), ('b', job('b')),
+                        ('c', job('c'))])
+    dependencies = {'b': ['a', 'invalid'], 'c': ['b']}
+    for njobs in [1, 3]:
+        order.clear()
+        out = CompiledModelDriver.run_build_jobs(
+            jobs, dependencies=dependencies, njobs=njobs)
+        assert_equal(list(out.items()), [('a', 'a'), ('b', 'b'), ('c', 'c')])
+        assert_equal(order, ['a', 'b', 'c'])
+    # Independent jobs run concurrently
+    order.clear()
+    CompiledModelDriver.run_build_jobs(jobs, njobs=3)
+    assert_equal(order[-1], 'a')
+    # Errors
+    for njobs in [1, 3]:
+        order.clear()
+        assert_raises(RuntimeError, CompiledModelDriver.run_build_jobs,
+                      jobs, dependencies={'a': ['c'], 'c': ['a']},
+                      njobs=njobs)
+        assert_equal(order, ['b'])
+        order.clear()
+        assert_raises(ValueError, CompiledModelDriver.run_build_jobs,
+                      OrderedDict([('a', error), ('b', job('b'))]),
+                      dependencies={'b': ['a']}, njobs=njobs)
+        assert_equal(order, [])
+
+
+def test_build_slot():
+    r"""Test that nested build jobs are limited by build_slot."""
+    running = []
+    counts = []
+    lock = threading.Lock()
+
+    def leaf():
+        with CompiledModelDriver.build_slot():
+            with lock:
+                running.append(1)
+                counts.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+
+    def branch():
+        CompiledModelDriver.run_build_jobs(
+            OrderedDict((i, leaf) for i in range(3)))
+
+    with temp_config(build_jobs=2):
+        CompiledModelDriver.run_build_jobs(
+            OrderedDict((i, branch) for i in range(3)))
+    assert_equal(len(counts), 9)
+    assert_equal(max(counts), 2)
+
+
+def test_deferred_compilation():
+    r"""Test deferred_compilation."""
+
+    class DummyModel(object):
+
+        def __init__(self, model_file, compiled):
+            self.model_file = model_file
+            self.compiled = compiled
+            CompiledModelDriver._deferred_builds.append(self)
+
+        def compile_model_instance(self):
+            self.compiled.append((self.model_file,
+                                  threading.current_thread().name))
+
+    compiled = []
+    with CompiledModelDriver.deferred_compilation(njobs=2):
+        x = [DummyModel(f, compiled) for f in ['a', 'b', 'a']]
+        assert_equal(compiled, [])
+    assert(CompiledModelDriver._deferred_builds is None)
+    assert_equal(sorted(f for f, _ in compiled), ['a', 'a', 'b'])
+    # Copies sharing a model file are compiled by the same job
+    assert_equal(len(set(t for f, t in compiled if f == x[0].model_file)), 1)
+
+
+def test_compile_concurrent():
+    r"""Test compiling multiple sources concurrently."""
+    tool = import_component('model', 'c').get_tool('compiler', default=None)
+    if (tool is None) or (not tool.is_installed()):  # pragma: debug
+        return
+    tempdir = tempfile.mkdtemp()
+    try:
+        src = [os.path.join(tempdir, x) for x in ['main.c', 'value.c']]
+        with open(src[0], 'w') as fd:
+            fd.write('int value();\nint main() { return value(); }\n')
+        with open(src[1], 'w') as fd:
+            fd.write('int value() { return 0; }\n')
+        products = []
+        out = tool.call(src, working_dir=tempdir, products=products,
+                        overwrite=True)
+        assert(os.path.isfile(out))
+        for x in src:
+            obj = tool.get_output_file(x, dont_link=True)
+            assert(obj in products)
+        assert(out in products)
+    finally:
+        shutil.rmtree(tempdir)
+
+
 class DummyCompiler(CompiledModelDriver.CompilerBase):
     r"""Dummy test class."""
     _dont_register = True
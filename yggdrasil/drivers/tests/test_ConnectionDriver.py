@@ -404,6 +404,21 @@ class TestConnectionDriver(TestConnectionParam, parent.TestDriver):
             self.recv_comm.printStatus()
             raise
 
+    @timeout(timeout=600)
+    def test_send_recv_passthrough(self):
+        r"""Test sending/receiving messages forwarded without decoding."""
+        if (self.comm_name == 'CommBase') or (self.icomm_name == 'value'):
+            raise unittest.SkipTest("Requires messages from send comm.")
+        for i in range(3):
+            flag = self.send_comm.send(self.test_msg)
+            assert(flag)
+            for j in range(self.nmsg_recv):
+                flag, msg_recv = self.recv_comm.recv(timeout=self.timeout)
+                assert(flag)
+                self.assert_msg_equal(msg_recv, self.test_msg)
+        if self.__class__ == TestConnectionDriver:
+            assert(self.instance.passthrough)
+
     def assert_before_stop(self, check_open=True):
         r"""Assertions to make before stopping the driver instance."""
         super(TestConnectionDriver, self).assert_before_stop()
@@ -441,6 +456,35 @@ class TestConnectionDriverFork(TestConnectionDriver):
         return out
 
 
+class TestConnectionDriverOrdered(TestConnectionDriver):
+    r"""Test class for the ConnectionDriver class with ordered output."""
+
+    @property
+    def inst_kwargs(self):
+        r"""dict: Keyword arguments for tested class."""
+        out = super(TestConnectionDriverOrdered, self).inst_kwargs
+        out['ordered'] = True
+        return out
+
+    @timeout(timeout=600)
+    def test_send_recv_ordered(self):
+        r"""Test that messages are sent in the order of their work index."""
+        msgs = [self.test_msg for i in range(3)]
+        if isinstance(self.test_msg, bytes):
+            msgs = [self.test_msg + str(i).encode('utf-8') for i in range(3)]
+        for i in [1, 2, 0]:
+            assert(self.send_comm.send(msgs[i],
+                                       header_kwargs={'work_index': i}))
+        # Messages without a work index are not buffered
+        assert(self.send_comm.send(msgs[0]))
+        for x in msgs + [msgs[0]]:
+            flag, msg_recv = self.recv_comm.recv(timeout=self.timeout)
+            assert(flag)
+            self.assert_msg_equal(msg_recv, x)
+        self.assert_equal(self.instance._ordered_next, 3)
+        assert(not self.instance._ordered_buffer)
+
+
 invalid_translate = True
 
 
@@ -473,6 +517,7 @@ class TestConnectionDriverIterate(TestConnectionDriver):
     r"""Test class for the ConnectionDriver class with iteration."""
 
     test_send_recv_nolimit = None
+    test_send_recv_passthrough = None
 
     @property
     def inst_kwargs(self):
@@ -521,6 +566,36 @@ def test_ConnectionDriverOnexit_errors():
                   onexit='invalid')
 
 
+def test_ConnectionDriver_distribution():
+    r"""Test that the distribution is passed to the comm for model copies."""
+    x = ConnectionDriver('test', distribution='round_robin',
+                         outputs=[{'partner_model': 'model',
+                                   'partner_copies': 2}])
+    try:
+        assert(x.ocomm._commtype == 'fork')
+        assert(x.ocomm.distribution == 'round_robin')
+        assert(sorted(x.models['output'])
+               == ['model_copy0', 'model_copy1'])
+    finally:
+        x.close_comm()
+
+
+def test_ConnectionDriver_order_message():
+    r"""Test ordering and flushing messages by work index."""
+    x = ConnectionDriver('test', ordered=True)
+    try:
+        msgs = [CommBase.CommMessage(args=i, header={'work_index': i})
+                for i in range(4)]
+        assert(x.order_message(msgs[1]) == [])
+        assert(x.order_message(msgs[3]) == [])
+        assert(x.order_message(msgs[0]) == msgs[:2])
+        assert(x.flush_ordered() == msgs[3:])
+        assert(x.order_message(msgs[2]) == [msgs[2]])
+        assert(x._ordered_next == 4)
+    finally:
+        x.close_comm()
+
+
 def test_ConnectionDriverTranslate_errors():
     r"""Test that errors are raised for invalid translators."""
     assert(not hasattr(invalid_translate, '__call__'))
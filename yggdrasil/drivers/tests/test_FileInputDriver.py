@@ -73,6 +73,7 @@ class TestFileInputDriver(TestFileInputParam, parent.TestConnectionDriver):
 
     test_send_recv = None
     test_send_recv_nolimit = None
+    test_send_recv_passthrough = None
 
     def assert_before_stop(self):
         r"""Assertions to make before stopping the driver instance."""
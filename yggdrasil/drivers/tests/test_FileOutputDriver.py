@@ -79,6 +79,7 @@ class TestFileOutputDriver(TestFileOutputParam, parent.TestConnectionDriver):
 
     test_send_recv = None
     test_send_recv_nolimit = None
+    test_send_recv_passthrough = None
 
     def send_file_contents(self):
         r"""Send file contents to driver."""
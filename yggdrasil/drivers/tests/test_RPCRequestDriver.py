@@ -94,6 +94,14 @@ class TestRPCRequestDriver(TestRPCRequestParam,
         r"""Test routing of a large message between client and server."""
         self.test_send_recv(msg_send=self.msg_long)
 
+    def test_send_recv_persistent(self):
+        r"""Test that a single response driver is used for repeated
+        requests from the same client."""
+        for i in range(3):
+            self.test_send_recv()
+        assert_equal(len(self.instance.persistent_response_drivers), 1)
+        assert_equal(len(self.instance.response_drivers), 1)
+
 
 # Dynamically create tests based on registered comm classes
 s = get_schema()
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+from yggdrasil import units, multitasking
+from yggdrasil.drivers.TimeSyncModelDriver import (
+    TimeSyncModelDriver, TimeSyncTables)
+
+
+def add_state(tables, model, t, **kwargs):
+    r"""Add a state to the tables using unit strings from the keyword
+    values (value, units)."""
+    state = {k: units.add_units(*v) for k, v in kwargs.items()}
+    return tables.update(model, units.add_units(t, 'day'), state)
+
+
+def test_TimeSyncTables():
+    r"""Test incremental updates to TimeSyncTables."""
+    synonyms = {'B': {'x': {'alt': ['xb'], 'alt2base': None,
+                            'base2alt': None}}}
+    tables = TimeSyncTables(synonyms=synonyms)
+    t1 = add_state(tables, 'A', 1.0, x=(1.0, 'cm'), y=(2.0, 'g'))
+    t3 = add_state(tables, 'A', 3.0, x=(3.0, 'cm'), y=(6.0, 'g'))
+    t2 = add_state(tables, 'B', 2.0, xb=(0.04, 'm'))
+    assert(tables.times == [t1, t2, t3])
+    assert(tables.units['base']['x'] == 'cm')
+    assert(tables.max_time('A') == t3)
+    assert(tables.max_time('B') == t2)
+    np.testing.assert_array_equal(tables.table('A')['x'].values,
+                                  [1.0, np.NaN, 3.0])
+    clients = ['A', 'B']
+    assert(TimeSyncModelDriver.check_for_data(t2, tables, clients))
+    assert(not TimeSyncModelDriver.check_for_data(t3, tables, clients))
+    assert(not TimeSyncModelDriver.check_for_data(t3, tables, ['A', 'C']))
+    # Results are cached until new data arrives
+    merged = tables.merged(clients)
+    assert(tables.merged(clients) is merged)
+    state = TimeSyncModelDriver.merge(t2, tables, clients)
+    np.testing.assert_allclose(state.loc[t2, 'x'], (2.0 + 4.0) / 2)
+    np.testing.assert_allclose(state.loc[t2, 'y'], 4.0)
+    state.loc[t2, 'x'] = 0.0
+    assert(TimeSyncModelDriver.merge(t2, tables, clients).loc[t2, 'x'] != 0.0)
+    # Replace a state
+    add_state(tables, 'B', 2.0, xb=(0.06, 'm'))
+    assert(tables.merged(clients) is not merged)
+    assert(tables.times == [t1, t2, t3])
+    state = TimeSyncModelDriver.merge(t2, tables, clients)
+    np.testing.assert_allclose(state.loc[t2, 'x'], (2.0 + 6.0) / 2)
+    # Missing values
+    add_state(tables, 'B', 4.0, xb=(np.NaN, 'm'))
+    assert(tables.max_time('B') == t2)
+    # Closed clients are extrapolated
+    t4 = pd.Timedelta(4, unit='D')
+    assert(not TimeSyncModelDriver.check_for_data(t4, tables, ['B']))
+    assert(TimeSyncModelDriver.check_for_data(t4, tables, []))
+    state = TimeSyncModelDriver.merge(t4, tables, [])
+    np.testing.assert_allclose(state.loc[t4, 'x'], (3.0 + 6.0) / 2)
+    np.testing.assert_allclose(state.loc[t4, 'y'], 6.0)
+
+
+def test_TimeSyncTables_wait():
+    r"""Test waiting for updates to TimeSyncTables."""
+    tables = TimeSyncTables()
+    count = tables.update_count
+    assert(not tables.wait_for_update(count, timeout=0.01))
+    task = multitasking.YggTask(target=add_state, args=(tables, 'A', 1.0),
+                                kwargs={'x': (1.0, 'cm')})
+    task.start()
+    assert(tables.wait_for_update(count, timeout=10.0))
+    task.join(10.0)
+    assert(tables.wait_for_update(count, timeout=0.01))
+    count = tables.update_count
+    tables.notify()
+    assert(tables.wait_for_update(count))
+    # Metrics
+    t1 = pd.Timedelta(1, unit='D')
+    tables.start_request('a', 'A', t1)
+    tables.start_request('b', 'A', t1)
+    tables.check_request('a')
+    assert(tables.request_metrics['a']['checks'] == 1)
+    assert(tables.wait_summary()['count'] == 0)
+    wait = tables.finish_request('a')
+    metrics = tables.wait_summary()
+    assert(metrics['count'] == 1)
+    assert(metrics['max'] == wait)
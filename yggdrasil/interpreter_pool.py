@@ -0,0 +1,337 @@
+r"""Pool of pre-warmed Python interpreters that models can be started from
+without paying the cost of importing yggdrasil and its dependencies in a
+fresh interpreter each time. Interpreters are forked from a multiprocessing
+forkserver that imports the modules listed by the 'interpreter_pool_modules'
+option in the 'general' section of the config file when it starts. The
+environment, working directory, and modules that read the environment on
+import are reset in each child so that models remain isolated from one
+another and from the parent process."""
+import os
+import sys
+import atexit
+import logging
+import runpy
+import threading
+import multiprocessing
+from multiprocessing import forkserver
+from multiprocessing.connection import Connection
+from yggdrasil import platform, tools
+
+
+logger = logging.getLogger(__name__)
+_default_modules = ['numpy', 'pandas', 'unyt', 'yggdrasil',
+                    'yggdrasil.languages.Python.YggInterface']
+# Modules that read environment variables when they are imported and must
+# be imported again by children with the model's environment
+_env_dependent_modules = ['yggdrasil.interface.YggInterface',
+                          'yggdrasil.interface',
+                          'yggdrasil.languages.Python.YggInterface']
+# Environment variables that alter how modules are imported/initialized and
+# so must match the environment the pool was started with. Other variables
+# are only read after the environment has been replaced in the child.
+_env_import_prefixes = ('PYTHON', 'PATH', 'LD_', 'DYLD_', 'CONDA', 'VIRTUAL_ENV',
+                        'HOME', 'TMP', 'MPL', 'OMP_', 'KMP_', 'MKL_',
+                        'OPENBLAS_', 'NUMEXPR_', 'VECLIB_', 'GOTO_')
+_pool_context = None
+_pool_env = None
+_pool_config_file = None
+_pool_lock = threading.Lock()
+
+
+def is_enabled():
+    r"""Determine if models should be started from the interpreter pool
+    based on the 'interpreter_pool' option in the 'general' section of the
+    yggdrasil config file (or YGG_INTERPRETER_POOL).
+
+    Returns:
+        bool: True if the pool should be used, False otherwise.
+
+    """
+    from yggdrasil.config import ygg_cfg
+    if platform._is_win or ('forkserver' not in
+                            multiprocessing.get_all_start_methods()):
+        return False
+    out = ygg_cfg.get('general', 'interpreter_pool', False)
+    if isinstance(out, str):
+        out = (out.lower() in ['true', '1'])
+    return bool(out)
+
+
+def get_preload_modules():
+    r"""Get the modules that should be imported by the pool before any
+    children are forked from the 'interpreter_pool_modules' option in the
+    'general' section of the yggdrasil config file
+    (or YGG_INTERPRETER_POOL_MODULES).
+
+    Returns:
+        list: Names of modules.
+
+    """
+    from yggdrasil.config import ygg_cfg
+    out = ygg_cfg.get('general', 'interpreter_pool_modules', None)
+    if out is None:
+        return list(_default_modules)
+    if isinstance(out, str):
+        out = out.split(',')
+    return [x.strip() for x in out if x.strip()]
+
+
+def is_running():
+    r"""Determine if the pool has been started.
+
+    Returns:
+        bool: True if the pool has been started, False otherwise.
+
+    """
+    return (_pool_context is not None)
+
+
+def start():
+    r"""Start the pool if it is not already running.
+
+    Returns:
+        multiprocessing.context.ForkServerContext: Context that can be used
+            to start processes from the pool.
+
+    """
+    global _pool_context, _pool_env, _pool_config_file
+    from yggdrasil import config
+    with _pool_lock:
+        if _pool_context is None:
+            ctx = multiprocessing.get_context('forkserver')
+            modules = get_preload_modules()
+            ctx.set_forkserver_preload(modules)
+            env = dict(os.environ)
+            forkserver.ensure_running()
+            logger.debug("Started interpreter pool with modules: %s",
+                         modules)
+            _pool_env = env
+            _pool_config_file = os.path.join(os.getcwd(),
+                                             config.config_file)
+            _pool_context = ctx
+    return _pool_context
+
+
+def is_compatible(env, working_dir=None):
+    r"""Determine if a model with the provided environment can be started
+    from the pool without differing from a model started in a new
+    interpreter.
+
+    Args:
+        env (dict): Environment variables for the model process.
+        working_dir (str, optional): Directory that the model will be run
+            in. Defaults to None and is ignored.
+
+    Returns:
+        bool: True if the model can be started from the pool, False
+            otherwise.
+
+    """
+    from yggdrasil import config
+    base = _pool_env
+    if base is None:
+        base = os.environ
+    for k in set(base.keys()) | set(env.keys()):
+        if k.startswith(_env_import_prefixes) and (env.get(k, None)
+                                                   != base.get(k, None)):
+            return False
+    # Configuration options are loaded from the working directory
+    if working_dir is not None:
+        pool_cfg = _pool_config_file
+        if pool_cfg is None:
+            pool_cfg = os.path.join(os.getcwd(), config.config_file)
+        model_cfg = os.path.join(working_dir, config.config_file)
+        if ((os.path.normcase(os.path.abspath(model_cfg))
+             != os.path.normcase(os.path.abspath(pool_cfg)))
+                and (os.path.isfile(model_cfg) or os.path.isfile(pool_cfg))):
+            return False
+    return True
+
+
+def get_context(env=None, working_dir=None):
+    r"""Get the multiprocessing context that should be used to start a
+    model process.
+
+    Args:
+        env (dict, optional): Environment variables for the model process.
+            Defaults to None and is not checked.
+        working_dir (str, optional): Directory that the model will be run
+            in. Defaults to None and is not checked.
+
+    Returns:
+        multiprocessing.context.BaseContext: Context for starting processes
+            from the pool. None is returned if the pool is disabled or the
+            model cannot be started from it.
+
+    """
+    if not is_enabled():
+        return None
+    if (env is not None) and (not is_compatible(env, working_dir=working_dir)):
+        logger.debug("Model environment is not compatible with the "
+                     "interpreter pool. A new interpreter will be used.")
+        return None
+    return start()
+
+
+def prepare_child(env=None, working_dir=None):
+    r"""Reset the state inherited from the pool in a newly forked child
+    so that it matches a new interpreter started with the provided
+    environment.
+
+    Args:
+        env (dict, optional): Environment variables that should replace
+            those inherited from the pool. Defaults to None and the
+            environment is not changed.
+        working_dir (str, optional): Directory that the child should move
+            into. Defaults to None and the working directory is not changed.
+
+    """
+    if env is not None:
+        os.environ.clear()
+        os.environ.update(env)
+    if working_dir is not None:
+        os.chdir(working_dir)
+    for k in _env_dependent_modules:
+        if sys.modules.pop(k, None) is not None:
+            parent, child = k.rsplit('.', 1)
+            if hasattr(sys.modules.get(parent, None), child):
+                delattr(sys.modules[parent], child)
+    from yggdrasil import config
+    config.cfg_environment()
+    if tools.is_subprocess():
+        # Remove handlers added while the pool was configured as the parent
+        logging.getLogger().handlers = []
+    config.cfg_logging()
+    if 'yggdrasil.communication.DefaultComm' in sys.modules:
+        sys.modules['yggdrasil.communication.DefaultComm'].DefaultComm._reset_alias()
+    if 'yggdrasil.communication.ZMQComm' in sys.modules:
+        sys.modules['yggdrasil.communication.ZMQComm'].reset_global_context()
+
+
+def run_script(args, env=None, working_dir=None, stdout=None):
+    r"""Run a Python script in a child forked from the pool in the same way
+    as it would be run by a new interpreter.
+
+    Args:
+        args (list): Path to the script followed by any arguments that
+            should be passed to it.
+        env (dict, optional): Environment variables for the script.
+            Defaults to None and the environment is not changed.
+        working_dir (str, optional): Directory that the script should be
+            run in. Defaults to None and the working directory is not
+            changed.
+        stdout (multiprocessing.connection.Connection, optional):
+            Connection wrapping a file descriptor that stdout and stderr
+            should be redirected to. Defaults to None and stdout and stderr
+            are not redirected.
+
+    """
+    if stdout is not None:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(stdout.fileno(), 1)
+        os.dup2(stdout.fileno(), 2)
+        stdout.close()
+    if not platform._is_win:
+        os.setpgrp()
+    prepare_child(env=env, working_dir=working_dir)
+    sys.argv = [str(x) for x in args]
+    sys.path[0] = os.path.dirname(os.path.abspath(sys.argv[0]))
+    try:
+        runpy.run_path(sys.argv[0], run_name='__main__')
+    finally:
+        # Processes started by multiprocessing exit without calling the
+        # functions that the interpreter would on exit so the interpreter's
+        # shutdown sequence is repeated here
+        threading._shutdown()
+        atexit._run_exitfuncs()
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+
+class PoolProcess(object):
+    r"""Process running a Python script that was started from the
+    interpreter pool. The attributes and methods used by model drivers for
+    processes started by subprocess.Popen are provided.
+
+    Args:
+        args (list): Path to the script followed by any arguments that
+            should be passed to it.
+        env (dict, optional): Environment variables for the script.
+            Defaults to None and the environment is not changed.
+        working_dir (str, optional): Directory that the script should be
+            run in. Defaults to None and the working directory is not
+            changed.
+        context (multiprocessing.context.BaseContext, optional): Context
+            that should be used to start the process. Defaults to the
+            context returned by get_context.
+
+    Attributes:
+        args (list): Path to the script followed by any arguments.
+        stdout (file): Combined stdout and stderr from the script.
+        pid (int): ID of the process running the script.
+        returncode (int): Return code of the process once it has
+            finished, None before then.
+
+    Raises:
+        RuntimeError: If context is not provided and the pool is disabled
+            or the script cannot be run from it.
+
+    """
+
+    def __init__(self, args, env=None, working_dir=None, context=None):
+        if context is None:
+            context = get_context(env=env, working_dir=working_dir)
+            if context is None:
+                raise RuntimeError("The interpreter pool is not available.")
+        self.args = args
+        self.returncode = None
+        rfd, wfd = os.pipe()
+        wconn = Connection(wfd, readable=False)
+        try:
+            self._process = context.Process(
+                target=run_script, args=(args, ),
+                kwargs=dict(env=env, working_dir=working_dir, stdout=wconn),
+                name=os.path.basename(args[0]))
+            self._process.start()
+        except BaseException:
+            os.close(rfd)
+            raise
+        finally:
+            wconn.close()
+        self.stdout = os.fdopen(rfd, 'rb')
+        self.pid = self._process.pid
+
+    def poll(self):
+        r"""Check if the process has finished.
+
+        Returns:
+            int: Return code if the process has finished, None otherwise.
+
+        """
+        if self.returncode is None:
+            self.returncode = self._process.exitcode
+        return self.returncode
+
+    def wait(self, timeout=None):
+        r"""Wait for the process to finish.
+
+        Args:
+            timeout (float, optional): Maximum time (in seconds) that should
+                be waited. Defaults to None and is infinite.
+
+        Returns:
+            int: Return code if the process has finished, None otherwise.
+
+        """
+        self._process.join(timeout)
+        return self.poll()
+
+    def terminate(self):
+        r"""Terminate the process."""
+        self._process.terminate()
+
+    def kill(self):
+        r"""Kill the process."""
+        # Process.kill was added in Python 3.7
+        getattr(self._process, 'kill', self._process.terminate)()
@@ -1,7 +1,10 @@
 import os
 import copy
+import json
 import pprint
+import threading
 import jsonschema
+from collections import OrderedDict
 import yggdrasil
 from yggdrasil.metaschema.encoder import encode_json, decode_json
 from yggdrasil.metaschema.properties import get_registered_properties
@@ -14,6 +17,11 @@ _metaschema_fname = os.path.abspath(os.path.join(
 _metaschema = None
 _validator = None
 _base_schema = {u'$schema': u'http://json-schema.org/draft-04/schema'}
+_validator_cache_size = 256
+_validator_cache_lock = threading.RLock()
+_validator_cache = OrderedDict()
+_validated_cache = OrderedDict()
+_validator_local = threading.local()
 
 
 if os.path.isfile(_metaschema_fname):
@@ -71,9 +79,14 @@ def create_metaschema(overwrite=False):
     return out
 
 
-def get_metaschema():
+def get_metaschema(dont_copy=False):
     r"""Return the meta schema for validating ygg schema.
 
+    Args:
+        dont_copy (bool, optional): If True, the cached meta schema is
+            returned without being copied. This is faster, but the result
+            must not be modified. Defaults to False.
+
     Returns:
         dict: Meta schema specifying rules for ygg type schema. This includes
             all original JSON schema rules with the addition of types and
@@ -87,6 +100,8 @@ def get_metaschema():
     global _metaschema
     if (_metaschema is None):
         _metaschema = create_metaschema()
+    if dont_copy:
+        return _metaschema
     return copy.deepcopy(_metaschema)
 
 
@@ -106,7 +121,8 @@ def get_validator(overwrite=False, normalizers=None, **kwargs):
     from yggdrasil.metaschema import normalizer
     global _validator
     if (_validator is None) or overwrite:
-        metaschema = get_metaschema()
+        clear_validator_cache()
+        metaschema = get_metaschema(dont_copy=True)
         # Get set of validators
         all_validators = copy.deepcopy(_base_validator.VALIDATORS)
         for k, v in get_registered_properties().items():
@@ -162,6 +178,166 @@ def validate_schema(obj):
 #     return cls.normalize_schema(obj)
 
 
+def clear_validator_cache():
+    r"""Clear the cache of schemas that have been checked, the validators
+    created for them, and the instances validated by the fast path."""
+    with _validator_cache_lock:
+        _validator_cache.clear()
+        _validated_cache.clear()
+    _validator_local.__dict__.clear()
+
+
+def _cache_get(cache, key):
+    r"""Get an entry from an LRU cache, marking it as recently used.
+
+    Args:
+        cache (OrderedDict): Cache to get the entry from.
+        key (object): Key for the entry.
+
+    Returns:
+        object: Cached entry, None if there is not one.
+
+    """
+    out = cache.get(key, None)
+    if out is not None:
+        cache.move_to_end(key)
+    return out
+
+
+def _cache_set(cache, key, value):
+    r"""Add an entry to an LRU cache, discarding the least recently used
+    entries if the cache exceeds _validator_cache_size.
+
+    Args:
+        cache (OrderedDict): Cache to add the entry to.
+        key (object): Key for the entry.
+        value (object): Entry to add.
+
+    """
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > _validator_cache_size:
+        cache.popitem(last=False)
+
+
+def get_schema_key(schema):
+    r"""Get a canonical, hashable key for a schema.
+
+    Args:
+        schema (dict): Schema to get a key for.
+
+    Returns:
+        str: JSON encoding of the schema with sorted keys. None is returned
+            if the schema cannot be encoded as JSON.
+
+    """
+    try:
+        return json.dumps(schema, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+
+def is_fast_schema(schema):
+    r"""Determine if the validity of an instance against a schema depends
+    only on the Python type, data type, shape, and units of the instance
+    (e.g. scalar, ndarray, and table type definitions) so that the outcome
+    of validation can be reused for instances with the same signature.
+
+    Args:
+        schema (dict): Schema to check.
+
+    Returns:
+        bool: True if the fast path can be used for the schema, False
+            otherwise.
+
+    """
+    from yggdrasil.metaschema.datatypes.ScalarMetaschemaType import (
+        ScalarMetaschemaType)
+    if not (isinstance(schema, dict)
+            and isinstance(schema.get('type', None), str)):
+        return False
+    type_cls = get_registered_types().get(schema['type'], None)
+    if type_cls is None:
+        return False
+    validators = get_validator().VALIDATORS
+    for k in schema.keys():
+        if (k in validators) and (k not in type_cls.properties):
+            return False
+    if issubclass(type_cls, ScalarMetaschemaType):
+        return True
+    if type_cls.name == 'array':
+        items = schema.get('items', [])
+        if isinstance(items, dict):
+            items = [items]
+        return isinstance(items, list) and all(is_fast_schema(x) for x in items)
+    return False
+
+
+def get_instance_signature(obj):
+    r"""Get a signature for an instance that determines the outcome of
+    validation against a fast path schema (see is_fast_schema).
+
+    Args:
+        obj (object): Instance to get the signature for.
+
+    Returns:
+        tuple: Signature containing the instance type and the data type,
+            shape, and units for numpy instances. None is returned for
+            instances whose validity may depend on their values.
+
+    """
+    import numpy as np
+    from yggdrasil import units
+    if isinstance(obj, (list, tuple)):
+        out = [get_instance_signature(x) for x in obj]
+        if None in out:
+            return None
+        return (type(obj), tuple(out))
+    if isinstance(obj, (np.ndarray, np.generic)) and not obj.dtype.hasobject:
+        return (type(obj), obj.dtype, obj.shape, units.get_units(obj))
+    return None
+
+
+def get_schema_validator(schema, key=None):
+    r"""Get a validator instance for a schema. The schema is only checked
+    against the metaschema the first time that it is encountered and the
+    validator is cached (per thread) for reuse by later calls.
+
+    Args:
+        schema (dict): Schema that the validator should use.
+        key (str, optional): Key for the schema returned by get_schema_key.
+            If not provided, it will be created.
+
+    Returns:
+        jsonschema.IValidator: Validator instance for the schema.
+
+    Raises:
+        SchemaError: If the schema is not valid.
+
+    """
+    cls = get_validator()
+    if key is None:
+        key = get_schema_key(schema)
+    if key is None:
+        cls.check_schema(schema)
+        return cls(schema)
+    with _validator_cache_lock:
+        entry = _cache_get(_validator_cache, key)
+    if entry is None:
+        cls.check_schema(schema)
+        entry = {'schema': copy.deepcopy(schema), 'fast': None}
+        with _validator_cache_lock:
+            _cache_set(_validator_cache, key, entry)
+    if getattr(_validator_local, 'cls', None) is not cls:
+        _validator_local.cls = cls
+        _validator_local.instances = OrderedDict()
+    out = _cache_get(_validator_local.instances, key)
+    if out is None:
+        out = cls(entry['schema'])
+        _cache_set(_validator_local.instances, key, out)
+    return out
+
+
 def validate_instance(obj, schema, **kwargs):
     r"""Validate an instance against a schema.
 
@@ -174,9 +350,33 @@ def validate_instance(obj, schema, **kwargs):
         ValidationError: If the object is not valid.
 
     """
-    cls = get_validator()
-    cls.check_schema(schema)
-    return cls(schema).validate(obj, **kwargs)
+    key = get_schema_key(schema)
+    if key is None:
+        cls = get_validator()
+        cls.check_schema(schema)
+        return cls(schema).validate(obj, **kwargs)
+    if kwargs:
+        # Options modify the validator state so a new instance is used
+        validator = get_schema_validator(schema, key=key)
+        return type(validator)(validator.schema).validate(obj, **kwargs)
+    validator = get_schema_validator(schema, key=key)
+    with _validator_cache_lock:
+        entry = _validator_cache.get(key, None)
+    if entry is not None:
+        if entry['fast'] is None:
+            entry['fast'] = is_fast_schema(schema)
+        if entry['fast']:
+            signature = get_instance_signature(obj)
+            if signature is not None:
+                fast_key = (key, signature)
+                with _validator_cache_lock:
+                    if _cache_get(_validated_cache, fast_key) is not None:
+                        return None
+                validator.validate(obj)
+                with _validator_cache_lock:
+                    _cache_set(_validated_cache, fast_key, True)
+                return None
+    return validator.validate(obj)
 
 
 def normalize_instance(obj, schema, **kwargs):
@@ -191,6 +391,6 @@ def normalize_instance(obj, schema, **kwargs):
         object: Normalized instance.
 
     """
-    cls = get_validator()
-    cls.check_schema(schema)
-    return cls(schema).normalize(obj, **kwargs)
+    validator = get_schema_validator(schema)
+    # Normalization modifies the validator state so a new instance is used
+    return type(validator)(validator.schema).normalize(obj, **kwargs)
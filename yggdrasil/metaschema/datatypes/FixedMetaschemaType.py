@@ -1,5 +1,6 @@
 import jsonschema
 import copy
+from yggdrasil.metaschema import validate_instance
 from yggdrasil.metaschema.datatypes import (
     compare_schema, generate_data, resolve_schema_references)
 from yggdrasil.metaschema.datatypes.MetaschemaType import MetaschemaType
@@ -183,8 +184,7 @@ class FixedMetaschemaType(MetaschemaType):
             return False
         try:
             obj = cls.coerce_type(obj)
-            jsonschema.validate(obj, cls.updated_fixed_properties(obj),
-                                cls=cls.validator())
+            validate_instance(obj, cls.updated_fixed_properties(obj))
         except (jsonschema.exceptions.ValidationError, AssertionError):
             if raise_errors:
                 raise
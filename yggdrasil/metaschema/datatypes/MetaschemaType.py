@@ -8,7 +8,7 @@ from yggdrasil.metaschema import (get_metaschema, get_validator, encoder,
                                   validate_instance)
 from yggdrasil.metaschema.datatypes import (
     MetaschemaTypeError, MetaschemaTypeMeta, compare_schema, YGG_MSG_HEAD,
-    get_type_class, conversions, is_default_typedef)
+    get_type_class, conversions, is_default_typedef, BinaryPayload)
 from yggdrasil.metaschema.properties import get_metaschema_property
 
 
@@ -623,7 +623,8 @@ class MetaschemaType(object):
         return out
 
     def serialize(self, obj, no_metadata=False, dont_encode=False,
-                  dont_check=False, max_header_size=0, **kwargs):
+                  dont_check=False, max_header_size=0, binary_payload=False,
+                  **kwargs):
         r"""Serialize a message.
 
         Args:
@@ -640,13 +641,19 @@ class MetaschemaType(object):
                 should occupy in order to be sent in a single message.
                 A value of 0 indicates that any size header is valid.
                 Defaults to 0.
+            binary_payload (bool, optional): If True, array data will be
+                appended to the message as raw bytes following the JSON
+                encoded data rather than being base64 encoded within it.
+                This requires that the receiving end deserializes the
+                message in Python and is ignored if no_metadata is True.
+                Defaults to False.
             **kwargs: Additional keyword arguments are added to the metadata.
 
         Returns:
             bytes, str: Serialized message.
 
         """
-        for k in ['size', 'data', 'datatype']:
+        for k in ['size', 'data', 'datatype', 'binary_size']:
             if k in kwargs:
                 raise RuntimeError("'%s' is a reserved keyword in the metadata." % k)
         if ((isinstance(obj, bytes)
@@ -656,38 +663,137 @@ class MetaschemaType(object):
             data = obj
             is_raw = True
         else:
-            typedef, data = self.encode(obj, typedef=self._typedef,
-                                        typedef_validated=True,
-                                        dont_check=dont_check, **kwargs)
+            payload = BinaryPayload(
+                enabled=(binary_payload and (not no_metadata)))
+            with payload:
+                typedef, data = self.encode(obj, typedef=self._typedef,
+                                            typedef_validated=True,
+                                            dont_check=dont_check, **kwargs)
             metadata = {'datatype': typedef}
             metadata.update(kwargs)
             is_raw = False
         if not is_raw:
             data = encoder.encode_json(data)
+            if payload.nbytes > 0:
+                # Pad the JSON so that the arrays are aligned
+                pad = (-len(data)) % payload.alignment
+                data = b''.join([data, pad * b' '] + payload.chunks)
+                metadata['binary_size'] = payload.nbytes
         if no_metadata:
             return data
-        metadata['size'] = len(data)
         metadata.setdefault('id', str(uuid.uuid4()))
+        header = self.serialize_header(metadata, len(data),
+                                       max_header_size=max_header_size)
+        msg = header + data
+        return msg
+
+    def serialize_header(self, metadata, size, max_header_size=0):
+        r"""Serialize the header that should precede an encoded message
+        body. If the header is too large, the type information is moved
+        into the returned bytes following the header so that the message
+        is still formed by appending the encoded body.
+
+        Args:
+            metadata (dict): Header information.
+            size (int): Size of the encoded message body.
+            max_header_size (int, optional): Maximum size that header
+                should occupy in order to be sent in a single message.
+                A value of 0 indicates that any size header is valid.
+                Defaults to 0.
+
+        Returns:
+            bytes: Serialized header that the encoded body should be
+                appended to.
+
+        Raises:
+            AssertionError: If the header is larger than max_header_size
+                after the type information is moved out of it.
+
+        """
+        metadata = dict(metadata, size=size)
         header = YGG_MSG_HEAD + encoder.encode_json(metadata) + YGG_MSG_HEAD
         if (max_header_size > 0) and (len(header) > max_header_size):
             metadata_type = metadata
             metadata = {}
             for k in ['address', 'size', 'id', 'request_id',
                       'response_address', 'zmq_reply',
-                      'zmq_reply_worker', 'model']:
+                      'zmq_reply_worker', 'model', 'binary_size']:
                 if k in metadata_type:
                     metadata[k] = metadata_type.pop(k)
             assert(metadata)
-            data = (encoder.encode_json(metadata_type) + YGG_MSG_HEAD + data)
-            metadata['size'] = len(data)
+            prefix = encoder.encode_json(metadata_type) + YGG_MSG_HEAD
+            metadata['size'] = len(prefix) + size
             metadata['type_in_data'] = True
             header = YGG_MSG_HEAD + encoder.encode_json(metadata) + YGG_MSG_HEAD
             if len(header) > max_header_size:  # pragma: debug
                 raise AssertionError(("The header is larger (%d) than the "
                                       "maximum (%d): %.100s...")
                                      % (len(header), max_header_size, header))
-        msg = header + data
-        return msg
+            header += prefix
+        return header
+
+    def update_header(self, msg, max_header_size=0, remove_keys=None,
+                      **kwargs):
+        r"""Replace the header of a serialized message without re-encoding
+        the message body.
+
+        Args:
+            msg (bytes): Serialized message including a header.
+            max_header_size (int, optional): Maximum size that header
+                should occupy in order to be sent in a single message.
+                A value of 0 indicates that any size header is valid.
+                Defaults to 0.
+            remove_keys (list, optional): Keys that should be removed from
+                the existing metadata before it is updated. Defaults to None
+                and the existing metadata is preserved.
+            **kwargs: Additional keyword arguments are added to the metadata.
+
+        Returns:
+            tuple(bytes, memoryview): The new serialized header and a
+                view of the existing encoded body that should follow it.
+
+        Raises:
+            ValueError: If msg does not contain a header.
+
+        """
+        metadata, body = self.split_header(msg)
+        for k in (remove_keys or []):
+            metadata.pop(k, None)
+        metadata.update(kwargs)
+        header = self.serialize_header(metadata, len(body),
+                                       max_header_size=max_header_size)
+        return header, body
+
+    def split_header(self, msg):
+        r"""Split a serialized message into its header information and
+        encoded body without decoding the body.
+
+        Args:
+            msg (bytes): Serialized message including a header.
+
+        Returns:
+            tuple(dict, memoryview): The header information (including
+                any type information moved into the body) and a view of
+                the encoded body.
+
+        Raises:
+            ValueError: If msg does not contain a header.
+
+        """
+        if not msg.startswith(YGG_MSG_HEAD):
+            raise ValueError("Header marker not in message.")
+        iheader = len(YGG_MSG_HEAD)
+        ibody = msg.index(YGG_MSG_HEAD, iheader)
+        metadata = encoder.decode_json(msg[iheader:ibody])
+        ibody += len(YGG_MSG_HEAD)
+        if metadata.pop('type_in_data', False):
+            itype = ibody
+            ibody = msg.index(YGG_MSG_HEAD, itype)
+            metadata.update(encoder.decode_json(msg[itype:ibody]))
+            ibody += len(YGG_MSG_HEAD)
+        body = memoryview(msg)[ibody:]
+        metadata['size'] = len(body)
+        return metadata, body
     
     def deserialize(self, msg, no_data=False, metadata=None, dont_decode=False,
                     dont_check=False):
@@ -725,8 +831,18 @@ class MetaschemaType(object):
                 metadata = dict(size=len(data))
             else:
                 metadata = encoder.decode_json(metadata)
+            if (((len(data) >= metadata['size'])
+                 and metadata.get('type_in_data', False))):
+                # Complete message with the type in the body (e.g. a
+                # message received in a single multipart message)
+                return self.deserialize(data, no_data=no_data,
+                                        metadata=metadata,
+                                        dont_decode=dont_decode,
+                                        dont_check=dont_check)
         elif isinstance(metadata, dict) and metadata.get('type_in_data', False):
-            assert(msg.count(YGG_MSG_HEAD) == 1)
+            # Raw binary data following the type may contain the separator
+            assert(msg[:(len(msg) - metadata.get('binary_size', 0))].count(
+                YGG_MSG_HEAD) == 1)
             typedef, data = msg.split(YGG_MSG_HEAD, 1)
             if len(typedef) > 0:
                 metadata.update(encoder.decode_json(typedef))
@@ -753,9 +869,15 @@ class MetaschemaType(object):
               or (metadata.get('type', None) == 'direct') or dont_decode):
             return data, metadata
         else:
-            data = encoder.decode_json(data)
-            obj = self.decode(metadata['datatype'], data, self._typedef,
-                              typedef_validated=True, dont_check=dont_check)
+            binary_size = metadata.get('binary_size', 0)
+            payload = BinaryPayload(enabled=(binary_size > 0))
+            if binary_size > 0:
+                payload.buffer = memoryview(data)[(len(data) - binary_size):]
+                data = data[:(len(data) - binary_size)]
+            with payload:
+                data = encoder.decode_json(data)
+                obj = self.decode(metadata['datatype'], data, self._typedef,
+                                  typedef_validated=True, dont_check=dont_check)
         return obj, metadata
 
     # TESTING METHODS
@@ -8,7 +8,8 @@ from yggdrasil.metaschema.datatypes import _schema_dir
 from yggdrasil.metaschema.datatypes.JSONObjectMetaschemaType import (
     JSONObjectMetaschemaType)
 from yggdrasil.metaschema.datatypes.PlyMetaschemaType import (
-    trimesh, PlyDict,
+    trimesh, PlyDict, _lists2csr, _csr2lists, _padded2csr, _csr2padded,
+    _array2dicts, _add_array_columns,
     _index_type, _color_type, _coord_type,
     _index_conv, _color_conv, _coord_conv,
     _index_fmt, _color_fmt, _coord_fmt)
@@ -229,7 +230,8 @@ if not os.path.isfile(_schema_file):  # pragma: debug
 
 
 class ObjDict(PlyDict):
-    r"""Enhanced dictionary class for storing Obj information."""
+    r"""Enhanced dictionary class for storing Obj information. Elements
+    are stored as lists of dictionaries in the same way as for PlyDict."""
 
     @classmethod
     def from_array_dict(cls, in_dict):
@@ -244,235 +246,196 @@ class ObjDict(PlyDict):
             old_vert = kws['vertices']
             nvert = old_vert.shape[1]
             assert(nvert in (3, 4))
-            kws['vertices'] = [
-                {k: old_vert[i, j] for j, k in enumerate('xyzw'[:nvert])
-                 if ((j < 3) or (not np.isnan(old_vert[i, j])))}
-                for i in range(old_vert.shape[0])]
+            kws['vertices'] = _array2dicts(old_vert, 'xyzw'[:nvert],
+                                           nrequired=3)
         if isinstance(in_dict.get('vertex_colors', None), np.ndarray):
             old_colr = in_dict['vertex_colors']
             assert(old_colr.shape == (len(kws['vertices']), 3))
-            for i in range(old_colr.shape[0]):
-                for j, k in enumerate(['red', 'green', 'blue']):
-                    kws['vertices'][i][k] = old_colr[i, j]
+            _add_array_columns(kws['vertices'], old_colr,
+                               ['red', 'green', 'blue'], skip_nan=False)
         if isinstance(kws.get('params', None), np.ndarray):
             old_parm = kws['params']
             nparm = old_parm.shape[1]
             assert(nparm in [2, 3])
-            kws['params'] = [
-                {k: old_parm[i, j] for j, k in enumerate('uvw'[:nparm])
-                 if ((j < 2) or (not np.isnan(old_parm[i, j])))}
-                for i in range(old_parm.shape[0])]
+            kws['params'] = _array2dicts(old_parm, 'uvw'[:nparm],
+                                         nrequired=2)
         if isinstance(kws.get('normals', None), np.ndarray):
             old_norm = kws['normals']
             assert(old_norm.shape[1] == 3)
-            kws['normals'] = [
-                {k: old_norm[i, j] for j, k in enumerate('ijk')}
-                for i in range(old_norm.shape[0])]
+            kws['normals'] = _array2dicts(old_norm, 'ijk')
         if isinstance(kws.get('texcoords', None), np.ndarray):
             old_texc = kws['texcoords']
             ntexc = old_texc.shape[1]
             assert(ntexc in [1, 2, 3])
-            kws['texcoords'] = [
-                {k: old_texc[i, j] for j, k in enumerate('uvw'[:ntexc])
-                 if ((j < 1) or (not np.isnan(old_texc[i, j])))}
-                for i in range(old_texc.shape[0])]
+            kws['texcoords'] = _array2dicts(old_texc, 'uvw'[:ntexc],
+                                            nrequired=1)
         # Composites of above
-        if isinstance(kws.get('lines', None), np.ndarray):
-            old_edge = kws['lines']
-            assert(old_edge.shape[1] == 2)
-            kws['lines'] = [
-                [{'vertex_index': np.int32(old_edge[i, j])}
-                 for j in range(old_edge.shape[1])
-                 if (not np.isnan(old_edge[i, j]))]
-                for i in range(old_edge.shape[0])]
-        if isinstance(kws.get('faces', None), np.ndarray):
-            old_face = kws['faces']
-            assert(old_face.shape[1] >= 3)
-            kws['faces'] = [
-                [{'vertex_index': np.int32(old_face[i, j])}
-                 for j in range(old_face.shape[1])
-                 if (not np.isnan(old_face[i, j]))]
-                for i in range(old_face.shape[0])]
-        if isinstance(in_dict.get('face_texcoords', None), np.ndarray):
-            old_texc = in_dict['face_texcoords']
-            assert(old_texc.shape[0] == len(kws.get('faces', [])))
-            for i in range(old_texc.shape[0]):
-                for j in range(old_texc.shape[1]):
-                    if not np.isnan(old_texc[i, j]):
-                        kws['faces'][i][j]['texcoord_index'] = np.int32(
-                            old_texc[i, j])
-        if isinstance(in_dict.get('face_normals', None), np.ndarray):
-            old_norm = in_dict['face_normals']
-            assert(old_norm.shape[0] == len(kws.get('faces', [])))
-            for i in range(old_norm.shape[0]):
-                for j in range(old_norm.shape[1]):
-                    if not np.isnan(old_norm[i, j]):
-                        kws['faces'][i][j]['normal_index'] = np.int32(
-                            old_norm[i, j])
-        if isinstance(kws.get('points', None), np.ndarray):
-            old_pnts = kws['points']
-            kws['points'] = [
-                [np.int32(old_pnts[i, j]) for j in range(old_pnts.shape[1])
-                 if (not np.isnan(old_pnts[i, j]))]
-                for i in range(old_pnts.shape[0])]
+        for k, ncol in [('lines', 2), ('faces', 3)]:
+            if isinstance(kws.get(k, None), np.ndarray):
+                old_edge = kws[k]
+                if k == 'lines':
+                    assert(old_edge.shape[1] == ncol)
+                else:
+                    assert(old_edge.shape[1] >= ncol)
+                values, offsets = _padded2csr(old_edge)
+                kws[k] = [[{'vertex_index': v} for v in x] for x in
+                          _csr2lists(values.astype(np.int32), offsets)]
+        for k, ik in [('face_texcoords', 'texcoord_index'),
+                      ('face_normals', 'normal_index')]:
+            if isinstance(in_dict.get(k, None), np.ndarray):
+                old_indx = in_dict[k]
+                assert(old_indx.shape[0] == len(kws.get('faces', [])))
+                cls._add_padded_indices(kws['faces'], old_indx, ik)
+        for k in ['points', 'curve2Ds']:
+            if isinstance(kws.get(k, None), np.ndarray):
+                values, offsets = _padded2csr(kws[k])
+                kws[k] = _csr2lists(values.astype(np.int32), offsets)
         if isinstance(kws.get('curves', None), np.ndarray):
-            old_curv = kws['curves']
-            kws['curves'] = [
-                {'vertex_indices': [
-                    np.int32(old_curv[i, j]) for j in range(old_curv.shape[1])
-                    if (not np.isnan(old_curv[i, j]))]}
-                for i in range(old_curv.shape[0])]
+            values, offsets = _padded2csr(kws['curves'])
+            kws['curves'] = [{'vertex_indices': x} for x in
+                             _csr2lists(values.astype(np.int32), offsets)]
             assert('curve_params' in in_dict)
             if isinstance(in_dict['curve_params'], np.ndarray):
                 old_parm = in_dict['curve_params']
                 assert(old_parm.shape == (len(kws['curves']), 2))
-                for i in range(old_parm.shape[0]):
-                    kws['curves'][i]['starting_param'] = old_parm[i, 0]
-                    kws['curves'][i]['ending_param'] = old_parm[i, 1]
-        if isinstance(kws.get('curve2Ds', None), np.ndarray):
-            old_curv = kws['curve2Ds']
-            kws['curve2Ds'] = [
-                [np.int32(old_curv[i, j]) for j in range(old_curv.shape[1])
-                 if (not np.isnan(old_curv[i, j]))]
-                for i in range(old_curv.shape[0])]
+                _add_array_columns(kws['curves'], old_parm,
+                                   ['starting_param', 'ending_param'],
+                                   skip_nan=False)
         if isinstance(kws.get('surfaces', None), np.ndarray):
-            old_surf = kws['surfaces']
+            values, offsets = _padded2csr(kws['surfaces'])
             kws['surfaces'] = [
-                {'vertex_indices': [
-                    {'vertex_index': np.int32(old_surf[i, j])}
-                    for j in range(old_surf.shape[1])
-                    if (not np.isnan(old_surf[i, j]))]}
-                for i in range(old_surf.shape[0])]
+                {'vertex_indices': [{'vertex_index': v} for v in x]}
+                for x in _csr2lists(values.astype(np.int32), offsets)]
             assert('surface_params' in in_dict)
             if isinstance(in_dict['surface_params'], np.ndarray):
                 old_parm = in_dict['surface_params']
                 assert(old_parm.shape == (len(kws['surfaces']), 4))
-                for i in range(old_parm.shape[0]):
-                    kws['surfaces'][i]['starting_param_u'] = old_parm[i, 0]
-                    kws['surfaces'][i]['ending_param_u'] = old_parm[i, 1]
-                    kws['surfaces'][i]['starting_param_v'] = old_parm[i, 2]
-                    kws['surfaces'][i]['ending_param_v'] = old_parm[i, 3]
-        if isinstance(in_dict.get('surface_texcoords', None), np.ndarray):
-            old_texc = in_dict['surface_texcoords']
-            assert(old_texc.shape[0] == len(kws['surfaces']))
-            for i in range(old_texc.shape[0]):
-                for j in range(old_texc.shape[1]):
-                    if not np.isnan(old_texc[i, j]):
-                        kws['surfaces'][i]['vertex_indices'][j][
-                            'texcoord_index'] = np.int32(old_texc[i, j])
-        if isinstance(in_dict.get('surface_normals', None), np.ndarray):
-            old_norm = in_dict['surface_normals']
-            assert(old_norm.shape[0] == len(kws['surfaces']))
-            for i in range(old_norm.shape[0]):
-                for j in range(old_norm.shape[1]):
-                    if not np.isnan(old_norm[i, j]):
-                        kws['surfaces'][i]['vertex_indices'][j][
-                            'normal_index'] = np.int32(old_norm[i, j])
-        return cls.from_dict(kws)
-        
+                _add_array_columns(kws['surfaces'], old_parm,
+                                   ['starting_param_u', 'ending_param_u',
+                                   'starting_param_v', 'ending_param_v'],
+                                   skip_nan=False)
+        for k, ik in [('surface_texcoords', 'texcoord_index'),
+                      ('surface_normals', 'normal_index')]:
+            if isinstance(in_dict.get(k, None), np.ndarray):
+                old_indx = in_dict[k]
+                assert(old_indx.shape[0] == len(kws['surfaces']))
+                cls._add_padded_indices(
+                    [x['vertex_indices'] for x in kws['surfaces']],
+                    old_indx, ik)
+        return cls.from_dict_unvalidated(kws)
+
+    @classmethod
+    def _add_padded_indices(cls, elements, arr, key):
+        r"""Add indices from a 2D array padded by NaN to the entries for
+        each vertex in a set of elements.
+
+        Args:
+            elements (list): Lists of vertex entries for each element.
+            arr (np.ndarray): 2D array with indices for each vertex entry
+                in each element.
+            key (str): Key that indices should be added under.
+
+        """
+        rows, cols = np.nonzero(~np.isnan(arr))
+        values = list(arr[rows, cols].astype(np.int32))
+        for i, j, v in zip(rows.tolist(), cols.tolist(), values):
+            elements[i][j][key] = v
+
     def as_array_dict(self):
         r"""Get a version of the object as a dictionary of arrays."""
         out = {}
         if self.get('material', None):
             out['material'] = self['material']
         if self.get('vertices', None):
-            out['vertices'] = np.asarray(
-                [[v.get(k, np.NaN) for k in 'xyzw']
-                 for v in self['vertices']])
-            out['vertex_colors'] = np.asarray(
-                [[v.get(k, np.NaN) for k in ['red', 'green', 'blue']]
-                 for v in self['vertices']])
+            out['vertices'] = self.get_element_array(
+                'vertices', 'xyzw', default=np.NaN)
+            out['vertex_colors'] = self.get_element_array(
+                'vertices', ['red', 'green', 'blue'], default=np.NaN)
             if np.all(np.isnan(out['vertices'][:, 3])):
                 out['vertices'] = out['vertices'][:, :3]
             if np.all(np.isnan(out['vertex_colors'])):
                 out.pop('vertex_colors')
         if self.get('params', None):
-            out['params'] = np.asarray(
-                [[v.get(k, np.NaN) for k in 'uvw']
-                 for v in self['params']])
+            out['params'] = self.get_element_array(
+                'params', 'uvw', default=np.NaN)
             if np.all(np.isnan(out['params'][:, 2])):
                 out['params'] = out['params'][:, :2]
         if self.get('normals', None):
-            out['normals'] = np.asarray(
-                [[v[k] for k in 'ijk'] for v in self['normals']])
+            out['normals'] = self.get_element_array('normals', 'ijk')
         if self.get('texcoords', None):
-            out['texcoords'] = np.asarray(
-                [[v.get(k, np.NaN) for k in 'uvw']
-                 for v in self['texcoords']])
+            out['texcoords'] = self.get_element_array(
+                'texcoords', 'uvw', default=np.NaN)
             if np.all(np.isnan(out['texcoords'][:, 1:])):
                 out['texcoords'] = out['texcoords'][:, :1]
             elif np.all(np.isnan(out['texcoords'][:, 2])):
                 out['texcoords'] = out['texcoords'][:, :2]
         if self.get('lines', None):
-            out['lines'] = np.NaN * np.ones(
-                (len(self['lines']), len(max(self['lines'], key=len))),
-                dtype='int32')
-            for i, vlist in enumerate(self['lines']):
-                for j, v in enumerate(vlist):
-                    out['lines'][i, j] = v['vertex_index']
+            out['lines'] = _csr2padded(*self.get_face_indices('lines'))
         if self.get('faces', None):
-            face_shp = (len(self['faces']), len(max(self['faces'], key=len)))
-            out['faces'] = np.NaN * np.ones(face_shp, dtype='int32')
-            out['face_texcoords'] = np.NaN * np.ones(face_shp, dtype='int32')
-            out['face_normals'] = np.NaN * np.ones(face_shp, dtype='int32')
-            for i, vlist in enumerate(self['faces']):
-                for j, v in enumerate(vlist):
-                    out['faces'][i, j] = v['vertex_index']
-                    out['face_texcoords'][i, j] = v.get(
-                        'texcoord_index', np.NaN)
-                    out['face_normals'][i, j] = v.get('normal_index', np.NaN)
+            out['faces'] = _csr2padded(*self.get_face_indices())
+            out['face_texcoords'] = _csr2padded(*self.get_face_indices(
+                key='texcoord_index', default=np.NaN))
+            out['face_normals'] = _csr2padded(*self.get_face_indices(
+                key='normal_index', default=np.NaN))
             if np.all(np.isnan(out['face_texcoords'])):
                 out.pop('face_texcoords')
             if np.all(np.isnan(out['face_normals'])):
                 out.pop('face_normals')
-        if self.get('points', None):
-            out['points'] = np.NaN * np.ones(
-                (len(self['points']), len(max(self['points'], key=len))),
-                dtype='int32')
-            for i, vlist in enumerate(self['points']):
-                out['points'][i, :len(vlist)] = vlist
+        for k in ['points', 'curve2Ds']:
+            if self.get(k, None):
+                out[k] = _csr2padded(*_lists2csr(self[k], dtype='int64'))
         if self.get('curves', None):
-            def fkey(x):
-                return len(x['vertex_indices'])
-            out['curves'] = np.NaN * np.ones(
-                (len(self['curves']), len(max(self['curves'], key=fkey))),
-                dtype='int32')
-            out['curve_params'] = np.zeros((out['curves'].shape[0], 2))
-            for i, curv in enumerate(self['curves']):
-                out['curve_params'][i, :] = [curv['starting_param'],
-                                             curv['ending_param']]
-                out['curves'][i, :fkey(curv)] = curv['vertex_indices']
-        if self.get('curve2Ds', None):
-            out['curve2Ds'] = np.NaN * np.ones(
-                (len(self['curve2Ds']), len(max(self['curve2Ds'], key=len))),
-                dtype='int32')
-            for i, vlist in enumerate(self['curve2Ds']):
-                out['curve2Ds'][i, :len(vlist)] = vlist
+            out['curves'] = _csr2padded(*_lists2csr(
+                [x['vertex_indices'] for x in self['curves']],
+                dtype='int64'))
+            out['curve_params'] = self.get_element_array(
+                'curves', ['starting_param', 'ending_param'],
+                dtype='float64')
         if self.get('surfaces', None):
-            def fkey(x):
-                return len(x['vertex_indices'])
-            surf_shp = (len(self['surfaces']), len(max(self['surfaces'], key=fkey)))
-            out['surfaces'] = np.NaN * np.ones(surf_shp, dtype='int32')
-            out['surface_params'] = np.zeros((surf_shp[0], 4))
-            out['surface_texcoords'] = np.NaN * np.ones(surf_shp, dtype='int32')
-            out['surface_normals'] = np.NaN * np.ones(surf_shp, dtype='int32')
-            for i, surf in enumerate(self['surfaces']):
-                out['surface_params'][i, :] = [surf['starting_param_u'],
-                                               surf['ending_param_u'],
-                                               surf['starting_param_v'],
-                                               surf['ending_param_v']]
-                for j, v in enumerate(surf['vertex_indices']):
-                    out['surfaces'][i, j] = v['vertex_index']
-                    out['surface_texcoords'][i, j] = v.get(
-                        'texcoord_index', np.NaN)
-                    out['surface_normals'][i, j] = v.get(
-                        'normal_index', np.NaN)
+            out['surfaces'] = _csr2padded(*self.get_face_indices('surfaces'))
+            out['surface_params'] = self.get_element_array(
+                'surfaces', ['starting_param_u', 'ending_param_u',
+                             'starting_param_v', 'ending_param_v'],
+                dtype='float64')
+            out['surface_texcoords'] = _csr2padded(*self.get_face_indices(
+                'surfaces', key='texcoord_index', default=np.NaN))
+            out['surface_normals'] = _csr2padded(*self.get_face_indices(
+                'surfaces', key='normal_index', default=np.NaN))
             if np.all(np.isnan(out['surface_texcoords'])):
                 out.pop('surface_texcoords')
             if np.all(np.isnan(out['surface_normals'])):
                 out.pop('surface_normals')
         return out
-    
+
+    def get_face_indices(self, element='faces', key='vertex_index',
+                         default=None):
+        r"""Get the indices for every face in compressed sparse row (CSR)
+        format.
+
+        Args:
+            element (str, optional): Name of the element containing indices.
+                Defaults to 'faces'.
+            key (str, optional): Name of the index property. Defaults to
+                'vertex_index'.
+            default (object, optional): Value that should be used for missing
+                indices. Defaults to None and an error will be raised if
+                an index is missing.
+
+        Returns:
+            tuple(np.ndarray, np.ndarray): Indices for all faces and offsets
+                such that the indices for the ith face are
+                indices[offsets[i]:offsets[i + 1]].
+
+        """
+        elements = self.get(element, [])
+        if element == 'surfaces':
+            elements = [x['vertex_indices'] for x in elements]
+        if default is None:
+            return _lists2csr([[v[key] for v in x] for x in elements],
+                              dtype='int64')
+        return _lists2csr([[v.get(key, default) for v in x]
+                          for x in elements], dtype='float64')
+
     @classmethod
     def from_trimesh(cls, in_mesh):
         r"""Get a version of the object from a trimesh class."""
@@ -504,26 +467,17 @@ class ObjDict(PlyDict):
     @property
     def mesh(self):
         r"""list: Vertices for each face in the structure."""
-        mesh = []
-        for f in self['faces']:
-            imesh = []
-            for v in f:
-                imesh.append([self['vertices'][v['vertex_index']][k]
-                              for k in ['x', 'y', 'z']])
-            mesh.append(imesh)
-        return mesh
+        verts = self.get_element_array('vertices', 'xyz')
+        indices, offsets = self.get_face_indices()
+        return _csr2lists(verts[indices].tolist(), offsets)
 
     @property
     def vertex_normals(self):
         mesh = None
         if 'normals' in self:
-            mesh = []
-            for f in self['faces']:
-                imesh = []
-                for v in f:
-                    imesh.append([self['normals'][v['normal_index']][k]
-                                  for k in ['i', 'j', 'k']])
-                mesh.append(imesh)
+            norms = self.get_element_array('normals', 'ijk')
+            indices, offsets = self.get_face_indices(key='normal_index')
+            mesh = _csr2lists(norms[indices].tolist(), offsets)
         return mesh
 
     @classmethod
@@ -695,35 +649,6 @@ class ObjDict(PlyDict):
         if material is not None:
             self['material'] = material
         return self
-
-    def apply_scalar_map(self, *args, **kwargs):
-        r"""Set the color of faces in a 3D object based on a scalar map.
-        This creates a copy unless no_copy is True.
-
-        Args:
-            scalar_arr (arr): Scalar values that should be mapped to colors
-                for each face.
-            color_map (str, optional): The name of the color map that should
-                be used. Defaults to 'plasma'.
-            vmin (float, optional): Value that should map to the minimum of the
-                colormap. Defaults to min(scalar_arr).
-            vmax (float, optional): Value that should map to the maximum of the
-                colormap. Defaults to max(scalar_arr).
-            scaling (str, optional): Scaling that should be used to map the scalar
-                array onto the colormap. Defaults to 'linear'.
-            scale_by_area (bool, optional): If True, the elements of the scalar
-                array will be multiplied by the area of the corresponding face.
-                If True, vmin and vmax should be in terms of the scaled array.
-                Defaults to False.
-            no_copy (bool, optional): If True, the returned object will not be a
-                copy. Defaults to False.
-
-        Returns:
-            dict: Obj with updated vertex colors.
-
-        """
-        kwargs['_as_obj'] = True
-        return super(ObjDict, self).apply_scalar_map(*args, **kwargs)
     
 
 if trimesh:
@@ -1,5 +1,7 @@
 import os
 import copy
+import itertools
+import operator
 import warnings
 import numpy as np
 from yggdrasil import tools
@@ -191,6 +193,78 @@ def translate_ply2py(type_ply):
     return np.dtype(_map_ply2py[type_ply]).type
 
 
+def translate_plyformat2byteorder(plyformat):
+    r"""Get the byte order character used by numpy for the provided Ply
+    format string.
+
+    Args:
+        plyformat (str): Ply format string (e.g. 'binary_little_endian 1.0').
+
+    Returns:
+        str: Numpy byte order character ('<' or '>') for binary formats or
+            None for ASCII formats.
+
+    Raises:
+        ValueError: If the format is not supported.
+
+    """
+    fmt = plyformat.split()[0]
+    if fmt == 'ascii':
+        return None
+    elif fmt == 'binary_little_endian':
+        return '<'
+    elif fmt == 'binary_big_endian':
+        return '>'
+    raise ValueError("Unsupported ply format '%s'." % plyformat)
+
+
+def translate_ply2dtype(type_ply, byteorder='='):
+    r"""Get the numpy data type for the Ply type string.
+
+    Args:
+        type_ply (str): Ply type string.
+        byteorder (str, optional): Numpy byte order character. Defaults to
+            '=' (native).
+
+    Returns:
+        np.dtype: Numpy data type.
+
+    Raises:
+        ValueError: If the type string does not have a match.
+
+    """
+    return np.dtype(translate_ply2py(type_ply)).newbyteorder(byteorder)
+
+
+def get_element_dtype(props, type_map, counts, byteorder='='):
+    r"""Get the structured data type for records describing a Ply element
+    with fixed length list properties.
+
+    Args:
+        props (list): Property names in the order they are stored.
+        type_map (dict): Ply type strings for each property.
+        counts (dict): Number of entries in each list property.
+        byteorder (str, optional): Numpy byte order character. Defaults to
+            '=' (native).
+
+    Returns:
+        np.dtype: Structured data type. List properties are stored as a
+            count field named '<property>_count' followed by a sub-array.
+
+    """
+    fields = []
+    for p in props:
+        vars = type_map[p].split()
+        if vars[0] == 'list':
+            fields.append((p + '_count',
+                           translate_ply2dtype(vars[1], byteorder)))
+            fields.append((p, translate_ply2dtype(vars[2], byteorder),
+                           (counts[p], )))
+        else:
+            fields.append((p, translate_ply2dtype(vars[0], byteorder)))
+    return np.dtype(fields)
+
+
 def translate_py2ply(py_obj):
     r"""Get the correpsonding Ply type string for the provided Python object.
 
@@ -257,8 +331,142 @@ def plural2singular(e_plur):
     return e_sing
 
 
+def _lists2csr(lists, dtype=None):
+    r"""Convert a list of variable length lists into a flattened array and
+    offsets in the style of a compressed sparse row (CSR) matrix.
+
+    Args:
+        lists (list): Variable length lists of values.
+        dtype (np.dtype, optional): Data type of the returned values.
+            Defaults to None and is determined from the values.
+
+    Returns:
+        tuple(np.ndarray, np.ndarray): Flattened values and offsets such that
+            the values for the ith list are values[offsets[i]:offsets[i + 1]].
+
+    """
+    counts = np.fromiter((len(x) for x in lists), 'int64', len(lists))
+    offsets = np.zeros(len(lists) + 1, 'int64')
+    np.cumsum(counts, out=offsets[1:])
+    flat = itertools.chain.from_iterable(lists)
+    if dtype is None:
+        values = np.asarray(list(flat))
+    else:
+        values = np.fromiter(flat, dtype, int(offsets[-1]))
+    return values, offsets
+
+
+def _csr2lists(values, offsets):
+    r"""Convert a flattened array and offsets into a list of lists.
+
+    Args:
+        values (np.ndarray): Flattened values.
+        offsets (np.ndarray): Offsets of each list in values.
+
+    Returns:
+        list: Lists of values as numpy scalars.
+
+    """
+    values = list(values)
+    offsets = offsets.tolist()
+    return [values[i:j] for i, j in zip(offsets[:-1], offsets[1:])]
+
+
+def _padded2csr(arr):
+    r"""Convert a 2D array with rows padded by NaN into a flattened array and
+    offsets.
+
+    Args:
+        arr (np.ndarray): 2D array with missing values marked by NaN.
+
+    Returns:
+        tuple(np.ndarray, np.ndarray): Flattened values and offsets.
+
+    """
+    mask = ~np.isnan(arr)
+    offsets = np.zeros(arr.shape[0] + 1, 'int64')
+    np.cumsum(mask.sum(axis=1), out=offsets[1:])
+    return arr[mask], offsets
+
+
+def _csr2padded(values, offsets):
+    r"""Convert a flattened array and offsets into a 2D floating point array
+    with rows padded by NaN.
+
+    Args:
+        values (np.ndarray): Flattened values.
+        offsets (np.ndarray): Offsets of each row in values.
+
+    Returns:
+        np.ndarray: 2D array with missing values marked by NaN.
+
+    """
+    counts = np.diff(offsets)
+    ncol = int(counts.max()) if len(counts) else 0
+    out = np.NaN * np.ones((len(counts), ncol), dtype='float64')
+    rows = np.repeat(np.arange(len(counts)), counts)
+    cols = np.arange(len(values)) - np.repeat(offsets[:-1], counts)
+    out[rows, cols] = values
+    return out
+
+
+def _array2dicts(arr, keys, nrequired=None):
+    r"""Convert the rows of a 2D array into dictionaries.
+
+    Args:
+        arr (np.ndarray): 2D array with one column for each key.
+        keys (list): Keys for each column.
+        nrequired (int, optional): Number of leading columns that are always
+            included. Values that are NaN in the remaining columns are
+            excluded from the dictionaries. Defaults to len(keys).
+
+    Returns:
+        list: Dictionaries for each row with values as numpy scalars.
+
+    """
+    keys = list(keys)
+    if nrequired is None:
+        nrequired = len(keys)
+    out = [dict(zip(keys, row)) for row in
+           zip(*[list(arr[:, j]) for j in range(len(keys))])]
+    for j in range(nrequired, len(keys)):
+        for i in np.flatnonzero(np.isnan(arr[:, j])).tolist():
+            del out[i][keys[j]]
+    return out
+
+
+def _add_array_columns(dicts, arr, keys, conv=None, skip_nan=True):
+    r"""Add the columns of a 2D array to existing dictionaries.
+
+    Args:
+        dicts (list): Dictionaries for each row of arr.
+        arr (np.ndarray): 2D array with one column for each key.
+        keys (list): Keys for each column.
+        conv (type, optional): Type that values should be converted to.
+            Defaults to None and values are not converted.
+        skip_nan (bool, optional): If True, values that are NaN are not
+            added. Defaults to True.
+
+    """
+    for j, k in enumerate(keys):
+        col = arr[:, j]
+        if skip_nan:
+            idx = np.flatnonzero(~np.isnan(col))
+            col = col[idx]
+        else:
+            idx = np.arange(len(col))
+        if conv is not None:
+            col = col.astype(conv)
+        for i, v in zip(idx.tolist(), list(col)):
+            dicts[i][k] = v
+
+
 class PlyDict(dict):
-    r"""Enhanced dictionary class for storing Ply information."""
+    r"""Enhanced dictionary class for storing Ply information. Elements
+    are stored as lists of dictionaries with one dictionary per element,
+    so memory use grows with the number of elements as it always has.
+    get_element_array and get_face_indices build arrays from these lists
+    on each call."""
 
     def __init__(self, *args, **kwargs):
         super(PlyDict, self).__init__(*args, **kwargs)
@@ -275,6 +483,25 @@ class PlyDict(dict):
         out = cls(**in_dict)
         return out
 
+    @classmethod
+    def from_dict_unvalidated(cls, in_dict):
+        r"""Get a version of the object from a dictionary without validating
+        each element. This should only be used for dictionaries that were
+        constructed from arrays so that the type of each element is known.
+
+        Args:
+            in_dict (dict): Dictionary of elements.
+
+        Returns:
+            PlyDict: New object containing the elements.
+
+        """
+        out = cls.__new__(cls)
+        dict.__init__(out, **in_dict)
+        out.setdefault('vertices', [])
+        out.setdefault('faces', [])
+        return out
+
     def as_dict(self):
         r"""Get a version of the object as a pure dictionary."""
         out = dict(**self)
@@ -290,90 +517,127 @@ class PlyDict(dict):
         if isinstance(kws.get('vertices', None), np.ndarray):
             old_vert = kws.pop('vertices')
             assert(old_vert.shape[1] == 3)
-            kws['vertices'] = [
-                {k: old_vert[i, j] for j, k in enumerate('xyz')}
-                for i in range(old_vert.shape[0])]
+            kws['vertices'] = _array2dicts(old_vert, 'xyz')
         if isinstance(in_dict.get('vertex_colors', None), np.ndarray):
             old_colr = in_dict['vertex_colors']
             assert(old_colr.shape == (len(kws['vertices']), 3))
-            for i in range(old_colr.shape[0]):
-                for j, k in enumerate(['red', 'green', 'blue']):
-                    if not np.isnan(old_colr[i, j]):
-                        kws['vertices'][i][k] = np.int32(old_colr[i, j])
+            _add_array_columns(kws['vertices'], old_colr,
+                               ['red', 'green', 'blue'], conv=np.int32)
         if isinstance(kws.get('edges', None), np.ndarray):
             old_edge = kws.pop('edges')
             assert(old_edge.shape[1] == 2)
-            kws['edges'] = [
-                {k: np.int32(old_edge[i, j]) for j, k
-                 in enumerate(['vertex1', 'vertex2'])}
-                for i in range(old_edge.shape[0])]
+            kws['edges'] = _array2dicts(old_edge.astype(np.int32),
+                                        ['vertex1', 'vertex2'])
         if isinstance(in_dict.get('edge_colors', None), np.ndarray):
             old_colr = in_dict['edge_colors']
             assert(old_colr.shape == (len(kws['edges']), 3))
-            for i in range(old_colr.shape[0]):
-                for j, k in enumerate(['red', 'green', 'blue']):
-                    if not np.isnan(old_colr[i, j]):
-                        kws['edges'][i][k] = np.int32(old_colr[i, j])
+            _add_array_columns(kws['edges'], old_colr,
+                               ['red', 'green', 'blue'], conv=np.int32)
         if isinstance(kws.get('faces', None), np.ndarray):
             old_face = kws.pop('faces')
             assert(old_face.shape[1] >= 3)
-            kws['faces'] = [
-                {'vertex_index': [
-                    np.int32(old_face[i, j]) for j
-                    in range(old_face.shape[1])
-                    if (not np.isnan(old_face[i, j]))]}
-                for i in range(old_face.shape[0])]
+            values, offsets = _padded2csr(old_face)
+            kws['faces'] = [{'vertex_index': x} for x in
+                            _csr2lists(values.astype(np.int32), offsets)]
         if isinstance(in_dict.get('face_colors', None), np.ndarray):
             old_colr = in_dict['face_colors']
             assert(old_colr.shape == (len(kws['faces']), 3))
-            for i in range(old_colr.shape[0]):
-                for j, k in enumerate(['red', 'green', 'blue']):
-                    if not np.isnan(old_colr[i, j]):
-                        kws['faces'][i][k] = np.int32(old_colr[i, j])
-        return cls.from_dict(kws)
+            _add_array_columns(kws['faces'], old_colr,
+                               ['red', 'green', 'blue'], conv=np.int32)
+        return cls.from_dict_unvalidated(kws)
 
     def as_array_dict(self):
         r"""Get a version of the object as a dictionary of arrays."""
         out = {}
+        rgb = ['red', 'green', 'blue']
         if self.get('material', None):
             out['material'] = self['material']
         if self.get('vertices', None):
-            out['vertices'] = np.asarray(
-                [[v[k] for k in 'xyz'] for v in self['vertices']])
-            out['vertex_colors'] = np.NaN * np.ones(out['vertices'].shape,
-                                                    dtype='int32')
-            for i, v in enumerate(self['vertices']):
-                for j, k in enumerate(['red', 'green', 'blue']):
-                    out['vertex_colors'][i, j] = v.get(k, np.NaN)
+            out['vertices'] = self.get_element_array('vertices', 'xyz')
+            out['vertex_colors'] = self.get_element_array(
+                'vertices', rgb, default=np.NaN)
             if np.all(np.isnan(out['vertex_colors'])):
                 out.pop('vertex_colors')
         if self.get('faces', None):
-            def fkey(x):
-                return len(x['vertex_index'])
-            face_shp = (len(self['faces']),
-                        len(max(self['faces'], key=fkey)['vertex_index']))
-            out['faces'] = np.NaN * np.ones(face_shp, dtype='int32')
-            out['face_colors'] = np.NaN * np.ones(
-                (face_shp[0], 3), dtype='int32')
-            for i, f in enumerate(self['faces']):
-                out['faces'][i, :fkey(f)] = f['vertex_index']
-                for j, k in enumerate(['red', 'green', 'blue']):
-                    out['face_colors'][i, j] = f.get(k, np.NaN)
+            out['faces'] = _csr2padded(*self.get_face_indices())
+            out['face_colors'] = self.get_element_array(
+                'faces', rgb, default=np.NaN)
             if np.all(np.isnan(out['face_colors'])):
                 out.pop('face_colors')
         if self.get('edges', None):
-            out['edges'] = np.asarray(
-                [[v[k] for k in ['vertex1', 'vertex2']]
-                 for v in self['edges']])
-            out['edge_colors'] = np.NaN * np.ones(
-                (out['edges'].shape[0], 3), dtype='int32')
-            for i, f in enumerate(self['edges']):
-                for j, k in enumerate(['red', 'green', 'blue']):
-                    out['edge_colors'][i, j] = f.get(k, np.NaN)
+            out['edges'] = self.get_element_array(
+                'edges', ['vertex1', 'vertex2'])
+            out['edge_colors'] = self.get_element_array(
+                'edges', rgb, default=np.NaN)
             if np.all(np.isnan(out['edge_colors'])):
                 out.pop('edge_colors')
         return out
 
+    def get_element_array(self, element, keys, default=None, dtype=None):
+        r"""Get the values of properties for every instance of an element
+        as a 2D array.
+
+        Args:
+            element (str): Name of the element to get values for.
+            keys (list): Properties that should be included as columns.
+            default (object, optional): Value that should be used for
+                missing properties. Defaults to None and an error will be
+                raised if a property is missing.
+            dtype (np.dtype, optional): Data type of the returned array.
+                Defaults to 'float64' if default is provided and the type of
+                the first element otherwise.
+
+        Returns:
+            np.ndarray: Array with a row for each instance of the element
+                and a column for each property.
+
+        """
+        keys = list(keys)
+        elements = self.get(element, [])
+        if default is None:
+            rows = map(operator.itemgetter(*keys), elements)
+            if len(keys) == 1:
+                rows = ((x, ) for x in rows)
+        else:
+            rows = (tuple(x.get(k, default) for k in keys)
+                    for x in elements)
+            if dtype is None:
+                dtype = 'float64'
+        if dtype is None:
+            if not elements:
+                dtype = 'float64'
+            else:
+                dtype = np.asarray([elements[0][k] for k in keys]).dtype
+        out = np.fromiter(itertools.chain.from_iterable(rows), dtype,
+                          len(elements) * len(keys))
+        return out.reshape((len(elements), len(keys)))
+
+    def get_face_indices(self, element='faces', key='vertex_index',
+                         default=None):
+        r"""Get the indices for every face in compressed sparse row (CSR)
+        format.
+
+        Args:
+            element (str, optional): Name of the element containing indices.
+                Defaults to 'faces'.
+            key (str, optional): Name of the index property. Defaults to
+                'vertex_index'.
+            default (object, optional): Value that should be used for missing
+                indices. Defaults to None and an error will be raised if
+                an index is missing.
+
+        Returns:
+            tuple(np.ndarray, np.ndarray): Indices for all faces and offsets
+                such that the indices for the ith face are
+                indices[offsets[i]:offsets[i + 1]].
+
+        """
+        dtype = 'int64'
+        if default is not None:
+            dtype = 'float64'
+        return _lists2csr([x[key] for x in self.get(element, [])],
+                          dtype=dtype)
+
     @classmethod
     def from_trimesh(cls, in_mesh):
         r"""Get a version of the object from a trimesh class."""
@@ -422,24 +686,15 @@ class PlyDict(dict):
     @property
     def bounds(self):
         r"""tuple: Mins/maxs of vertices in each dimension."""
-        mins = np.empty(3, 'float64')
-        maxs = np.empty(3, 'float64')
-        for i, x in enumerate('xyz'):
-            mins[i] = min([v[x] for v in self['vertices']])
-            maxs[i] = max([v[x] for v in self['vertices']])
-        return mins, maxs
+        verts = self.get_element_array('vertices', 'xyz', dtype='float64')
+        return verts.min(axis=0), verts.max(axis=0)
 
     @property
     def mesh(self):
         r"""list: Vertices for each face in the structure."""
-        mesh = []
-        for i in range(self.count_elements('faces')):
-            imesh = []
-            for f in self['faces']:
-                for v in f['vertex_index']:
-                    imesh += [self['vertices'][v][k] for k in ['x', 'y', 'z']]
-            mesh.append(imesh)
-        return mesh
+        verts = self.get_element_array('vertices', 'xyz')
+        indices, offsets = self.get_face_indices()
+        return _csr2lists(verts[indices].reshape((-1, )), 3 * offsets)
 
     @classmethod
     def from_shape(cls, shape, d, conversion=1.0, _as_obj=False):  # pragma: lpy
@@ -648,7 +903,7 @@ class PlyDict(dict):
 
     def apply_scalar_map(self, scalar_arr, color_map=None,
                          vmin=None, vmax=None, scaling='linear',
-                         scale_by_area=False, no_copy=False, _as_obj=False):
+                         scale_by_area=False, no_copy=False):
         r"""Set the color of faces in a 3D object based on a scalar map.
         This creates a copy unless no_copy is True.
 
@@ -676,42 +931,32 @@ class PlyDict(dict):
         """
         from matplotlib import cm
         from matplotlib import colors as mpl_colors
+        scalar_arr = np.array(scalar_arr)
+        indices, offsets = self.get_face_indices()
+        counts = np.diff(offsets)
         # Scale by area
         if scale_by_area:
-            scalar_arr = copy.deepcopy(scalar_arr)
-            for i, f in enumerate(self['faces']):
-                if _as_obj:
-                    fv = [_f['vertex_index'] for _f in f]
-                else:
-                    fv = f['vertex_index']
-                if len(fv) > 3:
-                    raise NotImplementedError("Area calc not implemented "
-                                              + "for faces above triangle.")
-                v0 = np.array([self['vertices'][fv[0]][k] for k in 'xyz'])
-                v1 = np.array([self['vertices'][fv[1]][k] for k in 'xyz'])
-                v2 = np.array([self['vertices'][fv[2]][k] for k in 'xyz'])
-                a = np.sqrt(np.sum((v0 - v1)**2))
-                b = np.sqrt(np.sum((v1 - v2)**2))
-                c = np.sqrt(np.sum((v2 - v0)**2))
-                s = (a + b + c) / 2.0
-                area = np.sqrt(s * (s - a) * (s - b) * (s - c))
-                scalar_arr[i] = area * scalar_arr[i]
+            if np.any(counts > 3):
+                raise NotImplementedError("Area calc not implemented "
+                                          + "for faces above triangle.")
+            verts = self.get_element_array('vertices', 'xyz')
+            tri = verts[indices.reshape((-1, 3))]
+            a = np.sqrt(np.sum((tri[:, 0] - tri[:, 1])**2, axis=1))
+            b = np.sqrt(np.sum((tri[:, 1] - tri[:, 2])**2, axis=1))
+            c = np.sqrt(np.sum((tri[:, 2] - tri[:, 0])**2, axis=1))
+            s = (a + b + c) / 2.0
+            area = np.sqrt(s * (s - a) * (s - b) * (s - c))
+            scalar_arr = area * scalar_arr[:len(area)]
         # Map vertices onto faces
-        vertex_scalar = [[] for x in self['vertices']]
-        if _as_obj:
-            for i in range(len(self['faces'])):
-                for v in self['faces'][i]:
-                    vertex_scalar[v['vertex_index']].append(scalar_arr[i])
-        else:
-            for i in range(len(self['faces'])):
-                for v in self['faces'][i]['vertex_index']:
-                    vertex_scalar[v].append(scalar_arr[i])
-        for i in range(len(vertex_scalar)):
-            if len(vertex_scalar[i]) == 0:
-                vertex_scalar[i] = 0
-            else:
-                vertex_scalar[i] = np.mean(vertex_scalar[i])
-        vertex_scalar = np.array(vertex_scalar)
+        nvert = len(self['vertices'])
+        vertex_total = np.bincount(
+            indices, weights=np.repeat(scalar_arr[:len(counts)], counts),
+            minlength=nvert)
+        vertex_count = np.bincount(indices, minlength=nvert)
+        vertex_scalar = np.zeros(nvert, 'float64')
+        has_faces = (vertex_count > 0)
+        vertex_scalar[has_faces] = (vertex_total[has_faces]
+                                    / vertex_count[has_faces])
         if scaling == 'log':
             vertex_scalar = np.ma.MaskedArray(vertex_scalar, vertex_scalar <= 0)
         # Get color scaling
@@ -736,9 +981,8 @@ class PlyDict(dict):
             out = self
         else:
             out = copy.deepcopy(self)
-        for i, c in enumerate(vertex_colors):
-            for j, k in enumerate(['red', 'green', 'blue']):
-                out['vertices'][i][k] = c[j]
+        for v, c in zip(out['vertices'], vertex_colors):
+            v.update(zip(['red', 'green', 'blue'], c))
         return out
 
 
@@ -867,6 +1111,15 @@ class PlyMetaschemaType(JSONObjectMetaschemaType):
                         header.append('property %s %s' % (type_map[e][p], p))
         header.append('end_header')
         # Encode body
+        byteorder = translate_plyformat2byteorder(plyformat)
+        if byteorder is not None:
+            body = [newline.join(header + ['']).encode('utf-8')]
+            for e in element_order:
+                if (e not in obj) or (e == 'material') or (size_map[e] == 0):
+                    continue
+                body.append(cls._encode_element_binary(
+                    obj[e], property_order[e], type_map[e], byteorder))
+            return b''.join(body)
         body = []
         for e in element_order:
             if (e not in obj) or (e == 'material'):
@@ -889,6 +1142,50 @@ class PlyMetaschemaType(JSONObjectMetaschemaType):
                         iline += translate_ply2fmt(type_map[e][p]) % x[p]
                 body.append(iline.strip())  # Ensure trailing spaces are removed
         return newline.join(header + body) + newline
+
+    @classmethod
+    def _encode_element_binary(cls, rows, props, type_map, byteorder):
+        r"""Encode the entries for an element in binary.
+
+        Args:
+            rows (list): Dictionaries for each entry in the element.
+            props (list): Properties in the order they should be written.
+            type_map (dict): Ply type strings for each property.
+            byteorder (str): Numpy byte order character.
+
+        Returns:
+            bytes: Encoded element.
+
+        """
+        list_props = [p for p in props if type_map[p].startswith('list')]
+        counts = {p: len(rows[0][p]) for p in list_props}
+        if all(len(x[p]) == counts[p] for p in list_props for x in rows):
+            dtype = get_element_dtype(props, type_map, counts, byteorder)
+            arr = np.empty(len(rows), dtype=dtype)
+            for p in props:
+                if p in counts:
+                    arr[p + '_count'] = counts[p]
+                    if counts[p] == 0:
+                        continue
+                arr[p] = [x[p] for x in rows]
+            return arr.tobytes()
+        # Variable length lists must be written one entry at a time
+        out = []
+        for x in rows:
+            for p in props:
+                vars = type_map[p].split()
+                if vars[0] == 'list':
+                    out.append(np.array(
+                        len(x[p]),
+                        dtype=translate_ply2dtype(vars[1], byteorder)).tobytes())
+                    out.append(np.array(
+                        x[p],
+                        dtype=translate_ply2dtype(vars[2], byteorder)).tobytes())
+                else:
+                    out.append(np.array(
+                        x[p],
+                        dtype=translate_ply2dtype(vars[0], byteorder)).tobytes())
+        return b''.join(out)
         
     @classmethod
     def encode_data_readable(cls, obj, typedef):
@@ -910,7 +1207,8 @@ class PlyMetaschemaType(JSONObjectMetaschemaType):
         r"""Decode an object.
 
         Args:
-            msg (string): Encoded object to decode.
+            msg (string): Encoded object to decode. The body may be ASCII or
+                binary as indicated by the format line in the header.
             typedef (dict): Type definition that should be used to decode the
                 object.
 
@@ -918,10 +1216,15 @@ class PlyMetaschemaType(JSONObjectMetaschemaType):
             object: Decoded object.
 
         """
-        msg = tools.bytes2str(msg)
-        lines = msg.splitlines()
+        msg = tools.str2bytes(msg)
+        iend = msg.find(b'end_header')
+        if iend < 0:
+            iend = len(msg)
+        ibody = msg.find(b'\n', iend)
+        ibody = len(msg) if (ibody < 0) else (ibody + 1)
+        lines = tools.bytes2str(msg[:iend]).splitlines()
         metadata = {'comments': [], 'element_order': [], 'property_order': {}}
-        if lines[0] != 'ply':
+        if (not lines) or (lines[0].strip() != 'ply'):
             raise ValueError("The first line must be 'ply'")
         # Parse header
         e = None
@@ -929,7 +1232,7 @@ class PlyMetaschemaType(JSONObjectMetaschemaType):
         type_map = {}
         size_map = {}
         obj = {}
-        for i, line in enumerate(lines):
+        for line in lines:
             if line.startswith('format'):
                 metadata['plyformat'] = line.split(None, 1)[-1]
             elif line.startswith('comment'):
@@ -952,45 +1255,179 @@ class PlyMetaschemaType(JSONObjectMetaschemaType):
                 p = vars[-1]
                 type_map[e][p] = ' '.join(vars[1:-1])
                 metadata['property_order'][e].append(p)
-            elif 'end_header' in line:
-                headline = i + 1
-                break
         # Parse body
-        i = headline
+        byteorder = translate_plyformat2byteorder(
+            metadata.get('plyformat', 'ascii 1.0'))
+        if byteorder is None:
+            body = tools.bytes2str(msg[ibody:]).splitlines()
+        else:
+            body = msg
+        i = ibody if byteorder else 0
         for e in metadata['element_order']:
             if e == 'material':
                 continue
-            for ie in range(size_map[e]):
-                vars = lines[i].split()
-                iv = 0
-                new = {}
-                for p in metadata['property_order'][e]:
-                    if type_map[e][p].startswith('list'):
-                        type_vars = type_map[e][p].split()
-                        count_type = translate_ply2py(type_vars[1])
-                        plist_type = translate_ply2py(type_vars[2])
-                        count = count_type(vars[iv])
-                        plist = []
-                        iv += 1
-                        for ip in range(count):
-                            plist.append(plist_type(vars[iv]))
-                            iv += 1
-                        new[p] = plist
-                    else:
-                        prop_type = translate_ply2py(type_map[e][p])
-                        new[p] = prop_type(vars[iv])
-                        iv += 1
-                assert(iv == len(vars))
-                obj[e].append(new)
-                i += 1
+            if byteorder is None:
+                obj[e] = cls._decode_element_ascii(
+                    body[i:(i + size_map[e])],
+                    metadata['property_order'][e], type_map[e])
+                i += size_map[e]
+            else:
+                obj[e], i = cls._decode_element_binary(
+                    body, i, size_map[e], metadata['property_order'][e],
+                    type_map[e], byteorder)
         # Check that all properties filled in
         for e in metadata['element_order']:
             if e not in metadata['property_order']:
                 continue
             for p in metadata['property_order'][e]:
                 assert(len(obj[e]) == size_map[e])
-        # Return
-        return PlyDict(obj)
+        # Return (types are set by the header so validation is unnecessary)
+        return PlyDict.from_dict_unvalidated(obj)
+
+    @classmethod
+    def _decode_element_ascii(cls, lines, props, type_map):
+        r"""Decode the entries for an element from ASCII lines. If all of
+        the lines have the same number of entries and list properties have
+        a fixed length, the lines are parsed as columns.
+
+        Args:
+            lines (list): Lines containing the entries for the element.
+            props (list): Properties in the order they are stored.
+            type_map (dict): Ply type strings for each property.
+
+        Returns:
+            list: Dictionaries for each entry in the element.
+
+        """
+        rows = [x.split() for x in lines]
+        if (len(rows) > 0) and all(len(x) == len(rows[0]) for x in rows):
+            arr = np.array(rows)
+            cols = []
+            iv = 0
+            for p in props:
+                if iv >= arr.shape[1]:
+                    break
+                vars = type_map[p].split()
+                if vars[0] == 'list':
+                    counts = arr[:, iv].astype(translate_ply2py(vars[1]))
+                    count = int(counts[0])
+                    iv += 1 + count
+                    if np.any(counts != count) or (iv > arr.shape[1]):
+                        break
+                    cols.append([list(x) for x in arr[:, (iv - count):iv].astype(
+                        translate_ply2py(vars[2]))])
+                else:
+                    cols.append(list(arr[:, iv].astype(
+                        translate_ply2py(vars[0]))))
+                    iv += 1
+            else:
+                if iv == arr.shape[1]:
+                    return [dict(zip(props, x)) for x in zip(*cols)]
+        # Lists of varying length must be parsed one line at a time
+        out = []
+        for x in rows:
+            iv = 0
+            new = {}
+            for p in props:
+                if type_map[p].startswith('list'):
+                    type_vars = type_map[p].split()
+                    count_type = translate_ply2py(type_vars[1])
+                    plist_type = translate_ply2py(type_vars[2])
+                    count = count_type(x[iv])
+                    plist = []
+                    iv += 1
+                    for ip in range(count):
+                        plist.append(plist_type(x[iv]))
+                        iv += 1
+                    new[p] = plist
+                else:
+                    prop_type = translate_ply2py(type_map[p])
+                    new[p] = prop_type(x[iv])
+                    iv += 1
+            assert(iv == len(x))
+            out.append(new)
+        return out
+
+    @classmethod
+    def _decode_element_binary(cls, msg, offset, nrows, props, type_map,
+                               byteorder):
+        r"""Decode the entries for an element from binary. The lengths of
+        list properties in the first entry are used to build a structured
+        data type for the element so that all entries can be read at once.
+        If any list in a subsequent entry has a different length, the
+        entries are read one at a time.
+
+        Args:
+            msg (bytes): Message containing the element.
+            offset (int): Position of the first entry in msg.
+            nrows (int): Number of entries in the element.
+            props (list): Properties in the order they are stored.
+            type_map (dict): Ply type strings for each property.
+            byteorder (str): Numpy byte order character.
+
+        Returns:
+            tuple(list, int): Dictionaries for each entry in the element and
+                the position in msg following the element.
+
+        Raises:
+            ValueError: If msg is too short to contain the element.
+
+        """
+        if nrows == 0:
+            return [], offset
+        counts = {}
+        pos = offset
+        try:
+            for p in props:
+                vars = type_map[p].split()
+                if vars[0] == 'list':
+                    count_type = translate_ply2dtype(vars[1], byteorder)
+                    counts[p] = int(np.frombuffer(msg, dtype=count_type,
+                                                  count=1, offset=pos)[0])
+                    pos += (count_type.itemsize + counts[p]
+                            * translate_ply2dtype(vars[2]).itemsize)
+                else:
+                    pos += translate_ply2dtype(vars[0]).itemsize
+        except ValueError:
+            raise ValueError("Message is too short to contain the element.")
+        dtype = get_element_dtype(props, type_map, counts, byteorder)
+        end = offset + nrows * dtype.itemsize
+        if end <= len(msg):
+            arr = np.frombuffer(msg, dtype=dtype, count=nrows, offset=offset)
+            if all(np.all(arr[p + '_count'] == counts[p]) for p in counts):
+                cols = []
+                for p in props:
+                    if p in counts:
+                        cols.append([list(x) for x in arr[p]])
+                    else:
+                        cols.append(list(arr[p]))
+                return [dict(zip(props, x)) for x in zip(*cols)], end
+        # Lists of varying length must be read one entry at a time
+        out = []
+        pos = offset
+        try:
+            for i in range(nrows):
+                new = {}
+                for p in props:
+                    vars = type_map[p].split()
+                    if vars[0] == 'list':
+                        count_type = translate_ply2dtype(vars[1], byteorder)
+                        plist_type = translate_ply2dtype(vars[2], byteorder)
+                        count = int(np.frombuffer(msg, dtype=count_type,
+                                                  count=1, offset=pos)[0])
+                        pos += count_type.itemsize
+                        new[p] = list(np.frombuffer(msg, dtype=plist_type,
+                                                    count=count, offset=pos))
+                        pos += count * plist_type.itemsize
+                    else:
+                        prop_type = translate_ply2dtype(vars[0], byteorder)
+                        new[p] = np.frombuffer(msg, dtype=prop_type,
+                                               count=1, offset=pos)[0]
+                        pos += prop_type.itemsize
+                out.append(new)
+        except ValueError:
+            raise ValueError("Message is too short to contain the element.")
+        return out, pos
 
     @classmethod
     def coerce_type(cls, obj, typedef=None, **kwargs):
@@ -3,6 +3,8 @@ import copy
 import warnings
 import base64
 from yggdrasil import units
+from yggdrasil.metaschema.datatypes import (
+    get_binary_payload, is_binary_reference)
 from yggdrasil.metaschema.datatypes.MetaschemaType import MetaschemaType
 from yggdrasil.metaschema.datatypes.FixedMetaschemaType import (
     create_fixed_type_class)
@@ -121,10 +123,14 @@ class ScalarMetaschemaType(MetaschemaType):
                 object.
 
         Returns:
-            string: Encoded object.
+            string, dict: Encoded object. If a binary payload is active, this
+                will be a reference to the array data in the payload.
 
         """
         arr = cls.to_array(obj)
+        payload = get_binary_payload()
+        if (payload is not None) and isinstance(typedef, dict) and arr.nbytes:
+            return payload.add(arr)
         out = base64.encodebytes(arr.tobytes()).decode('ascii')
         return out
 
@@ -174,17 +180,29 @@ class ScalarMetaschemaType(MetaschemaType):
         r"""Decode an object.
 
         Args:
-            obj (string): Encoded object to decode.
+            obj (string, dict): Encoded object to decode or a reference to
+                array data in the active binary payload.
             typedef (dict): Type definition that should be used to decode the
                 object.
 
         Returns:
             object: Decoded object.
 
+        Raises:
+            ValueError: If obj is a reference to binary data, but there is not
+                an active binary payload.
+
         """
-        bytes = base64.decodebytes(obj.encode('ascii'))
         dtype = ScalarMetaschemaProperties.definition2dtype(typedef)
-        arr = np.frombuffer(bytes, dtype=dtype)
+        if is_binary_reference(obj):
+            payload = get_binary_payload()
+            if payload is None:  # pragma: debug
+                raise ValueError("Reference to binary data, but there is not "
+                                 "an active binary payload.")
+            arr = payload.get(obj, dtype)
+        else:
+            bytes = base64.decodebytes(obj.encode('ascii'))
+            arr = np.frombuffer(bytes, dtype=dtype)
         # arr = np.fromstring(bytes, dtype=dtype)
         if 'shape' in typedef:
             arr = arr.reshape(typedef['shape'])
@@ -139,7 +139,7 @@ class SchemaMetaschemaType(JSONObjectMetaschemaType):
                                                          raise_errors=raise_errors):
             return False
         try:
-            x = copy.deepcopy(cls.metaschema())
+            x = cls.metaschema()
             x.setdefault('required', [])
             if 'type' not in x['required']:
                 x['required'].append('type')
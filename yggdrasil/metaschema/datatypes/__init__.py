@@ -2,6 +2,7 @@ import os
 import glob
 import jsonschema
 import copy
+import threading
 import numpy as np
 from yggdrasil.components import ClassRegistry
 from yggdrasil.metaschema.encoder import decode_json
@@ -14,6 +15,12 @@ _base_validator = jsonschema.validators._LATEST_VERSION
 YGG_MSG_HEAD = b'YGG_MSG_HEAD'
 _property_attributes = ['properties', 'definition_properties',
                         'metadata_properties', 'extract_properties']
+_type_dispatch_size = 256
+_type_dispatch = {}
+_type_specificity_order = None
+_int_dispatch_ranges = [(np.iinfo(np.int64).min, np.iinfo(np.int64).max),
+                        (0, np.iinfo(np.uint64).max)]
+_dispatch_python_types = (bool, float, complex, str, bytes, type(None))
 
 
 def import_schema_types():
@@ -46,6 +53,118 @@ class MetaschemaTypeError(TypeError):
 
 _default_typedef = {'type': 'bytes'}
 _type_registry = ClassRegistry(import_function=import_schema_types)
+_binary_payload = threading.local()
+
+
+class BinaryPayload(object):
+    r"""Context manager for array data that is sent as raw bytes after the
+    JSON encoded body of a message instead of base64 encoded within it.
+    While a payload is active, array types will add their data to the
+    payload during encoding and replace it with a reference of the form
+    {'$binary': [offset, nbytes]} in the JSON body. During decoding,
+    references are resolved against the payload buffer without copying.
+
+    Args:
+        buffer (bytes, memoryview, optional): Raw bytes following the JSON
+            body of a received message. Defaults to None and array data
+            will be collected from the message being encoded.
+        enabled (bool, optional): If False, entering the context suspends
+            any payload that is already active so that array data is
+            base64 encoded. Defaults to True.
+
+    Attributes:
+        chunks (list): Array data (and alignment padding) collected
+            during encoding.
+        nbytes (int): Total size of the collected data in bytes.
+
+    """
+
+    alignment = 8
+
+    def __init__(self, buffer=None, enabled=True):
+        self.buffer = buffer
+        self.enabled = enabled
+        self.chunks = []
+        self.nbytes = 0
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = getattr(_binary_payload, 'active', None)
+        if self.enabled:
+            _binary_payload.active = self
+        else:
+            _binary_payload.active = None
+        return self
+
+    def __exit__(self, *args):
+        _binary_payload.active = self._previous
+        self._previous = None
+
+    def add(self, arr):
+        r"""Add array data to the payload.
+
+        Args:
+            arr (np.ndarray): Array containing data to add.
+
+        Returns:
+            dict: Reference to the data that should be placed in the JSON
+                body in place of the encoded data.
+
+        """
+        arr = np.ascontiguousarray(arr).reshape(-1)
+        ref = {'$binary': [self.nbytes, arr.nbytes]}
+        self.chunks.append(arr.view(np.uint8))
+        self.nbytes += arr.nbytes
+        pad = (-self.nbytes) % self.alignment
+        if pad:
+            self.chunks.append(pad * b'\x00')
+            self.nbytes += pad
+        return ref
+
+    def get(self, ref, dtype):
+        r"""Get an array from the payload buffer.
+
+        Args:
+            ref (dict): Reference returned by add when the array was encoded.
+            dtype (np.dtype): Data type of the array.
+
+        Returns:
+            np.ndarray: Read-only 1D array backed by the payload buffer.
+
+        Raises:
+            ValueError: If the payload does not have a buffer.
+
+        """
+        if self.buffer is None:  # pragma: debug
+            raise ValueError("Binary payload does not have a buffer.")
+        offset, nbytes = ref['$binary']
+        dtype = np.dtype(dtype)
+        return np.frombuffer(self.buffer, dtype=dtype,
+                             count=nbytes // dtype.itemsize, offset=offset)
+
+
+def get_binary_payload():
+    r"""Get the binary payload that is active in the current thread.
+
+    Returns:
+        BinaryPayload: Active payload or None if there is not one.
+
+    """
+    return getattr(_binary_payload, 'active', None)
+
+
+def is_binary_reference(obj):
+    r"""Determine if an encoded object is a reference to data in a binary
+    payload.
+
+    Args:
+        obj (object): Encoded object.
+
+    Returns:
+        bool: True if obj is a binary payload reference, False otherwise.
+
+    """
+    return isinstance(obj, dict) and (list(obj.keys()) == ['$binary'])
 
 
 def is_default_typedef(typedef):
@@ -109,6 +228,7 @@ def register_type(type_class):
     # from yggdrasil.schema import register_component
     # register_component(type_class)
     _type_registry[type_name] = type_class
+    clear_type_dispatch()
     return type_class
 
 
@@ -225,6 +345,90 @@ def get_registered_types():
     return _type_registry
 
 
+def _specificity_sort_key(item):
+    return -item[1].specificity
+
+
+def get_types_by_specificity():
+    r"""Get the registered types sorted from most to least specific. The
+    order is computed once and then cached until another type is registered.
+
+    Returns:
+        list: Registered type name/class pairs.
+
+    """
+    global _type_specificity_order
+    if _type_specificity_order is None:
+        out = sorted(_type_registry.items(), key=_specificity_sort_key)
+        _type_specificity_order = out
+    return _type_specificity_order
+
+
+def get_type_dispatch_key(obj):
+    r"""Get the key used to look up the type of an object in the type
+    dispatch table. Keys are only returned for objects whose type can be
+    determined without inspecting their values (Python scalars and numpy
+    scalars/arrays, including those with units).
+
+    Args:
+        obj (object): Object to get the key for.
+
+    Returns:
+        tuple: Python type, followed by the data type and number of dimensions
+            for numpy objects or the index of the first 64 bit integer range
+            (signed, unsigned) that contains the value of Python integers.
+            None is returned if the type of the object cannot be determined
+            from the key.
+
+    """
+    obj_type = type(obj)
+    if obj_type in _dispatch_python_types:
+        return (obj_type, )
+    if obj_type is int:
+        for i, (imin, imax) in enumerate(_int_dispatch_ranges):
+            if imin <= obj <= imax:
+                return (obj_type, i)
+        return (obj_type, len(_int_dispatch_ranges))
+    if isinstance(obj, (np.ndarray, np.generic)) and not obj.dtype.hasobject:
+        return (obj_type, obj.dtype, obj.ndim)
+    return None
+
+
+def get_dispatch_type(key):
+    r"""Get the type name recorded in the type dispatch table for a key.
+
+    Args:
+        key (tuple): Key returned by get_type_dispatch_key.
+
+    Returns:
+        str: Name of the type, None if the key has not been recorded.
+
+    """
+    return _type_dispatch.get(key, None)
+
+
+def set_dispatch_type(key, type_name):
+    r"""Record the type name for a key in the type dispatch table. The table
+    is cleared if it grows larger than _type_dispatch_size entries.
+
+    Args:
+        key (tuple): Key returned by get_type_dispatch_key.
+        type_name (str): Name of the type that objects with the key have.
+
+    """
+    if len(_type_dispatch) >= _type_dispatch_size:
+        _type_dispatch.clear()
+    _type_dispatch[key] = type_name
+
+
+def clear_type_dispatch():
+    r"""Clear the type dispatch table and the cached specificity order so
+    that they will be recomputed to include newly registered types."""
+    global _type_specificity_order
+    _type_dispatch.clear()
+    _type_specificity_order = None
+
+
 def complete_typedef(typedef):
     r"""Complete the type definition by converting it into the standard format.
 
@@ -1,3 +1,4 @@
+import numpy as np
 from yggdrasil.tests import assert_raises, assert_equal
 from yggdrasil.metaschema import datatypes
 from yggdrasil.metaschema.tests import _valid_objects
@@ -105,3 +106,25 @@ def test_compare_schema():
     for x in invalid:
         errors = list(datatypes.compare_schema(*x))
         assert(errors)
+
+
+def test_type_dispatch():
+    r"""Test the type dispatch table used by guess_type_from_obj."""
+    datatypes.clear_type_dispatch()
+    order = datatypes.get_types_by_specificity()
+    assert(datatypes.get_types_by_specificity() is order)
+    specificity = [v.specificity for k, v in order]
+    assert_equal(specificity, sorted(specificity, reverse=True))
+    assert(datatypes.get_type_dispatch_key({'a': 1}) is None)
+    assert(datatypes.get_type_dispatch_key(np.zeros(3, dtype=object)) is None)
+    for t, x in [('float', np.float32(1)), ('1darray', np.zeros(3)),
+                 ('ndarray', np.zeros((3, 2))), ('int', 1),
+                 ('scalar', 2**63), ('integer', 2**64), ('unicode', 'a')]:
+        key = datatypes.get_type_dispatch_key(x)
+        assert(key is not None)
+        assert(datatypes.get_dispatch_type(key) is None)
+        assert_equal(datatypes.guess_type_from_obj(x).name, t)
+        assert_equal(datatypes.get_dispatch_type(key), t)
+        assert_equal(datatypes.guess_type_from_obj(x).name, t)
+    datatypes.clear_type_dispatch()
+    assert(datatypes.get_dispatch_type(key) is None)
@@ -278,6 +278,41 @@ class TestMetaschemaType(YggTestClassInfo):
                 y = self.instance.deserialize(msg)
                 self.assert_result_equal(y[0], x)
 
+    def test_serialize_binary_payload(self):
+        r"""Test serialize/deserialize with array data in a binary payload."""
+        if self._cls != 'MetaschemaType':
+            for x in self._valid_decoded:
+                msg = self.instance.serialize(x, binary_payload=True)
+                y = self.instance.deserialize(msg)
+                self.assert_result_equal(y[0], x)
+                # Type moved into the body of the message
+                msg = self.instance.serialize(x, binary_payload=True,
+                                              max_header_size=200)
+                metadata = self.instance.deserialize(msg, no_data=True)
+                if metadata.get('type_in_data', False):
+                    data = msg.split(YGG_MSG_HEAD, 2)[-1]
+                    y = self.instance.deserialize(data, metadata=metadata)
+                else:
+                    y = self.instance.deserialize(msg)
+                self.assert_result_equal(y[0], x)
+
+    def test_update_header(self):
+        r"""Test updating the header of a serialized message."""
+        if self._cls != 'MetaschemaType':
+            for x in self._valid_decoded:
+                for max_header_size in [0, 200]:
+                    msg = self.instance.serialize(
+                        x, max_header_size=max_header_size)
+                    header, body = self.instance.update_header(
+                        msg, max_header_size=max_header_size,
+                        address='test_address')
+                    assert(isinstance(body, memoryview))
+                    y = self.instance.deserialize(header + body)
+                    self.assert_equal(y[1]['address'], 'test_address')
+                    self.assert_result_equal(y[0], x)
+            self.assert_raises(ValueError, self.instance.update_header,
+                               b'invalid')
+
     def test_serialize_error(self):
         r"""Test serialization errors."""
         if (self._cls != 'MetaschemaType') and (len(self._valid_decoded) > 0):
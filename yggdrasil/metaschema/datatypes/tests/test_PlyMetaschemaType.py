@@ -84,6 +84,32 @@ def test_translate_py2ply_errors():
     assert_raises(ValueError, PlyMetaschemaType.translate_py2ply, 'float128')
 
 
+def test_translate_plyformat2byteorder():
+    r"""Test translate_plyformat2byteorder."""
+    assert_equal(PlyMetaschemaType.translate_plyformat2byteorder('ascii 1.0'),
+                 None)
+    assert_equal(PlyMetaschemaType.translate_plyformat2byteorder(
+        'binary_little_endian 1.0'), '<')
+    assert_equal(PlyMetaschemaType.translate_plyformat2byteorder(
+        'binary_big_endian 1.0'), '>')
+    assert_raises(ValueError, PlyMetaschemaType.translate_plyformat2byteorder,
+                  'invalid 1.0')
+
+
+def test_encode_decode_plyformat():
+    r"""Test encoding/decoding in ASCII and binary formats."""
+    cls = PlyMetaschemaType.PlyMetaschemaType
+    for x in [_test_value, _test_value_simple]:
+        expected = cls.decode_data(cls.encode_data(x, None), None)
+        for plyformat in ['binary_little_endian 1.0', 'binary_big_endian 1.0']:
+            msg = cls.encode_data(x, None, plyformat=plyformat)
+            assert(isinstance(msg, bytes))
+            y = cls.decode_data(msg, None)
+            assert_equal(y, expected)
+            assert_equal(cls.encode_data(y, None, plyformat=plyformat), msg)
+            assert_raises(ValueError, cls.decode_data, msg[:-10], None)
+
+
 def test_singular2plural():
     r"""Test conversion from singular element names to plural ones and back."""
     pairs = [('face', 'faces'), ('vertex', 'vertices'),
@@ -94,6 +120,32 @@ def test_singular2plural():
     assert_raises(ValueError, PlyMetaschemaType.plural2singular, 'invalid')
 
 
+def test_csr():
+    r"""Test conversion of variable length lists to/from CSR arrays."""
+    lists = [[0, 1, 2], [3, 4, 5, 6], [7, 8, 9]]
+    values, offsets = PlyMetaschemaType._lists2csr(lists, dtype='int32')
+    np.testing.assert_array_equal(values, np.arange(10))
+    np.testing.assert_array_equal(offsets, [0, 3, 7, 10])
+    assert_equal(PlyMetaschemaType._csr2lists(values, offsets), lists)
+    padded = PlyMetaschemaType._csr2padded(values, offsets)
+    assert_equal(padded.shape, (3, 4))
+    assert(np.isnan(padded[0, 3]))
+    values2, offsets2 = PlyMetaschemaType._padded2csr(padded)
+    np.testing.assert_array_equal(values2, values)
+    np.testing.assert_array_equal(offsets2, offsets)
+
+
+def test_array2dicts():
+    r"""Test conversion of array rows to dictionaries."""
+    arr = np.array([[0.0, 1.0, np.NaN], [2.0, 3.0, 4.0]])
+    assert_equal(PlyMetaschemaType._array2dicts(arr, 'uvw', nrequired=2),
+                 [{'u': 0.0, 'v': 1.0}, {'u': 2.0, 'v': 3.0, 'w': 4.0}])
+    out = [{}, {}]
+    PlyMetaschemaType._add_array_columns(out, arr[:, 1:], 'vw',
+                                         conv=np.int32)
+    assert_equal(out, [{'v': 1}, {'v': 3, 'w': 4}])
+
+
 class TestPlyDict(YggTestClassInfo):
     r"""Test for PlyDict class."""
     
@@ -127,7 +179,15 @@ class TestPlyDict(YggTestClassInfo):
 
     def test_mesh(self):
         r"""Test mesh."""
-        self.instance.mesh
+        mesh = self.instance.mesh
+        self.assert_equal(len(mesh), self.instance.nface)
+
+    def test_get_face_indices(self):
+        r"""Test getting face indices in CSR format."""
+        indices, offsets = self.instance.get_face_indices()
+        self.assert_equal(len(offsets), self.instance.nface + 1)
+        self.assert_equal(len(indices), offsets[-1])
+        assert(indices.max() < self.instance.nvert)
 
     def test_merge(self):
         r"""Test merging two ply objects."""
@@ -230,7 +290,10 @@ class TestPlyDict(YggTestClassInfo):
     def test_properties(self):
         r"""Test explicit exposure of specific element counts as properties
         against counts based on singular elements."""
-        self.instance.bounds
+        # Vertices in the test values are the corners of a unit cube
+        mins, maxs = self.instance.bounds
+        np.testing.assert_array_equal(mins, [0.0, 0.0, 0.0])
+        np.testing.assert_array_equal(maxs, [1.0, 1.0, 1.0])
         self.assert_equal(self.instance.nvert, self.instance.count_elements('vertex'))
         self.assert_equal(self.instance.nface, self.instance.count_elements('face'))
 
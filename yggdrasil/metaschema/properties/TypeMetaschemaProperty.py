@@ -1,12 +1,9 @@
 from yggdrasil.metaschema.datatypes import (
-    get_registered_types, get_type_class, MetaschemaTypeError)
+    get_types_by_specificity, get_type_dispatch_key, get_dispatch_type,
+    set_dispatch_type, get_type_class, MetaschemaTypeError)
 from yggdrasil.metaschema.properties.MetaschemaProperty import MetaschemaProperty
 
 
-def _specificity_sort_key(item):
-    return -item[1].specificity
-
-
 class TypeMetaschemaProperty(MetaschemaProperty):
     r"""Type property with validation of new properties."""
 
@@ -16,7 +13,11 @@ class TypeMetaschemaProperty(MetaschemaProperty):
 
     @classmethod
     def encode(cls, instance, typedef=None):
-        r"""Method to encode the property given the object.
+        r"""Method to encode the property given the object. The type of
+        Python and numpy scalars/arrays is looked up in the type dispatch
+        table, with validation against each registered type (in order of
+        specificity) used for other objects and the first instance of each
+        key.
 
         Args:
             instance (object): Object to get property for.
@@ -28,9 +29,15 @@ class TypeMetaschemaProperty(MetaschemaProperty):
             object: Encoded property for instance.
 
         """
-        type_registry = get_registered_types()
-        for t, cls in sorted(type_registry.items(), key=_specificity_sort_key):
+        key = get_type_dispatch_key(instance)
+        if key is not None:
+            out = get_dispatch_type(key)
+            if out is not None:
+                return out
+        for t, cls in get_types_by_specificity():
             if (t != 'any') and cls.validate(instance):
+                if key is not None:
+                    set_dispatch_type(key, t)
                 return t
         raise MetaschemaTypeError(
             "Could not encode 'type' property for Python type: %s"
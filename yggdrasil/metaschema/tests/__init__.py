@@ -135,3 +135,51 @@ def test_normalize_instance():
         except BaseException:  # pragma: debug
             print(schema, x, y, z)
             raise
+
+
+def test_validator_cache():
+    r"""Test caching of validators and fast path validation."""
+    from jsonschema.exceptions import ValidationError
+    metaschema.clear_validator_cache()
+    schema = {'type': 'array',
+              'items': [{'type': '1darray', 'subtype': 'int', 'precision': 32},
+                        {'type': '1darray', 'subtype': 'float'}]}
+    key = metaschema.get_schema_key(schema)
+    assert(metaschema.get_schema_key({'items': schema['items'],
+                                      'type': 'array'}) == key)
+    assert(metaschema.get_schema_key({1: 'a', 'b': 2}) is None)
+    validator = metaschema.get_schema_validator(schema)
+    assert(metaschema.get_schema_validator(schema) is validator)
+    assert(key in metaschema._validator_cache)
+    # Fast path
+    assert(metaschema.is_fast_schema(schema))
+    assert(metaschema.is_fast_schema({'type': 'float', 'units': 'cm'}))
+    assert(not metaschema.is_fast_schema({'type': 'object'}))
+    assert(not metaschema.is_fast_schema({'type': 'array', 'maxItems': 2,
+                                          'items': schema['items']}))
+    assert(metaschema.get_instance_signature(['a']) is None)
+    obj = [np.zeros(5, 'int32'), np.ones(5)]
+    metaschema.validate_instance(obj, schema)
+    signature = metaschema.get_instance_signature(obj)
+    assert((key, signature) in metaschema._validated_cache)
+    metaschema.validate_instance(obj, schema)
+    assert_raises(ValidationError, metaschema.validate_instance,
+                  [np.zeros(5, 'int64'), np.ones(5)], schema)
+    # Invalid schemas are not cached
+    assert_raises(Exception, metaschema.validate_instance, 1,
+                  {'type': 'invalid'})
+    assert(len(metaschema._validator_cache) == 1)
+    # Cache size is limited
+    old_size = metaschema._validator_cache_size
+    try:
+        metaschema._validator_cache_size = 2
+        for i in range(3):
+            metaschema.validate_instance(np.float64(i),
+                                         {'type': 'float', 'title': str(i)})
+        assert(len(metaschema._validator_cache) == 2)
+        assert(key not in metaschema._validator_cache)
+    finally:
+        metaschema._validator_cache_size = old_size
+    metaschema.get_validator(overwrite=True)
+    assert(len(metaschema._validator_cache) == 0)
+    assert(len(metaschema._validated_cache) == 0)
@@ -299,6 +299,11 @@ class Context(MultiObject):
         kwargs['task_context'] = self
         return Event(*args, **kwargs)
 
+    def Condition(self, *args, **kwargs):
+        r"""Get a condition in this context."""
+        kwargs['task_context'] = self
+        return Condition(*args, **kwargs)
+
     def Task(self, *args, **kwargs):
         r"""Get a task in this context."""
         kwargs['task_context'] = self
@@ -477,6 +482,48 @@ class Event(ContextObject):
         super(Event, self).__setstate__(state)
 
 
+class DummyCondition(DummyRLock):  # pragma: no cover
+
+    def wait(self, *args, **kwargs):
+        raise AliasDisconnectError("DummyCondition will never be notified.")
+
+    def wait_for(self, *args, **kwargs):
+        raise AliasDisconnectError("DummyCondition will never be notified.")
+
+    def notify(self, *args, **kwargs):
+        pass
+
+    def notify_all(self, *args, **kwargs):
+        pass
+
+
+class Condition(ContextObject):
+    r"""Condition variable that can be used as a recursive lock by
+    tasks waiting to be notified of a change. Acquiring the condition
+    after disconnect is called through use as a context will not raise
+    an error, but will not do anything."""
+
+    _base_meth = ['acquire', 'release', '__enter__', '__exit__',
+                  'wait', 'wait_for', 'notify', 'notify_all']
+
+    def __getstate__(self):
+        state = super(Condition, self).__getstate__()
+        if ((not self.parallel)
+                and (not isinstance(state['_base'], DummyCondition))):
+            state['_base'] = None
+        return state
+
+    def __setstate__(self, state):
+        if state['_base'] is None:
+            state['_base'] = threading.Condition()
+        super(Condition, self).__setstate__(state)
+
+    @property
+    def dummy_copy(self):
+        r"""Dummy copy of base."""
+        return DummyCondition()
+
+
 class DummyTask(DummyContextObject):  # pragma: no cover
 
     def __init__(self, name='', exitcode=0, daemon=False):
@@ -1071,18 +1118,102 @@ class BreakLoopError(BreakLoopException):
         
 
 class YggTaskLoop(YggTask):
-    r"""Class to run a loop inside a thread/process."""
+    r"""Class to run a loop inside a thread/process.
+
+    Args:
+        *args: Arguments are passed to the parent class.
+        scheduler (YggTaskScheduler, optional): Scheduler that should run
+            the loop on its thread alongside other loops instead of the
+            loop being run on its own thread. Ignored if the loop is run
+            in a process. Defaults to None.
+        **kwargs: Additional keyword arguments are passed to the parent
+            class.
+
+    """
 
     _disconnect_attr = (YggTask._disconnect_attr
-                        + ['break_flag', 'loop_flag'])
+                        + ['break_flag', 'loop_flag', 'finish_flag'])
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, scheduler=None, **kwargs):
         super(YggTaskLoop, self).__init__(*args, **kwargs)
         self._1st_main_terminated = False
         self._loop_count = 0
         self.create_flag_attr('break_flag')
         self.create_flag_attr('loop_flag')
+        self.create_flag_attr('finish_flag')
         self.break_stack = None
+        if self.as_process:
+            scheduler = None
+        self.scheduler = scheduler
+        self._defer_sleep = False
+        self._sleep_deferred = False
+
+    def __getstate__(self):
+        out = super(YggTaskLoop, self).__getstate__()
+        out['scheduler'] = None
+        return out
+
+    def start(self, *args, **kwargs):
+        r"""Start thread/process or add the loop to the scheduler."""
+        if self.scheduler is None:
+            return super(YggTaskLoop, self).start(*args, **kwargs)
+        if not self.was_terminated:
+            self.set_started_flag()
+            self.before_start()
+        self.scheduler.add_task(self)
+
+    def join(self, *args, **kwargs):
+        r"""Join the process/thread."""
+        if self.scheduler is None:
+            return super(YggTaskLoop, self).join(*args, **kwargs)
+        self.wait(*args, **kwargs)
+
+    def is_alive(self, *args, **kwargs):
+        r"""Determine if the process/thread is alive."""
+        if self.scheduler is None:
+            return super(YggTaskLoop, self).is_alive(*args, **kwargs)
+        return (self.scheduler.has_task(self)
+                and (not self.check_flag_attr('finish_flag')))
+
+    def wait(self, timeout=None, key=None):
+        r"""Wait until thread/process finish to return using sleeps rather than
+        blocking. If the loop is run by a scheduler and this is called
+        from the scheduler's thread, the loop is run until it finishes.
+
+        Args:
+            timeout (float, optional): Maximum time that should be waited for
+                the driver to finish. Defaults to None and is infinite.
+            key (str, optional): Key that should be used to register the timeout.
+                Defaults to None and is set based on the stack trace.
+
+        """
+        if (self.scheduler is not None) and self.scheduler.in_scheduler():
+            T = self.start_timeout(timeout, key_level=1, key=key)
+            while (self.is_alive() and (not T.is_out)
+                   and (not self.scheduler.is_stepping(self))):
+                if not self.scheduler.step_task(self):
+                    self.scheduler.sleep()
+            self.stop_timeout(key_level=1, key=key)
+            return
+        super(YggTaskLoop, self).wait(timeout=timeout, key=key)
+
+    def sleep(self, *args, **kwargs):
+        r"""Have the class sleep for some period of time. If the loop is
+        run by a scheduler, the first sleep during each loop iteration is
+        skipped and the scheduler is told that the loop was idle so that
+        other loops can run in the meantime.
+
+        Args:
+            *args: Arguments are passed to the parent class's method.
+            **kwargs: Keyword arguments are passed to the parent class's
+                method.
+
+        """
+        if self._defer_sleep and self.scheduler.in_scheduler():
+            self._defer_sleep = False
+            self._sleep_deferred = True
+            return
+        super(YggTaskLoop, self).sleep(*args, **kwargs)
 
     @property
     def loop_count(self):
@@ -1154,12 +1285,14 @@ class YggTaskLoop(YggTask):
         r"""Actions performed after the loop."""
         self.debug('')
 
-    def call_target(self):
-        r"""Call target."""
+    def iter_target(self):
+        r"""Generator that calls the target, yielding after the loop is
+        entered and after each loop iteration."""
         self.debug("Starting loop")
         self.before_loop()
         if (not self.was_break):
             self.set_loop_flag()
+        yield
         while (not self.was_break):
             if ((self.main_terminated
                  and (not self._1st_main_terminated))):  # pragma: debug
@@ -1173,8 +1306,14 @@ class YggTaskLoop(YggTask):
                 except BreakLoopException as e:
                     self.debug("BreakLoopException: %s", e)
                     self.set_break_flag(break_stack=e.break_stack)
+            yield
         if not self.break_stack:
             self.set_break_flag()
+
+    def call_target(self):
+        r"""Call target."""
+        for _ in self.iter_target():
+            pass
         
     def run_loop(self, *args, **kwargs):
         r"""Actions performed on each loop iteration."""
@@ -1191,17 +1330,188 @@ class YggTaskLoop(YggTask):
         self.debug("run_error")
         self.set_break_flag()
         
-    def run(self, *args, **kwargs):
-        r"""Continue running until terminate event set."""
-        super(YggTaskLoop, self).run(*args, **kwargs)
+    def iter_run(self):
+        r"""Generator that runs the loop, yielding after each loop iteration
+        so that the loop can be run cooperatively by a scheduler."""
+        self.debug("Starting method")
+        try:
+            self.run_init()
+            for _ in self.iter_target():
+                yield
+        except BaseException:  # pragma: debug
+            self.run_error()
+        finally:
+            self.run_finally()
         try:
             self.after_loop()
         except BaseException:  # pragma: debug
             self.exception("AFTER LOOP ERROR")
             self.set_flag_attr('error_flag')
+        self.set_flag_attr('finish_flag')
+
+    def run(self, *args, **kwargs):
+        r"""Continue running until terminate event set."""
+        for _ in self.iter_run():
+            pass
 
     def terminate(self, *args, **kwargs):
         r"""Also set break flag."""
         self.debug("terminate")
         self.set_break_flag()
         super(YggTaskLoop, self).terminate(*args, **kwargs)
+
+
+class YggTaskScheduler(YggTaskLoop):
+    r"""Class to run several thread based loops cooperatively on a single
+    thread. During each iteration of the scheduler loop, one iteration of
+    each scheduled loop is performed and the scheduler only sleeps if none
+    of the scheduled loops had anything to do. Loops run by a scheduler
+    must not block for long periods of time.
+
+    Args:
+        *args: Arguments are passed to the parent class.
+        **kwargs: Additional keyword arguments are passed to the parent
+            class.
+
+    Attributes:
+        tasks (list): Loops that are being run by the scheduler.
+        condition (Condition): Condition used to notify the scheduler
+            when loops are added.
+
+    """
+
+    _disconnect_attr = (YggTaskLoop._disconnect_attr
+                        + ['condition'])
+
+    def __init__(self, *args, **kwargs):
+        kwargs['task_method'] = 'thread'
+        super(YggTaskScheduler, self).__init__(*args, **kwargs)
+        self.condition = self.context.Condition()
+        self.tasks = []
+        self._task_iters = {}
+        self._stepping = []
+
+    def __getstate__(self):  # pragma: no cover
+        raise RuntimeError("YggTaskScheduler instances cannot be pickled.")
+
+    @property
+    def ntasks(self):
+        r"""int: Number of loops that are being run by the scheduler."""
+        with self.condition:
+            return len(self.tasks)
+
+    def in_scheduler(self):
+        r"""Determine if the current thread is the scheduler thread.
+
+        Returns:
+            bool: True if called from the scheduler thread, False otherwise.
+
+        """
+        return (threading.current_thread() is self.process_instance._base)
+
+    def has_task(self, task):
+        r"""Determine if a loop was added to the scheduler.
+
+        Args:
+            task (YggTaskLoop): Loop to check for.
+
+        Returns:
+            bool: True if the loop is being run by the scheduler.
+
+        """
+        with self.condition:
+            return (id(task) in self._task_iters)
+
+    def is_stepping(self, task):
+        r"""Determine if a loop is currently being advanced.
+
+        Args:
+            task (YggTaskLoop): Loop to check.
+
+        Returns:
+            bool: True if the loop is in the middle of an iteration.
+
+        """
+        return (task in self._stepping)
+
+    def add_task(self, task):
+        r"""Add a loop to the scheduler. If called from the scheduler
+        thread (e.g. by a loop starting another loop), the actions
+        preceding the loop are performed immediately as they would be if
+        the loop was started in its own thread.
+
+        Args:
+            task (YggTaskLoop): Loop that should be run by the scheduler.
+
+        Raises:
+            RuntimeError: If the loop was already added to the scheduler.
+
+        """
+        with self.condition:
+            if id(task) in self._task_iters:
+                raise RuntimeError("Task %s already added to scheduler %s."
+                                   % (task.name, self.name))
+            self.debug("Adding task %s", task.name)
+            self._task_iters[id(task)] = task.iter_run()
+            self.tasks.append(task)
+            self.condition.notify_all()
+        if self.in_scheduler():
+            self.step_task(task)
+
+    def step_task(self, task):
+        r"""Perform one iteration of a loop run by the scheduler.
+
+        Args:
+            task (YggTaskLoop): Loop that should be advanced.
+
+        Returns:
+            bool: True if the loop did something during the iteration,
+                False if it was idle, already being advanced by the caller,
+                or finished.
+
+        """
+        with self.condition:
+            iterator = self._task_iters.get(id(task), None)
+        if (iterator is None) or self.is_stepping(task):
+            return False
+        self._stepping.append(task)
+        task._sleep_deferred = False
+        task._defer_sleep = task.was_loop
+        try:
+            next(iterator)
+        except StopIteration:
+            with self.condition:
+                self.tasks.remove(task)
+                self._task_iters.pop(id(task))
+            self.debug("Task %s finished", task.name)
+            return False
+        finally:
+            task._defer_sleep = False
+            self._stepping.remove(task)
+        return (not task._sleep_deferred)
+
+    def run_loop(self):
+        r"""Perform one iteration of each loop and sleep if none of the
+        loops had anything to do."""
+        with self.condition:
+            tasks = list(self.tasks)
+        active = False
+        for task in tasks:
+            if self.step_task(task):
+                active = True
+        with self.lock:
+            self._loop_count += 1
+        if not active:
+            with self.condition:
+                if len(self.tasks) == len(tasks):
+                    self.condition.wait(self.sleeptime)
+
+    def after_loop(self):
+        r"""Stop any loops that are still running."""
+        super(YggTaskScheduler, self).after_loop()
+        with self.condition:
+            tasks = list(self.tasks)
+        for task in tasks:
+            self.debug("Stopping task %s", task.name)
+            task.set_break_flag()
+            task.wait(timeout=task.timeout)
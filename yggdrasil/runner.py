@@ -10,8 +10,9 @@ from itertools import chain
 import socket
 from yggdrasil.tools import YggClass
 from yggdrasil.config import ygg_cfg, cfg_environment, temp_config
-from yggdrasil import platform, yamlfile
+from yggdrasil import platform, yamlfile, multitasking
 from yggdrasil.drivers import create_driver, DuplicatedModelDriver
+from yggdrasil.drivers.CompiledModelDriver import deferred_compilation
 
 
 COLOR_TRACE = '\033[30;43;22m'
@@ -174,6 +175,14 @@ class YggRunner(YggClass):
             Defaults to environment variable 'RMQ_DEBUG'.
         ygg_debug_prefix (str, optional): Prefix for Ygg debug messages.
             Defaults to namespace.
+        connection_task_method (str, optional): Method that should be used
+            to run connection drivers. 'thread' and 'process' run each
+            connection in its own thread/process while 'loop' runs all of
+            the connections (and the loops forwarding model output) on a
+            small number of shared threads. Defaults to 'thread'.
+        connection_loops (int, optional): Number of shared threads that
+            should be used to run connections when connection_task_method
+            is 'loop'. Defaults to 1.
         as_function (bool, optional): If True, the missing input/output channels
             will be created for using model(s) as a function. Defaults to False.
 
@@ -186,6 +195,8 @@ class YggRunner(YggClass):
         connectiondrivers (dict): Connection drivers for this run.
         interrupt_time (float): Time of last interrupt signal.
         error_flag (bool): True if one or more models raises an error.
+        schedulers (list): Shared threads running connections when
+            connection_task_method is 'loop'.
 
     ..todo:: namespace, host, and rank do not seem strictly necessary.
 
@@ -193,7 +204,8 @@ class YggRunner(YggClass):
     def __init__(self, modelYmls, namespace=None, host=None, rank=0,
                  ygg_debug_level=None, rmq_debug_level=None,
                  ygg_debug_prefix=None, connection_task_method='thread',
-                 as_function=False, production_run=False):
+                 connection_loops=1, as_function=False,
+                 production_run=False):
         super(YggRunner, self).__init__('runner')
         if namespace is None:
             namespace = ygg_cfg.get('rmq', 'namespace', False)
@@ -203,6 +215,13 @@ class YggRunner(YggClass):
         self.host = host
         self.rank = rank
         self.connection_task_method = connection_task_method
+        self.schedulers = []
+        if connection_task_method == 'loop':
+            self.schedulers = [
+                multitasking.YggTaskScheduler(
+                    name='%s.ConnectionLoop%d' % (self.name, i))
+                for i in range(max(connection_loops, 1))]
+        self._nscheduled = 0
         self.modeldrivers = {}
         self.connectiondrivers = {}
         self.interrupt_time = 0
@@ -382,6 +401,12 @@ class YggRunner(YggClass):
         drv = self.create_driver(yml)
         self.debug("Model %s:, env: %s",
                    yml['name'], pformat(yml['instance'].env))
+        if self.schedulers:
+            copies = [drv]
+            if isinstance(drv, DuplicatedModelDriver.DuplicatedModelDriver):
+                copies = drv.copies
+            for x in copies:
+                x.output_scheduler = self.next_scheduler()
         return drv
 
     def create_connection_driver(self, yml):
@@ -394,7 +419,11 @@ class YggRunner(YggClass):
             object: An instance of the specified driver.
 
         """
-        yml['task_method'] = self.connection_task_method
+        if self.schedulers:
+            yml['task_method'] = 'thread'
+            yml['scheduler'] = self.next_scheduler()
+        else:
+            yml['task_method'] = self.connection_task_method
         drv = self.create_driver(yml)
         # Transfer connection addresses to model via env
         # TODO: Change to server that tracks connections
@@ -412,6 +441,18 @@ class YggRunner(YggClass):
                     raise
         return drv
         
+    def next_scheduler(self):
+        r"""Get the shared thread that should run the next connection,
+        distributing connections evenly between the threads.
+
+        Returns:
+            YggTaskScheduler: Scheduler that should run the connection.
+
+        """
+        out = self.schedulers[self._nscheduled % len(self.schedulers)]
+        self._nscheduled += 1
+        return out
+
     def loadDrivers(self):
         r"""Load all of the necessary drivers, doing the IO drivers first
         and adding IO driver environmental variables back tot he models."""
@@ -422,10 +463,11 @@ class YggRunner(YggClass):
             self.debug("Loading connection drivers")
             for driver in self.connectiondrivers.values():
                 self.create_connection_driver(driver)
-            # Create model drivers
+            # Create model drivers, compiling them concurrently
             self.debug("Loading model drivers")
-            for driver in self.modeldrivers.values():
-                self.createModelDriver(driver)
+            with deferred_compilation():
+                for driver in self.modeldrivers.values():
+                    self.createModelDriver(driver)
         except BaseException:  # pragma: debug
             self.error("%s could not be created.", driver['name'])
             self.terminate()
@@ -438,6 +480,10 @@ class YggRunner(YggClass):
                       self.host, self.namespace, self.rank))
         driver = dict(name='name')
         try:
+            # Start shared connection threads
+            for x in self.schedulers:
+                if not x.was_started:
+                    x.start()
             # Start connections
             for driver in self.io_drivers():
                 self.debug("Starting driver %s", driver['name'])
@@ -473,12 +519,12 @@ class YggRunner(YggClass):
         join the thread and perform exits for associated IO drivers."""
         self.debug('')
         running = [d for d in self.modeldrivers.values()]
-        dead = []
         Tout = self.start_timeout(t=timeout,
                                   key_suffix='.waitModels')
         while ((len(running) > 0) and (not self.error_flag)
                and (not Tout.is_out)):
-            for drv in running:
+            finished = False
+            for drv in list(running):
                 d = drv['instance']
                 if d.errors:  # pragma: debug
                     self.error('Error in model %s', drv['name'])
@@ -489,7 +535,6 @@ class YggRunner(YggClass):
                                % drv['name'])
                     self.error_flag = True
                     break
-                d.join(1)
                 if not d.is_alive():
                     if not d.errors:
                         self.info("%s finished running.", drv['name'])
@@ -499,14 +544,14 @@ class YggRunner(YggClass):
                         self.debug("%s completed client exits.", drv['name'])
                         running.remove(drv)
                         self.info("%s finished exiting.", drv['name'])
+                        finished = True
                 else:
                     self.debug('%s still running', drv['name'])
-            dead = []
-            for drv in self.all_drivers:
-                d = drv['instance']
-                d.join(0.1)
-                if not d.is_alive():
-                    dead.append(drv['name'])
+            # Block on one model rather than each model in turn so that
+            # exits/errors are checked for every model at least once a
+            # second regardless of the number of models
+            if running and (not finished) and (not self.error_flag):
+                running[0]['instance'].join(1)
         self.stop_timeout(key_suffix='.waitModels')
         for d in self.modeldrivers.values():
             if d['instance'].errors:
@@ -570,14 +615,24 @@ class YggRunner(YggClass):
                 driver['instance'].terminate()
                 # Terminate should ensure instance not alive
                 assert(not driver['instance'].is_alive())
+        self.stop_schedulers()
         self.debug('Returning')
 
+    def stop_schedulers(self):
+        r"""Stop the shared threads running connections."""
+        for x in self.schedulers:
+            if x.was_started and (not x.was_terminated):
+                self.debug('Stop %s', x.name)
+                x.terminate()
+
     def cleanup(self):
         r"""Perform cleanup operations for all drivers."""
         self.debug('')
         for driver in self.all_drivers:
             if 'instance' in driver:
                 driver['instance'].cleanup()
+        for x in self.schedulers:
+            x.cleanup()
         # self.inputdrivers = {}
         # self.outputdrivers = {}
         # self.modeldrivers = {}
@@ -616,6 +671,7 @@ class YggRunner(YggClass):
             if 'instance' in drv:
                 driver = drv['instance']
                 assert(not driver.is_alive())
+        self.stop_schedulers()
         self.debug('Returning')
 
         
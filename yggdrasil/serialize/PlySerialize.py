@@ -11,11 +11,17 @@ class PlySerialize(SerializeBase):
             serialized output. Defaults to True.
         newline (str, optional): String that should be used for new lines.
             Defaults to '\n'.
+        plyformat (str, optional): Ply format that should be used for
+            serialized output. Supported values are 'ascii 1.0',
+            'binary_little_endian 1.0', and 'binary_big_endian 1.0'.
+            Defaults to 'ascii 1.0'. The format of deserialized messages is
+            determined from their headers.
 
     Attributes:
         write_header (bool): If True, headers will be added to serialized
             output.
         newline (str): String that should be used for new lines.
+        plyformat (str): Ply format that should be used for serialized output.
         default_rgb (list): Default color in RGB that should be used for
             missing colors.
 
@@ -25,7 +31,11 @@ class PlySerialize(SerializeBase):
     _schema_subtype_description = ('Serialize 3D structures using Ply format.')
     _schema_properties = {
         'newline': {'type': 'string',
-                    'default': _default_newline_str}}
+                    'default': _default_newline_str},
+        'plyformat': {'type': 'string', 'default': 'ascii 1.0',
+                      'enum': ['ascii 1.0', 'binary_little_endian 1.0',
+                               'binary_big_endian 1.0']}}
+    _schema_excluded_from_inherit = ['plyformat']
     default_datatype = {'type': 'ply'}
     concats_as_str = False
 
@@ -45,7 +55,11 @@ class PlySerialize(SerializeBase):
             bytes: Serialized message.
 
         """
-        return self.datatype.encode_data(args, self.typedef).encode("utf-8")
+        out = self.datatype.encode_data(args, self.typedef,
+                                        plyformat=self.plyformat)
+        if isinstance(out, str):
+            out = out.encode("utf-8")
+        return out
 
     def func_deserialize(self, msg):
         r"""Deserialize a message.
@@ -57,7 +71,10 @@ class PlySerialize(SerializeBase):
             obj: Deserialized message.
 
         """
-        return PlyDict(self.datatype.decode_data(msg, self.typedef))
+        out = self.datatype.decode_data(msg, self.typedef)
+        if not isinstance(out, PlyDict):
+            out = PlyDict(out)
+        return out
 
     @classmethod
     def concatenate(cls, objects, **kwargs):
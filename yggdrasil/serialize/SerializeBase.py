@@ -494,7 +494,8 @@ class SerializeBase(tools.YggClass):
                        'commtype', 'filetype', 'response_address', 'request_id',
                        'append', 'in_temp', 'is_series', 'working_dir', 'fmts',
                        'model_driver', 'env', 'send_converter', 'recv_converter',
-                       'typedef_base', 'model', 'closed_clients']
+                       'typedef_base', 'model', 'closed_clients',
+                       'binary_size']
         kws = list(kwargs.keys())
         for k in kws:
             if (k in _remove_kws) or k.startswith('zmq'):
@@ -662,7 +663,7 @@ class SerializeBase(tools.YggClass):
         raise NotImplementedError("func_deserialize not implemented.")
     
     def serialize(self, args, header_kwargs=None, add_serializer_info=False,
-                  no_metadata=False, max_header_size=0):
+                  no_metadata=False, max_header_size=0, binary_payload=False):
         r"""Serialize a message.
 
         Args:
@@ -677,6 +678,9 @@ class SerializeBase(tools.YggClass):
                 should occupy in order to be sent in a single message.
                 A value of 0 indicates that any size header is valid.
                 Defaults to 0.
+            binary_payload (bool, optional): If True, array data will be
+                sent as raw bytes following the JSON encoded message
+                rather than base64 encoded within it. Defaults to False.
 
         Returns:
             bytes, str: Serialized message.
@@ -692,7 +696,8 @@ class SerializeBase(tools.YggClass):
             header_kwargs['raw'] = True
         self.initialize_from_message(args, **header_kwargs)
         metadata = {'no_metadata': no_metadata,
-                    'max_header_size': max_header_size}
+                    'max_header_size': max_header_size,
+                    'binary_payload': binary_payload}
         if add_serializer_info:
             self.verbose_debug("serializer_info = %.100s...",
                                str(self.serializer_info))
@@ -724,6 +729,49 @@ class SerializeBase(tools.YggClass):
         out = self.encoded_datatype.serialize(data, **metadata)
         return out
 
+    def update_header(self, msg, header_kwargs=None, max_header_size=0,
+                      remove_keys=None):
+        r"""Update the header of a serialized message without re-encoding
+        the message body.
+
+        Args:
+            msg (bytes): Message previously returned by serialize.
+            header_kwargs (dict, optional): Keyword arguments that should be
+                added to the header. Defaults to None and the existing
+                header information is preserved.
+            max_header_size (int, optional): Maximum size that header
+                should occupy in order to be sent in a single message.
+                A value of 0 indicates that any size header is valid.
+                Defaults to 0.
+            remove_keys (list, optional): Keys that should be removed from
+                the existing header before it is updated. Defaults to None
+                and the existing header information is preserved.
+
+        Returns:
+            tuple(bytes, memoryview): The new serialized header and a view
+                of the encoded message body that should follow it.
+
+        """
+        if header_kwargs is None:
+            header_kwargs = {}
+        return self.encoded_datatype.update_header(
+            msg, max_header_size=max_header_size, remove_keys=remove_keys,
+            **header_kwargs)
+
+    def split_header(self, msg):
+        r"""Split a serialized message into its header information and
+        encoded body without decoding the body.
+
+        Args:
+            msg (bytes): Message previously returned by serialize.
+
+        Returns:
+            tuple(dict, memoryview): The header information and a view of
+                the encoded message body.
+
+        """
+        return self.encoded_datatype.split_header(msg)
+
     def deserialize(self, msg, **kwargs):
         r"""Deserialize a message.
 
@@ -1,5 +1,6 @@
 import re
 import copy
+import itertools
 import numpy as np
 import pandas
 import io as sio
@@ -19,6 +20,7 @@ _fmt_char = b'%'
 _default_comment = b'# '
 _default_delimiter = b'\t'
 _default_newline = b'\n'
+_table_block_size = 10000
 _fmt_char_str = _fmt_char.decode("utf-8")
 _default_comment_str = _default_comment.decode("utf-8")
 _default_delimiter_str = _default_delimiter.decode("utf-8")
@@ -679,9 +681,23 @@ def array_to_table(arrs, fmt_str, use_astropy=False):
     else:
         fd = sio.BytesIO()
         fmt_str = tools.str2bytes(fmt_str)
-        for ele in arr1:
-            line = format_message(ele.tolist(), fmt_str)
-            fd.write(line)
+        # Columns are converted to Python objects all at once and then
+        # formatted as blocks of rows by repeating the row format
+        cols = []
+        for n in arr1.dtype.names:
+            col = arr1[n]
+            if np.iscomplexobj(col):
+                cols += [col.real.tolist(), col.imag.tolist()]
+            elif col.dtype.kind == 'U':
+                cols.append(np.char.encode(col, 'utf-8').tolist())
+            else:
+                cols.append(col.tolist())
+        nrow = len(arr1)
+        for i in range(0, nrow, _table_block_size):
+            block = [c[i:(i + _table_block_size)] for c in cols]
+            nblock = min(_table_block_size, nrow - i)
+            fd.write((fmt_str * nblock)
+                     % tuple(itertools.chain.from_iterable(zip(*block))))
         # fmt = fmt_str.split(info['newline'])[0]
         # np.savetxt(fd, arr1,
         #            fmt=fmt, delimiter=info['delimiter'],
@@ -775,17 +791,75 @@ def table_to_array(msg, fmt_str=None, use_astropy=False, names=None,
         if dtype is not None:
             arr = arr.astype(dtype)
     else:
-        np_ver = tuple([float(x) for x in (np.__version__).split('.')])
-        np_kws.update(autostrip=True, dtype=None, names=names)
-        if (np_ver >= (1.0, 14.0, 0.0)):
-            np_kws['encoding'] = 'bytes'
-        arr = np.genfromtxt(fd, **np_kws)
+        arr = None
         if dtype is not None:
-            arr = arr.astype(dtype)
+            arr = parse_table_columns(msg, dtype,
+                                      delimiter=info.get('delimiter', None),
+                                      comment=info.get('comment', b'#'))
+        if arr is None:
+            np_ver = tuple([float(x) for x in (np.__version__).split('.')])
+            np_kws.update(autostrip=True, dtype=None, names=names)
+            if (np_ver >= (1.0, 14.0, 0.0)):
+                np_kws['encoding'] = 'bytes'
+            arr = np.genfromtxt(fd, **np_kws)
+            if dtype is not None:
+                arr = arr.astype(dtype)
     fd.close()
     return arr
 
 
+def parse_table_columns(msg, dtype, delimiter=None, comment=b'#'):
+    r"""Parse an ASCII table into an array with a known data type by
+    splitting the entire table into fields and converting each column
+    to the type of the corresponding field at once. Lines are split in
+    the same manner as numpy.genfromtxt with autostrip set.
+
+    Args:
+        msg (bytes): ASCII table as bytes string.
+        dtype (np.dtype): Data type of the table columns.
+        delimiter (bytes, optional): String used to separate columns.
+            Defaults to _default_delimiter.
+        comment (bytes, optional): String used to denote comments. Defaults
+            to '#'.
+
+    Returns:
+        np.ndarray: Table contents as an array. None is returned if the
+            table cannot be parsed using the data type (e.g. the number of
+            fields in each line does not match the number of columns).
+
+    """
+    if delimiter is None:
+        delimiter = _default_delimiter
+    delimiter = tools.str2bytes(delimiter)
+    comment = tools.str2bytes(comment)
+    names = dtype.names
+    ncol = len(names) if names else 1
+    lines = msg.split(b'\n')
+    if comment and (comment in msg):
+        lines = [x.split(comment, 1)[0] for x in lines]
+    lines = [x.strip(b' \r\n') for x in lines]
+    lines = [x for x in lines if x]
+    nrow = len(lines)
+    if nrow == 0:
+        return None
+    fields = delimiter.join(lines).split(delimiter)
+    if len(fields) != (nrow * ncol):
+        return None
+    fields = np.array(fields).reshape((nrow, ncol))
+    try:
+        if names:
+            arr = np.empty(nrow, dtype=dtype)
+            for i, n in enumerate(names):
+                arr[n] = np.char.strip(fields[:, i]).astype(dtype[n])
+        else:
+            arr = np.char.strip(fields[:, 0]).astype(dtype)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    if nrow == 1:
+        arr = arr.reshape(())
+    return arr
+
+
 def array_to_bytes(arrs, dtype=None, order='C'):
     r"""Serialize an array to bytes.
 
@@ -385,6 +385,27 @@ def test_array_to_table():
             np.testing.assert_array_equal(arr1, arr0)
 
 
+def test_parse_table_columns():
+    r"""Test parsing ASCII tables with a known data type."""
+    f = '# %5s\t%ld\t%lf\t%g%+gj\n'
+    dtype = serialize.cformat2nptype(f)
+    arr0 = np.ones(3, dtype)
+    arr0['f0'][0] = b'hello'
+    tab = serialize.array_to_table(arr0, f)
+    arr1 = serialize.parse_table_columns(tab, dtype)
+    np.testing.assert_array_equal(arr1, arr0)
+    # Single rows are returned as 0-d arrays like numpy.genfromtxt
+    tab = serialize.array_to_table(arr0[:1], f)
+    arr1 = serialize.parse_table_columns(tab, dtype)
+    assert_equal(arr1.shape, ())
+    np.testing.assert_array_equal(arr1, arr0[0])
+    # Tables that don't match the data type
+    assert_equal(serialize.parse_table_columns(b'# comment\n', dtype), None)
+    assert_equal(serialize.parse_table_columns(b'a\t1\n', dtype), None)
+    assert_equal(serialize.parse_table_columns(
+        b'a\tb\t1.0\t1.0\t1.0\n', dtype), None)
+
+
 def test_array_to_bytes():
     r"""Test conversion of arrays to bytes and back."""
     names0 = ['f0', 'f1', 'f2', 'f3']
@@ -1,7 +1,9 @@
 """Testing things."""
 import os
 import sys
+import atexit
 import shutil
+import tempfile
 import uuid
 import difflib
 import importlib
@@ -29,6 +31,14 @@ from yggdrasil.communication import cleanup_comms, import_comm
 from yggdrasil.components import import_component
 
 
+# Products compiled during tests are cached in a temporary directory
+# instead of the user's build cache unless a directory is specified
+if not os.environ.get('YGG_BUILD_CACHE_DIR', None):
+    _build_cache_dir = tempfile.mkdtemp(prefix='ygg_build_cache_')
+    os.environ['YGG_BUILD_CACHE_DIR'] = _build_cache_dir
+    atexit.register(shutil.rmtree, _build_cache_dir, ignore_errors=True)
+
+
 # Test data
 data_dir = os.path.join(os.path.dirname(__file__), 'data')
 data_list = [
@@ -0,0 +1,118 @@
+import os
+import shutil
+import tempfile
+import unittest
+from yggdrasil import build_cache
+from yggdrasil.config import temp_config
+from yggdrasil.tests import YggTestBase
+from yggdrasil.components import import_component
+
+
+class TestBuildCache(YggTestBase):
+    r"""Tests for the compilation build cache."""
+
+    def setup(self, *args, **kwargs):
+        r"""Create a cache and sources in a temporary directory."""
+        super(TestBuildCache, self).setup(*args, **kwargs)
+        self.tempdir = tempfile.mkdtemp()
+        self.srcdir = os.path.join(self.tempdir, 'src')
+        self.incdir = os.path.join(self.tempdir, 'include')
+        for x in [self.srcdir, self.incdir]:
+            os.mkdir(x)
+        self.src = os.path.join(self.srcdir, 'main.c')
+        self.header = os.path.join(self.incdir, 'value.h')
+        self.write(self.src, ('#include <stdio.h>\n'
+                              '#include "value.h"\n'
+                              'int main() { return VALUE; }\n'))
+        self.write(self.header, '#define VALUE 0\n')
+        self.cache = build_cache.BuildCache(
+            cache_dir=os.path.join(self.tempdir, 'cache'), max_size=1)
+
+    def teardown(self, *args, **kwargs):
+        r"""Remove the temporary directory."""
+        shutil.rmtree(self.tempdir)
+        super(TestBuildCache, self).teardown(*args, **kwargs)
+
+    def write(self, fname, contents):
+        r"""Write contents to a file."""
+        with open(fname, 'w') as fd:
+            fd.write(contents)
+
+    def get_key(self):
+        r"""Get the key for compiling the test source."""
+        return self.cache.get_key(['cc', '-c', self.src, '-I' + self.incdir,
+                                   '-o', 'main.o'], [self.src],
+                                  working_dir=self.srcdir)
+
+    def test_parse_search_dirs(self):
+        r"""Test parse_search_dirs."""
+        out = build_cache.parse_search_dirs(
+            ['-Iinclude', '-J', '/mod', '-L/lib', '-lfoo', 'x.c'],
+            working_dir=self.tempdir)
+        self.assertEqual(out, ([self.incdir, os.path.normpath('/mod')],
+                               [os.path.normpath('/lib')], ['foo']))
+
+    def test_find_includes(self):
+        r"""Test find_includes."""
+        self.assertEqual(build_cache.find_includes(self.src, [self.incdir]),
+                         [self.header])
+        self.assertEqual(build_cache.find_includes(self.src, []), [])
+
+    def test_get_key(self):
+        r"""Test that keys change with the included files."""
+        key = self.get_key()
+        self.assertEqual(self.get_key(), key)
+        self.write(self.header, '#define VALUE 1\n')
+        self.assertNotEqual(self.get_key(), key)
+
+    def test_store_restore(self):
+        r"""Test storing products and restoring them."""
+        out = os.path.join(self.srcdir, 'main.o')
+        extra = os.path.join(self.srcdir, 'main.mod')
+        self.write(out, 'object')
+        self.write(extra, 'module')
+        key = self.get_key()
+        self.assertFalse(self.cache.restore(key, out))
+        self.assertFalse(self.cache.has_record(out))
+        self.cache.store(key, out, [extra])
+        self.assertTrue(self.cache.has_record(out))
+        self.assertFalse(self.cache.is_stale(out, key))
+        self.assertTrue(self.cache.is_stale(out, key[::-1]))
+        os.remove(out)
+        os.remove(extra)
+        self.assertTrue(self.cache.restore(key, out))
+        with open(extra, 'r') as fd:
+            self.assertEqual(fd.read(), 'module')
+        self.assertGreater(self.cache.size(), len('object') + len('module'))
+        self.assertEqual(self.cache.evict(max_size=0), 1)
+        self.assertFalse(self.cache.restore(key, out))
+        self.cache.clear()
+        self.assertFalse(self.cache.has_record(out))
+
+    def test_compile(self):
+        r"""Test compilation using the cache."""
+        drv = import_component('model', 'c')
+        tool = drv.get_tool('compiler', default=None)
+        if (tool is None) or (not tool.is_installed()):  # pragma: debug
+            raise unittest.SkipTest("C compiler not installed.")
+        kws = dict(dont_link=True, working_dir=self.srcdir,
+                   compiler_flags=['-I' + self.incdir])
+        with temp_config(build_cache_dir=self.cache.cache_dir):
+            cache = tool.get_build_cache()
+            self.assertEqual(cache.cache_dir, self.cache.cache_dir)
+            out = tool.call(self.src, overwrite=True, **kws)
+            key = open(cache.stamp_file(out), 'r').read()
+            self.assertTrue(os.path.isdir(cache.entry_dir(key)))
+            # Restored from the cache
+            shutil.rmtree(cache.stamps_dir)
+            self.assertEqual(tool.call(self.src, overwrite=True, **kws), out)
+            self.assertTrue(cache.has_record(out))
+            # Not rebuilt when the inputs are unchanged
+            mtime = os.path.getmtime(out)
+            self.assertEqual(tool.call(self.src, **kws), out)
+            self.assertEqual(os.path.getmtime(out), mtime)
+            self.assertEqual(open(cache.stamp_file(out), 'r').read(), key)
+            # Rebuilt when an included file changes
+            self.write(self.header, '#define VALUE 1\n')
+            self.assertEqual(tool.call(self.src, **kws), out)
+            self.assertNotEqual(open(cache.stamp_file(out), 'r').read(), key)
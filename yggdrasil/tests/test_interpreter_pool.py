@@ -0,0 +1,93 @@
+import os
+import shutil
+import tempfile
+import unittest
+from yggdrasil import interpreter_pool, platform, config
+from yggdrasil.config import temp_config
+from yggdrasil.tests import YggTestBase
+
+
+@unittest.skipIf(platform._is_win, "Interpreter pool not supported on Windows.")
+class TestInterpreterPool(YggTestBase):
+    r"""Tests for the pool of pre-warmed interpreters."""
+
+    def setup(self, *args, **kwargs):
+        r"""Create a script in a temporary directory."""
+        super(TestInterpreterPool, self).setup(*args, **kwargs)
+        self.tempdir = tempfile.mkdtemp()
+        self.script = os.path.join(self.tempdir, 'script.py')
+        with open(self.script, 'w') as fd:
+            fd.write('import os\n'
+                     'import sys\n'
+                     'from yggdrasil.languages.Python import YggInterface\n'
+                     'print(os.getcwd())\n'
+                     'print(YggInterface.YGG_MODEL_NAME)\n'
+                     'print(os.environ.get("POOL_TEST_VAR", None))\n'
+                     'print(" ".join(sys.argv[1:]))\n'
+                     'sys.exit(int(sys.argv[1]))\n')
+
+    def teardown(self, *args, **kwargs):
+        r"""Remove the temporary directory."""
+        shutil.rmtree(self.tempdir)
+        super(TestInterpreterPool, self).teardown(*args, **kwargs)
+
+    def run_script(self, returncode, env):
+        r"""Run the test script from the pool and return its output."""
+        p = interpreter_pool.PoolProcess(
+            [self.script, str(returncode), 'a'], env=env,
+            working_dir=self.tempdir)
+        out = p.stdout.read().decode('utf-8')
+        p.stdout.close()
+        self.assertEqual(p.wait(10), returncode)
+        self.assertEqual(p.poll(), returncode)
+        return out.splitlines()
+
+    def test_get_context(self):
+        r"""Test selection of the context based on the environment."""
+        env = dict(os.environ)
+        with temp_config(interpreter_pool=False):
+            self.assertFalse(interpreter_pool.is_enabled())
+            self.assertIsNone(interpreter_pool.get_context(env))
+            self.assertRaises(RuntimeError, interpreter_pool.PoolProcess,
+                              [self.script, '0'], env=env)
+        with temp_config(interpreter_pool=True):
+            self.assertTrue(interpreter_pool.is_enabled())
+            self.assertIsNotNone(interpreter_pool.get_context(env))
+            self.assertTrue(interpreter_pool.is_running())
+            env['YGG_MODEL_NAME'] = 'model'
+            env['POOL_TEST_VAR'] = 'value'
+            self.assertTrue(interpreter_pool.is_compatible(env))
+            self.assertTrue(interpreter_pool.is_compatible(
+                env, working_dir=self.tempdir))
+            # Variables that change how modules are imported
+            env['PYTHONPOOLTEST'] = '1'
+            self.assertFalse(interpreter_pool.is_compatible(env))
+            self.assertIsNone(interpreter_pool.get_context(env))
+            env.pop('PYTHONPOOLTEST')
+            # Variables that differ from the pool's environment
+            env.pop('PATH')
+            self.assertFalse(interpreter_pool.is_compatible(env))
+            env['PATH'] = os.environ['PATH']
+            # Local config files
+            with open(os.path.join(self.tempdir, config.config_file), 'w') as fd:
+                fd.write('[general]\n')
+            self.assertFalse(interpreter_pool.is_compatible(
+                env, working_dir=self.tempdir))
+
+    def test_get_preload_modules(self):
+        r"""Test get_preload_modules."""
+        with temp_config(interpreter_pool_modules='numpy, yggdrasil'):
+            self.assertEqual(interpreter_pool.get_preload_modules(),
+                             ['numpy', 'yggdrasil'])
+
+    def test_PoolProcess(self):
+        r"""Test running scripts from the pool in isolated environments."""
+        with temp_config(interpreter_pool=True):
+            env = dict(os.environ, YGG_SUBPROCESS='True',
+                       YGG_MODEL_NAME='model1', POOL_TEST_VAR='value')
+            self.assertEqual(self.run_script(0, env),
+                             [self.tempdir, 'model1', 'value', '0 a'])
+            env = dict(os.environ, YGG_SUBPROCESS='True',
+                       YGG_MODEL_NAME='model2')
+            self.assertEqual(self.run_script(3, env),
+                             [self.tempdir, 'model2', 'None', '3 a'])
@@ -67,6 +67,11 @@ class TestContextThread(YggTestClass):
         x = self.instance.Event()
         x.disconnect()
 
+    def test_Condition(self):
+        r"""Test creation of Condition from context."""
+        x = self.instance.Condition()
+        x.disconnect()
+
     def test_Task(self):
         r"""Test creation of Task from context."""
         x = self.instance.Task()
@@ -119,6 +124,22 @@ class TestEvent(TstContextObject, YggTestClass):
         super(TestEvent, self).test_pickle()
 
 
+class TestCondition(TstContextObject, YggTestClass):
+
+    _cls = 'Condition'
+
+    def test_wait(self):
+        r"""Test waiting for a notification."""
+        with self.instance:
+            assert(not self.instance.wait(0.01))
+            self.instance.notify_all()
+        self.instance.disconnect()
+        with self.instance:
+            self.instance.notify_all()
+        self.assert_raises(multitasking.AliasDisconnectError,
+                           self.instance.wait, 0.01)
+
+
 class TestTask(TstContextObject, YggTestClass):
 
     _cls = 'Task'
@@ -203,3 +224,98 @@ class TestYggProcessFork(TestYggProcess):
     def __init__(self, *args, **kwargs):
         super(TestYggProcessFork, self).__init__(*args, **kwargs)
         self._inst_kwargs['context'] = multitasking.mp_ctx
+
+
+class CountingTaskLoop(multitasking.YggTaskLoop):
+    r"""Loop that is idle after a set number of iterations and can stop
+    another loop."""
+
+    def __init__(self, *args, nwork=3, other=None, **kwargs):
+        self.nwork = nwork
+        self.other = other
+        self.count = 0
+        self.nidle = 0
+        super(CountingTaskLoop, self).__init__(*args, **kwargs)
+
+    def run_loop(self):
+        if self.count >= self.nwork:
+            if self.other is not None:
+                self.other.terminate()
+                self.set_break_flag()
+            self.nidle += 1
+            self.sleep()
+            return
+        self.count += 1
+
+    def wait_for_idle(self, nidle=1, timeout=10.0):
+        r"""Wait for the loop to be idle."""
+        T = self.start_timeout(timeout)
+        while (self.nidle < nidle) and (not T.is_out):
+            self.sleep()
+        self.stop_timeout()
+
+
+class TestYggTaskScheduler(YggTestClass):
+    r"""Test running loops with YggTaskScheduler."""
+
+    _cls = 'YggTaskScheduler'
+    _mod = 'yggdrasil.multitasking'
+
+    def __init__(self, *args, **kwargs):
+        super(TestYggTaskScheduler, self).__init__(*args, **kwargs)
+        self._inst_kwargs = {'timeout': self.timeout,
+                             'sleeptime': self.sleeptime}
+
+    def remove_instance(self, inst):
+        r"""Remove an instance of the class."""
+        if inst.was_started:
+            inst.terminate()
+        super(TestYggTaskScheduler, self).remove_instance(inst)
+
+    def test_run(self):
+        r"""Test running several loops on one thread."""
+        tasks = [CountingTaskLoop(name='task%d' % i, nwork=i,
+                                  scheduler=self.instance)
+                 for i in range(3)]
+        for x in tasks:
+            x.start()
+            assert(x.is_alive())
+        assert_raises(RuntimeError, self.instance.add_task, tasks[0])
+        assert(self.instance.ntasks == 3)
+        self.instance.start()
+        for x in tasks:
+            x.wait_for_idle()
+            assert(x.count == x.nwork)
+        # Idle loops do not block each other
+        nidle = [x.nidle for x in tasks]
+        tasks[-1].wait_for_idle(nidle[-1] + 3)
+        for x, n in zip(tasks, nidle):
+            assert(x.nidle > n)
+        for x in tasks:
+            x.terminate()
+            assert(not x.is_alive())
+        assert(self.instance.ntasks == 0)
+
+    def test_wait_in_scheduler(self):
+        r"""Test stopping a loop from another loop on the same thread."""
+        x1 = CountingTaskLoop(name='task1', nwork=1000000,
+                              scheduler=self.instance)
+        x2 = CountingTaskLoop(name='task2', nwork=1, other=x1,
+                              scheduler=self.instance)
+        self.instance.start()
+        x1.start()
+        x2.start()
+        x2.wait(timeout=self.timeout)
+        assert(not x1.is_alive())
+        assert(not x2.is_alive())
+        assert(x1.count < x1.nwork)
+
+    def test_after_loop(self):
+        r"""Test that loops are stopped with the scheduler."""
+        x = CountingTaskLoop(name='task', nwork=1, scheduler=self.instance)
+        self.instance.start()
+        x.start()
+        x.wait_for_idle()
+        self.instance.terminate()
+        assert(not x.is_alive())
+        assert(x.was_break)
@@ -34,6 +34,20 @@ def test_run_process_connections():
                namespace=namespace)
 
 
+def test_run_loop_connections():
+    r"""Test run with connections on shared threads."""
+    namespace = "test_run_%s" % str(uuid.uuid4)
+    cr = runner.get_runner([ex_yamls['hello']['python']],
+                           connection_task_method='loop',
+                           connection_loops=2, namespace=namespace)
+    assert(len(cr.schedulers) == 2)
+    cr.run()
+    assert(not cr.error_flag)
+    for x in cr.schedulers:
+        assert(not x.is_alive())
+        assert(x.ntasks == 0)
+
+
 # def test_runner_error():
 #     r"""Start a runner for a model with an error."""
 #     cr = runner.get_runner([sc_yamls['error']])
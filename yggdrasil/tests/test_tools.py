@@ -1,7 +1,8 @@
 import os
 import tempfile
 from yggdrasil import tools, platform
-from yggdrasil.tests import YggTestClass, assert_equal, assert_warns
+from yggdrasil.tests import (
+    YggTestClass, assert_equal, assert_warns, assert_raises)
 
 
 class DummyTarget(object):
@@ -247,6 +248,16 @@ def test_eval_kwarg():
     assert_equal(tools.eval_kwarg('"one"'), 'one')
 
 
+def test_safe_eval():
+    r"""Test evaluation of statements with a limited namespace."""
+    assert_equal(tools.safe_eval('sqrt(x) + 1', x=4.0), 3.0)
+    code = tools.compile_safe_eval('x * pi')
+    assert_equal(tools.safe_eval(code, x=2), 2 * tools.safe_eval('pi'))
+    assert(tools.get_safe_eval_globals() is tools.get_safe_eval_globals())
+    assert('x' not in tools.get_safe_eval_globals())
+    assert_raises(TypeError, tools.safe_eval, 'open("file.txt")')
+
+
 class TestYggClass(YggTestClass):
     r"""Test basic behavior of YggTestClass."""
 
@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 from yggdrasil.tests import YggTestBase
 from yggdrasil import units, tools
 
@@ -90,6 +91,49 @@ class TestUnits(YggTestBase):
         assert(units.are_compatible('d', 'hr'))
         assert(units.are_compatible('hr', 'd'))
 
+    def test_get_conversion_factor(self):
+        r"""Test get_conversion_factor."""
+        self.assert_equal(units.get_conversion_factor('cm', 'm'), (0.01, 0.0))
+        factor, offset = units.get_conversion_factor('degC', 'K')
+        self.assert_equal(factor, 1.0)
+        self.assert_equal(offset, -273.15)
+        self.assert_raises(ValueError, units.get_conversion_factor, 'cm', 's')
+        self.assert_raises(ValueError, units.get_conversion_factor, '', 'cm')
+
+    def test_get_conversion_function(self):
+        r"""Test get_conversion_function."""
+        pairs = [('cm', 'm'), ('degC', 'K'), ('days', 's'), ('', ''),
+                 ('', 'm'), ('m', '')]
+        for old_units, new_units in pairs:
+            f = units.get_conversion_function(old_units, new_units)
+
+            def fconvert(x):
+                ux = units.add_units(x, old_units)
+                return units.get_data(units.convert_to(ux, new_units))
+            for x in [1, 1.5, np.float32(2.0), np.arange(3, dtype='int32'),
+                      np.ones(3, 'float32')]:
+                y0 = fconvert(x)
+                y1 = f(x)
+                self.assert_equal(type(y1), type(y0))
+                np.testing.assert_array_equal(y1, y0)
+                self.assert_equal(np.asarray(y1).dtype, np.asarray(y0).dtype)
+            x = pd.Series(np.arange(5, dtype='float64'))
+            pd.testing.assert_series_equal(f(x), x.apply(fconvert))
+        f = units.get_conversion_function('cm', 'm')
+        np.testing.assert_array_equal(
+            f(units.add_units(np.ones(3), 'km')), np.full(3, 1000.0))
+        self.assert_raises(ValueError, units.get_conversion_function('cm', 's'),
+                           1.0)
+
+    def test_convert_unit_string_cache(self):
+        r"""Test that unit strings are only parsed once."""
+        units.convert_unit_string('kg m-2')
+        nhits = units._convert_unit_string_default.cache_info().hits
+        self.assert_equal(units.convert_unit_string('kg m-2'), 'kg*(m**-2)')
+        self.assert_equal(units._convert_unit_string_default.cache_info().hits,
+                          nhits + 1)
+        self.assert_equal(units.convert_unit_string('h', replacements={}), 'h')
+
     def test_convert_R_unit_string(self):
         r"""Test convert_R_unit_string."""
         pairs = [('g', 'g'), ('g2', '(g**2)'),
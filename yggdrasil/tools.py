@@ -912,36 +912,56 @@ def sleep(interval):
     time.sleep(interval)
 
 
-def safe_eval(statement, **kwargs):
-    r"""Run eval with a limited set of builtins and Python libraries/functions.
+_safe_eval_globals = None
+
+
+def get_safe_eval_globals():
+    r"""Get the namespace of builtins and Python library functions that
+    are available to statements evaluated by safe_eval. The namespace is
+    only created the first time it is requested.
+
+    Returns:
+        dict: Global namespace for safe_eval.
+
+    """
+    global _safe_eval_globals
+    if _safe_eval_globals is None:
+        safe_dict = {"__builtins__": None}
+        _safe_lists = {'math': ['acos', 'asin', 'atan', 'atan2', 'ceil', 'cos',
+                                'cosh', 'degrees', 'e', 'exp', 'fabs', 'floor',
+                                'fmod', 'frexp', 'hypot', 'ldexp', 'log', 'log10',
+                                'modf', 'pi', 'pow', 'radians', 'sin', 'sinh',
+                                'sqrt', 'tan', 'tanh'],
+                       'builtins': ['abs', 'any', 'bool', 'bytes', 'float', 'int',
+                                    'len', 'list', 'map', 'max', 'min', 'repr',
+                                    'set', 'str', 'sum', 'tuple', 'type'],
+                       'numpy': ['array', 'int8', 'int16', 'int32', 'int64',
+                                 'uint8', 'uint16', 'uint32', 'uint64',
+                                 'float16', 'float32', 'float64'],
+                       'yggdrasil.units': ['get_data', 'add_units'],
+                       'unyt.array': ['unyt_quantity', 'unyt_array']}
+        for mod_name, func_list in _safe_lists.items():
+            mod = importlib.import_module(mod_name)
+            for func in func_list:
+                safe_dict[func] = getattr(mod, func)
+        _safe_eval_globals = safe_dict
+    return _safe_eval_globals
+
+
+def compile_safe_eval(statement):
+    r"""Compile a statement so that it can be passed to safe_eval repeatedly
+    without being parsed each time.
 
     Args:
-        statement (str): Statement that should be evaluated.
-        **kwargs: Additional keyword arguments are variables that are made available
-            to the statement during evaluation.
+        statement (str): Statement that should be compiled.
 
     Returns:
-        object: Result of the eval.
+        code: Compiled statement.
+
+    Raises:
+        SyntaxError: If the statement is not a valid Python expression.
 
     """
-    safe_dict = {}
-    _safe_lists = {'math': ['acos', 'asin', 'atan', 'atan2', 'ceil', 'cos',
-                            'cosh', 'degrees', 'e', 'exp', 'fabs', 'floor', 'fmod',
-                            'frexp', 'hypot', 'ldexp', 'log', 'log10', 'modf', 'pi',
-                            'pow', 'radians', 'sin', 'sinh', 'sqrt', 'tan', 'tanh'],
-                   'builtins': ['abs', 'any', 'bool', 'bytes', 'float', 'int', 'len',
-                                'list', 'map', 'max', 'min', 'repr', 'set', 'str',
-                                'sum', 'tuple', 'type'],
-                   'numpy': ['array', 'int8', 'int16', 'int32', 'int64',
-                             'uint8', 'uint16', 'uint32', 'uint64',
-                             'float16', 'float32', 'float64'],
-                   'yggdrasil.units': ['get_data', 'add_units'],
-                   'unyt.array': ['unyt_quantity', 'unyt_array']}
-    for mod_name, func_list in _safe_lists.items():
-        mod = importlib.import_module(mod_name)
-        for func in func_list:
-            safe_dict[func] = getattr(mod, func)
-    safe_dict.update(kwargs)
     # The following replaces <Class Name(a, b)> style reprs with calls to classes
     # identified in self._no_eval_class
     # regex = r'<([^<>]+)\(([^\(\)]+)\)>'
@@ -955,7 +975,23 @@ def safe_eval(statement, **kwargs):
     #                          % (match.group(0), statement))
     #     statement = statement.replace(match.group(0),
     #                                   '%s(%s)' % (cls_repl, match.group(2)), 1)
-    return eval(statement, {"__builtins__": None}, safe_dict)
+    return compile(statement, '<statement>', 'eval')
+
+
+def safe_eval(statement, **kwargs):
+    r"""Run eval with a limited set of builtins and Python libraries/functions.
+
+    Args:
+        statement (str, code): Statement that should be evaluated or a
+            statement previously compiled by compile_safe_eval.
+        **kwargs: Additional keyword arguments are variables that are made available
+            to the statement during evaluation.
+
+    Returns:
+        object: Result of the eval.
+
+    """
+    return eval(statement, get_safe_eval_globals(), kwargs)
 
 
 def eval_kwarg(x):
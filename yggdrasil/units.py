@@ -1,4 +1,5 @@
 import re
+import functools
 import numpy as np
 import pandas as pd
 import unyt
@@ -6,6 +7,21 @@ from yggdrasil import tools
 _unit_quantity = unyt.array.unyt_quantity
 _unit_array = unyt.array.unyt_array
 _ureg_unyt = None
+_unit_cache_size = 256
+_default_unit_replacements = {'h': 'hr',
+                              'hrs': 'hr',
+                              'days': 'day',
+                              '100%': 'percent'}
+_unit_regex = (r'(?P<paren>\()?(?P<name>[A-Za-z%s]+)'
+               r'(?:(?:(?:\^)|(?:\*\*))?(?P<exp_paren>\()?(?P<exp>-?[0-9]+)'
+               r'(?(exp_paren)\)))?'
+               r'(?(paren)\)|)(?P<op> |(?:\*)|(?:\/))?'
+               % ''.join([tools.bytes2str(b'\xc2\xb5'),
+                          tools.bytes2str(b'\xce\xbcs'),
+                          tools.bytes2str(b'\xc2\xb0'),
+                          r'(?:100\%)']))
+_unit_regex_compiled = re.compile(_unit_regex)
+_unit_regex_full_compiled = re.compile(r'(?:%s)+' % _unit_regex)
 
 
 def get_ureg():
@@ -111,7 +127,7 @@ def convert_R_unit_string(r_str):
 
 def convert_unit_string(orig_str, replacements=None):
     r"""Convert unit string to string that the Python package can
-    understand.
+    understand. Results for the default replacements are cached.
 
     Args:
         orig_str (str): Original units string to convert.
@@ -121,26 +137,44 @@ def convert_unit_string(orig_str, replacements=None):
     Returns:
         str: Converted string.
 
+    """
+    if replacements is None:
+        return _convert_unit_string_default(orig_str)
+    return _convert_unit_string(orig_str, replacements)
+
+
+@functools.lru_cache(maxsize=_unit_cache_size)
+def _convert_unit_string_default(orig_str):
+    r"""Convert unit string using the default replacements. Results are
+    cached so that each unit string is only parsed once.
+
+    Args:
+        orig_str (str): Original units string to convert.
+
+    Returns:
+        str: Converted string.
+
+    """
+    return _convert_unit_string(orig_str, _default_unit_replacements)
+
+
+def _convert_unit_string(orig_str, replacements):
+    r"""Convert unit string to string that the Python package can
+    understand.
+
+    Args:
+        orig_str (str): Original units string to convert.
+        replacements (dict): Mapping from unit to another.
+
+    Returns:
+        str: Converted string.
+
     """
     if not orig_str.strip():
         return ''
-    out = []
-    if replacements is None:
-        replacements = {'h': 'hr',
-                        'hrs': 'hr',
-                        'days': 'day',
-                        '100%': 'percent'}
-    regex_mu = [tools.bytes2str(b'\xc2\xb5'),
-                tools.bytes2str(b'\xce\xbcs'),
-                tools.bytes2str(b'\xc2\xb0'),
-                r'(?:100\%)']
-    regex = (r'(?P<paren>\()?(?P<name>[A-Za-z%s]+)'
-             r'(?:(?:(?:\^)|(?:\*\*))?(?P<exp_paren>\()?(?P<exp>-?[0-9]+)'
-             r'(?(exp_paren)\)))?'
-             r'(?(paren)\)|)(?P<op> |(?:\*)|(?:\/))?' % ''.join(regex_mu))
     out = ''
-    if re.fullmatch(r'(?:%s)+' % regex, orig_str.strip()):
-        for x in re.finditer(regex, orig_str.strip()):
+    if _unit_regex_full_compiled.fullmatch(orig_str.strip()):
+        for x in _unit_regex_compiled.finditer(orig_str.strip()):
             xdict = x.groupdict()
             if xdict['name'] in replacements:
                 xdict['name'] = replacements[xdict['name']]
@@ -154,12 +188,12 @@ def convert_unit_string(orig_str, replacements=None):
                 out += xdict['op']
     else:  # pragma: debug
         print(repr(orig_str), type(orig_str))
-        m = re.search(r'(?:%s)+' % regex, orig_str.strip())
+        m = _unit_regex_full_compiled.search(orig_str.strip())
         if m:
             print(repr(m.group(0)), m.groupdict())
         else:
             print('no match')
-        for m in re.finditer(regex, orig_str.strip()):
+        for m in _unit_regex_compiled.finditer(orig_str.strip()):
             print(m.group(0), m.groupdict())
         raise Exception("Could not standardize units: %s" % repr(orig_str))
     return out
@@ -363,9 +397,71 @@ def convert_to(arr, new_units):
     return out
 
 
+@functools.lru_cache(maxsize=_unit_cache_size)
+def get_conversion_factor(old_units, new_units):
+    r"""Get the factor and offset required to convert values from one unit
+    to another (new = old * factor - offset). Results are cached for each
+    pair of units.
+
+    Args:
+        old_units (str): Units to convert from.
+        new_units (str): Units to convert to.
+
+    Returns:
+        tuple(float, float): Conversion factor and offset.
+
+    Raises:
+        ValueError: If either unit is null.
+        ValueError: If the units are not compatible or cannot be related
+            by a factor and offset.
+
+    """
+    if is_null_unit(old_units) or is_null_unit(new_units):
+        raise ValueError("Cannot get conversion factor for null units.")
+    old = as_unit(convert_unit_string(old_units))
+    new = as_unit(new_units)
+    try:
+        factor, offset = old.get_conversion_factor(new)
+    except unyt.exceptions.UnitConversionError as e:
+        raise ValueError(str(e))
+    return factor, (offset or 0.0)
+
+
+def apply_conversion_factor(x, factor, offset=0.0):
+    r"""Apply a conversion factor and offset to a scalar, array, or pandas
+    object without units. The data type of the result matches that
+    produced by unyt when converting between units.
+
+    Args:
+        x (object): Scalar, array, or pandas Series/DataFrame to convert.
+        factor (float): Conversion factor.
+        offset (float, optional): Offset subtracted after the factor is
+            applied. Defaults to 0.0.
+
+    Returns:
+        object: Converted scalar/array/pandas object.
+
+    """
+    if isinstance(x, (pd.Series, pd.DataFrame)):
+        out = x * factor
+        if offset:
+            out = out - offset
+        return out
+    arr = np.asarray(x)
+    kind = 'c' if arr.dtype.kind == 'c' else 'f'
+    dtype = np.dtype(kind + str(max(2, arr.dtype.itemsize)))
+    out = np.asarray(arr * factor, dtype=dtype)
+    if offset:
+        np.subtract(out, offset, out)
+    if out.ndim == 0:
+        out = out.reshape((1, ))[0]
+    return out
+
+
 def get_conversion_function(old_units, new_units):
     r"""Get a function that will convert a scalar/array from one unit
-    to another.
+    to another. The conversion factor is determined once and applied to
+    entire arrays/pandas objects at once.
 
     Args:
         old_units (str): Units to convert from.
@@ -376,7 +472,23 @@ def get_conversion_function(old_units, new_units):
             and returns converted scalar/array.
 
     """
+    conv = None
+    if not (is_null_unit(old_units) or is_null_unit(new_units)):
+        try:
+            conv = get_conversion_factor(old_units, new_units)
+        except ValueError:
+            # Defer to unyt so errors are raised on conversion
+            pass
+
     def fconvert(x):
-        ux = add_units(x, old_units)
-        return get_data(convert_to(ux, new_units))
+        if is_null_unit(old_units) and is_null_unit(new_units):
+            return x
+        if isinstance(x, pd.Series) and ((conv is None)
+                                         or (x.dtype == object)):
+            # Elements may have units or require unyt
+            return x.apply(fconvert)
+        if (conv is None) or has_units(x):
+            ux = add_units(x, old_units)
+            return get_data(convert_to(ux, new_units))
+        return apply_conversion_factor(x, *conv)
     return fconvert